@@ -0,0 +1,27 @@
+from django.contrib.auth import backends, get_user_model
+
+from accounts.throttling import is_unknown_email, remember_unknown_email
+
+User = get_user_model()
+
+
+class ModelBackend(backends.ModelBackend):
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+
+        if is_unknown_email(username):
+            # Hash like for any unknown user, so a cached email can't be told apart by the response time.
+            User().set_password(password)
+            return None
+
+        try:
+            user = User._default_manager.get_by_natural_key(username)
+        except User.DoesNotExist:
+            remember_unknown_email(username)
+            User().set_password(password)
+        else:
+            if user.check_password(password) and self.user_can_authenticate(user):
+                return user
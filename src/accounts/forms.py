@@ -6,6 +6,7 @@ from django.contrib.auth import get_user_model, authenticate
 from django.core.exceptions import ValidationError
 
 from accounts.models import Profile
+from accounts.throttling import LoginThrottle
 
 User = get_user_model()
 
@@ -45,6 +46,7 @@ class UserRegisterForm(forms.Form):
 
 
 INVALID_CREDENTIAL_DATA_ERROR_MESSAGE = 'Invalid credential data. Please, enter a correct email and password.'
+TOO_MANY_ATTEMPTS_ERROR_MESSAGE = 'Too many failed attempts to sign in. Please, try again in a few minutes.'
 NOT_CONFIRMED_EMAIL_ERROR_MESSAGE = (
     'Your email is not confirmed. Please, check your email and follow instruction ' 'for confirming email.'
 )
@@ -64,11 +66,18 @@ class UserLoginForm(forms.Form):
         password = self.cleaned_data.get('password')
 
         if email and password:
+            throttle = LoginThrottle(self.request, email)
+            if not throttle.is_allowed():
+                raise ValidationError(TOO_MANY_ATTEMPTS_ERROR_MESSAGE, code='too_many_attempts')
+
             self.user_cache = authenticate(self.request, email=email, password=password)
 
             if self.user_cache is None:
+                throttle.register_failure()
                 raise ValidationError(INVALID_CREDENTIAL_DATA_ERROR_MESSAGE, code='invalid_credential_data')
 
+            throttle.reset()
+
             if not self.user_cache.email_is_confirmed:
                 raise ValidationError(NOT_CONFIRMED_EMAIL_ERROR_MESSAGE, code='not_confirmed_email')
 
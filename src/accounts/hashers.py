@@ -0,0 +1,77 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    ScryptPasswordHasher,
+    make_password,
+)
+
+PARALLEL_MIN_PASSWORDS = 32
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    @property
+    def iterations(self):
+        return settings.PBKDF2_ITERATIONS
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    @property
+    def time_cost(self):
+        return settings.ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self):
+        return settings.ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self):
+        return settings.ARGON2_PARALLELISM
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    @property
+    def work_factor(self):
+        return settings.SCRYPT_WORK_FACTOR
+
+    @property
+    def block_size(self):
+        return settings.SCRYPT_BLOCK_SIZE
+
+    @property
+    def parallelism(self):
+        return settings.SCRYPT_PARALLELISM
+
+    @property
+    def maxmem(self):
+        # OpenSSL refuses scrypt above 32 MiB by default, leave room for hashes made with a higher work factor.
+        return max(64 * 1024 * 1024, 256 * self.block_size * self.work_factor)
+
+
+def hash_passwords(passwords, processes=None, chunksize=64, hasher='default'):
+    passwords = list(passwords)
+    processes = processes or os.cpu_count() or 1
+    hash_password = partial(make_password, hasher=hasher)
+    hashes = [make_password(None) if password is None else None for password in passwords]
+    pending = [(index, password) for index, password in enumerate(passwords) if password is not None]
+
+    if processes == 1 or len(pending) < PARALLEL_MIN_PASSWORDS:
+        results = map(hash_password, (password for _, password in pending))
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(processes, initializer=django.setup)
+        results = executor.map(hash_password, (password for _, password in pending), chunksize=chunksize)
+
+    try:
+        for (index, _), hashed in zip(pending, results):
+            hashes[index] = hashed
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return hashes
@@ -0,0 +1,71 @@
+from functools import lru_cache
+
+from django.contrib.auth.tokens import default_token_generator
+from django.core.mail import EmailMessage, get_connection
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template import loader
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+
+SUBJECT_TEMPLATE_NAME = 'accounts/subject_of_register_data_confirmation.html'
+BODY_TEMPLATE_NAME = 'accounts/body_of_register_data_confirmation.html'
+
+
+class ConfirmationMailRenderer:
+    def __init__(
+        self,
+        site_name,
+        domain,
+        protocol,
+        subject_template_name=SUBJECT_TEMPLATE_NAME,
+        body_template_name=BODY_TEMPLATE_NAME,
+        token_generator=default_token_generator,
+    ):
+        self.context = {'site_name': site_name, 'domain': domain, 'protocol': protocol}
+        self.body_template = loader.get_template(body_template_name)
+        self.token_generator = token_generator
+
+        subject = loader.get_template(subject_template_name).render({'site_name': site_name})
+        self.subject = ''.join(subject.splitlines())
+
+    def render_body(self, user):
+        context = {
+            **self.context,
+            'uid': urlsafe_base64_encode(force_bytes(user.pk)),
+            'token': self.token_generator.make_token(user),
+        }
+        return self.body_template.render(context)
+
+    def render(self, user, from_email=None, connection=None):
+        return EmailMessage(self.subject, self.render_body(user), from_email, [user.email], connection=connection)
+
+    def render_many(self, users, from_email=None, connection=None):
+        return [self.render(user, from_email, connection) for user in users]
+
+
+@lru_cache(maxsize=32)
+def get_confirmation_mail_renderer(site_name, domain, protocol, *args, **kwargs):
+    return ConfirmationMailRenderer(site_name, domain, protocol, *args, **kwargs)
+
+
+@receiver(setting_changed)
+def clear_confirmation_mail_renderers(setting, **kwargs):
+    if setting == 'TEMPLATES':
+        get_confirmation_mail_renderer.cache_clear()
+
+
+def send_confirmation_mails(users, renderer, batch_size=100):
+    sent = 0
+    batch = []
+
+    with get_connection() as connection:
+        for user in users:
+            batch.append(user)
+            if len(batch) == batch_size:
+                sent += connection.send_messages(renderer.render_many(batch, connection=connection))
+                batch = []
+        if batch:
+            sent += connection.send_messages(renderer.render_many(batch, connection=connection))
+
+    return sent
@@ -0,0 +1,23 @@
+from django.contrib.auth import get_user_model
+from django.core.management import BaseCommand
+
+from accounts.mails import get_confirmation_mail_renderer, send_confirmation_mails
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Resends confirmation mails to users who have not confirmed their email yet.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--domain', required=True)
+        parser.add_argument('--site-name', help='Defaults to the domain.')
+        parser.add_argument('--protocol', default='https', choices=['http', 'https'])
+        parser.add_argument('--batch-size', type=int, default=100)
+
+    def handle(self, *args, domain, site_name, protocol, batch_size, **options):
+        renderer = get_confirmation_mail_renderer(site_name or domain, domain, protocol)
+        users = User.objects.filter(is_active=True, email_is_confirmed=False).order_by('pk')
+
+        sent = send_confirmation_mails(users.iterator(chunk_size=batch_size), renderer, batch_size)
+        self.stdout.write(f'Sent {sent} confirmation mails.')
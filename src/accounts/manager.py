@@ -1,4 +1,8 @@
 from django.contrib.auth.base_user import BaseUserManager
+from django.db import transaction
+
+from accounts.hashers import hash_passwords
+from accounts.throttling import forget_unknown_emails
 
 EMAIL_ERROR_MESSAGE = 'Email must be'
 
@@ -20,3 +24,30 @@ class UserManager(BaseUserManager):
         user.set_password(password)
         user.save(using=self.db)
         return user
+
+    def bulk_create_users(self, rows, batch_size=1000, processes=None):
+        users, passwords, profiles = [], [], []
+        for row in rows:
+            row = dict(row)
+            email = row.pop('email', None)
+            if not email:
+                raise ValueError(EMAIL_ERROR_MESSAGE)
+            password = row.pop('password', None)
+            profiles.append(row.pop('profile', {}))
+            user = self.model(email=self.normalize_email(email), password=row.pop('password_hash', ''), **row)
+            if not user.password:
+                passwords.append((user, password))
+            users.append(user)
+
+        hashes = hash_passwords((password for _, password in passwords), processes)
+        for (user, _), hashed in zip(passwords, hashes):
+            user.password = hashed
+
+        Profile = self.model._meta.get_field('profile').related_model
+        with transaction.atomic(using=self.db):
+            users = self.bulk_create(users, batch_size=batch_size)
+            Profile.objects.using(self.db).bulk_create(
+                (Profile(user=user, **profile) for user, profile in zip(users, profiles)), batch_size=batch_size
+            )
+        forget_unknown_emails([user.email for user in users])
+        return users
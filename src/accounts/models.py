@@ -20,7 +20,7 @@ class Profile(models.Model):
 
 class User(AbstractBaseUser, PermissionsMixin):
     email = models.EmailField(max_length=255, unique=True)
-    password = models.CharField(max_length=20)
+    password = models.CharField(max_length=128)
     email_is_confirmed = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
@@ -3,11 +3,18 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 from accounts.models import Profile
+from accounts.throttling import forget_unknown_emails
 
 User = get_user_model()
 
 
 @receiver(post_save, sender=User)
-def create_profile(sender, instance, *args, **kwargs):
-    if not hasattr(instance, 'profile'):
+def create_profile(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
         Profile.objects.create(user=instance)
+
+
+@receiver(post_save, sender=User)
+def forget_unknown_email(sender, instance, created, **kwargs):
+    if created:
+        forget_unknown_emails([instance.email])
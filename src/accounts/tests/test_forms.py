@@ -1,5 +1,9 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
 from django.forms import DateInput
 from django.http import HttpRequest
+from django.test import override_settings
 
 from accounts import forms
 from accounts.tests import create_test_user
@@ -66,12 +70,14 @@ class UserRegisterFormTest(FormTestCase):
 
 class UserLoginFormTest(FormTestCase):
     def setUp(self) -> None:
+        cache.clear()
         self.Form = forms.UserLoginForm
         self.data = {
             'email': 'rich.sanchez@gmail.com',
             'password': 'qwe123!@#',
         }
         self.request = HttpRequest()
+        self.request.META['REMOTE_ADDR'] = '127.0.0.1'
 
     def test_form_has_this_fields(self):
         expected_fields = ['email', 'password']
@@ -108,6 +114,59 @@ class UserLoginFormTest(FormTestCase):
         self.assertIsNotNone(form_user)
         self.assertEqual(form_user.id, user.id)
 
+    @override_settings(LOGIN_THROTTLE_EMAIL_LIMIT=2)
+    def test_form_is_invalid_after_too_many_failed_attempts(self):
+        create_test_user(**self.data)
+        for _ in range(2):
+            self.Form(self.request, data={**self.data, 'password': 'wrong'}).is_valid()
+
+        form = self.Form(self.request, data=self.data)
+
+        with patch('accounts.forms.authenticate') as authenticate:
+            self.assertFalse(form.is_valid())
+
+        authenticate.assert_not_called()
+        self.assertFormError(form, None, forms.TOO_MANY_ATTEMPTS_ERROR_MESSAGE)
+
+    @override_settings(LOGIN_THROTTLE_IP_LIMIT=2)
+    def test_form_throttles_client_ip_across_emails(self):
+        for number in range(2):
+            self.Form(self.request, data={**self.data, 'email': f'user{number}@test.com'}).is_valid()
+
+        form = self.Form(self.request, data=self.data)
+
+        self.assertFalse(form.is_valid())
+        self.assertFormError(form, None, forms.TOO_MANY_ATTEMPTS_ERROR_MESSAGE)
+
+    @override_settings(LOGIN_THROTTLE_EMAIL_LIMIT=2)
+    def test_form_resets_email_throttle_after_successful_login(self):
+        create_test_user(**self.data, email_is_confirmed=True)
+        self.Form(self.request, data={**self.data, 'password': 'wrong'}).is_valid()
+        self.Form(self.request, data=self.data).is_valid()
+        self.Form(self.request, data={**self.data, 'password': 'wrong'}).is_valid()
+
+        form = self.Form(self.request, data=self.data)
+
+        self.assertTrue(form.is_valid())
+
+    def test_form_doesnt_query_unknown_email_twice(self):
+        self.Form(self.request, data=self.data).is_valid()
+        form = self.Form(self.request, data=self.data)
+
+        with self.assertNumQueries(0):
+            self.assertFalse(form.is_valid())
+
+        self.assertFormError(form, None, forms.INVALID_CREDENTIAL_DATA_ERROR_MESSAGE)
+
+    def test_form_forgets_unknown_email_after_user_is_created(self):
+        self.Form(self.request, data=self.data).is_valid()
+        user = create_test_user(**self.data, email_is_confirmed=True)
+
+        form = self.Form(self.request, data=self.data)
+
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.get_user(), user)
+
 
 class ProfileUpdateFormMixinTest(FormTestCase):
     def setUp(self) -> None:
@@ -0,0 +1,124 @@
+from importlib.util import find_spec
+from unittest import skipUnless
+
+from django.contrib.auth.hashers import check_password, get_hasher, identify_hasher, is_password_usable, make_password
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from accounts.hashers import (
+    TunedArgon2PasswordHasher,
+    TunedPBKDF2PasswordHasher,
+    TunedScryptPasswordHasher,
+    hash_passwords,
+)
+from accounts.tests import create_test_user
+
+PBKDF2 = 'accounts.hashers.TunedPBKDF2PasswordHasher'
+ARGON2 = 'accounts.hashers.TunedArgon2PasswordHasher'
+SCRYPT = 'accounts.hashers.TunedScryptPasswordHasher'
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class HashPasswordsTest(SimpleTestCase):
+    def test_hash_passwords_keeps_order(self):
+        passwords = [f'password-{index}' for index in range(5)]
+
+        hashes = hash_passwords(passwords, processes=1)
+
+        for password, hashed in zip(passwords, hashes):
+            self.assertTrue(check_password(password, hashed))
+
+    def test_hash_passwords_returns_unusable_password_for_none(self):
+        hashes = hash_passwords(['qwe123!@#', None], processes=1)
+
+        self.assertTrue(is_password_usable(hashes[0]))
+        self.assertFalse(is_password_usable(hashes[1]))
+
+    def test_hash_passwords_uses_process_pool(self):
+        passwords = [f'password-{index}' for index in range(40)] + [None]
+
+        hashes = hash_passwords(passwords, processes=2, chunksize=8)
+
+        self.assertEqual(len(hashes), 41)
+        self.assertTrue(all(check_password(password, hashed) for password, hashed in zip(passwords, hashes[:40])))
+        self.assertFalse(is_password_usable(hashes[40]))
+
+    def test_hash_passwords_uses_given_hasher(self):
+        with override_settings(PASSWORD_HASHERS=[PBKDF2, SCRYPT], SCRYPT_WORK_FACTOR=2**10):
+            hashes = hash_passwords(['qwe123!@#'], processes=1, hasher='scrypt')
+
+        self.assertTrue(hashes[0].startswith('scrypt$'))
+
+
+@override_settings(PBKDF2_ITERATIONS=1000, SCRYPT_WORK_FACTOR=2**10, ARGON2_MEMORY_COST=1024)
+class TunedPasswordHasherTest(SimpleTestCase):
+    def test_pbkdf2_hasher_uses_iterations_from_settings(self):
+        hasher = TunedPBKDF2PasswordHasher()
+
+        self.assertEqual(hasher.decode(hasher.encode('qwe123!@#', hasher.salt()))['iterations'], 1000)
+
+    def test_scrypt_hasher_uses_parameters_from_settings(self):
+        hasher = TunedScryptPasswordHasher()
+
+        encoded = hasher.encode('qwe123!@#', hasher.salt())
+
+        self.assertEqual(hasher.decode(encoded)['work_factor'], 2**10)
+        self.assertTrue(hasher.verify('qwe123!@#', encoded))
+        self.assertFalse(hasher.must_update(encoded))
+
+    def test_scrypt_hasher_must_update_hash_with_other_work_factor(self):
+        hasher = TunedScryptPasswordHasher()
+        encoded = hasher.encode('qwe123!@#', hasher.salt())
+
+        with override_settings(SCRYPT_WORK_FACTOR=2**11):
+            self.assertTrue(hasher.must_update(encoded))
+
+    @skipUnless(find_spec('argon2'), 'Requires argon2-cffi')
+    def test_argon2_hasher_uses_parameters_from_settings(self):
+        hasher = TunedArgon2PasswordHasher()
+
+        encoded = hasher.encode('qwe123!@#', hasher.salt())
+
+        self.assertEqual(hasher.decode(encoded)['memory_cost'], 1024)
+        self.assertTrue(hasher.verify('qwe123!@#', encoded))
+
+
+@override_settings(PBKDF2_ITERATIONS=1000, SCRYPT_WORK_FACTOR=2**10)
+class RehashOnLoginTest(TestCase):
+    def setUp(self) -> None:
+        self.data = {'email': 'rick.sanchez@test.com', 'password': 'qwe123!@#'}
+        with override_settings(PASSWORD_HASHERS=[PBKDF2, SCRYPT]):
+            self.user = create_test_user(**self.data, email_is_confirmed=True)
+
+    @override_settings(PASSWORD_HASHERS=[SCRYPT, PBKDF2])
+    def test_login_rehashes_password_with_preferred_hasher(self):
+        self.client.post(reverse('accounts:user-login'), self.data)
+
+        self.user.refresh_from_db()
+        self.assertEqual(identify_hasher(self.user.password).algorithm, 'scrypt')
+        self.assertTrue(self.user.check_password(self.data['password']))
+
+    @override_settings(PASSWORD_HASHERS=[PBKDF2, SCRYPT], PBKDF2_ITERATIONS=2000)
+    def test_login_rehashes_password_with_tuned_parameters(self):
+        self.client.post(reverse('accounts:user-login'), self.data)
+
+        self.user.refresh_from_db()
+        self.assertEqual(get_hasher().decode(self.user.password)['iterations'], 2000)
+
+    @override_settings(PASSWORD_HASHERS=[SCRYPT, PBKDF2])
+    def test_failed_login_doesnt_rehash_password(self):
+        password = self.user.password
+
+        self.client.post(reverse('accounts:user-login'), {**self.data, 'password': 'wrong'})
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.password, password)
+
+
+class PasswordHasherProfileTest(SimpleTestCase):
+    def test_every_profile_hasher_can_check_passwords_of_others(self):
+        with override_settings(PASSWORD_HASHERS=[PBKDF2, SCRYPT], PBKDF2_ITERATIONS=1000):
+            encoded = make_password('qwe123!@#')
+
+        with override_settings(PASSWORD_HASHERS=[SCRYPT, PBKDF2, ARGON2]):
+            self.assertTrue(check_password('qwe123!@#', encoded))
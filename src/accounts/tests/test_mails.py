@@ -0,0 +1,63 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.tokens import default_token_generator
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+
+from accounts.mails import ConfirmationMailRenderer, get_confirmation_mail_renderer, send_confirmation_mails
+from accounts.tests import create_test_user
+
+
+class ConfirmationMailRendererTest(TestCase):
+    def setUp(self) -> None:
+        self.user = create_test_user()
+        self.renderer = ConfirmationMailRenderer('Hotel', 'hotel.test', 'https')
+
+    def test_renderer_renders_subject_once_without_new_lines(self):
+        self.assertEqual(self.renderer.subject, '<p>Confirmation of Register Data from Hotel</p>')
+
+    def test_renderer_renders_body_with_confirmation_link(self):
+        uid = urlsafe_base64_encode(force_bytes(self.user.pk))
+        token = default_token_generator.make_token(self.user)
+        url = reverse('accounts:user-confirm-email', kwargs={'uidb64': uid, 'token': token})
+
+        self.assertIn(f'https://hotel.test{url}', self.renderer.render_body(self.user))
+
+    def test_renderer_doesnt_load_templates_per_mail(self):
+        with patch('accounts.mails.loader.get_template') as get_template:
+            self.renderer.render_many([self.user, self.user])
+
+        get_template.assert_not_called()
+
+    def test_renderer_is_memoized_per_site(self):
+        renderer = get_confirmation_mail_renderer('Hotel', 'hotel.test', 'https')
+
+        self.assertIs(get_confirmation_mail_renderer('Hotel', 'hotel.test', 'https'), renderer)
+        self.assertIsNot(get_confirmation_mail_renderer('Hotel', 'hotel.test', 'http'), renderer)
+
+
+class SendConfirmationMailsTest(TestCase):
+    def setUp(self) -> None:
+        self.users = [create_test_user(email=f'user{i}@test.com') for i in range(3)]
+        self.renderer = ConfirmationMailRenderer('Hotel', 'hotel.test', 'https')
+
+    def test_send_confirmation_mails_sends_mail_to_every_user(self):
+        sent = send_confirmation_mails(self.users, self.renderer, batch_size=2)
+
+        self.assertEqual(sent, 3)
+        self.assertEqual([message.to for message in mail.outbox], [[user.email] for user in self.users])
+
+    def test_command_resends_mails_to_unconfirmed_users_only(self):
+        self.users[0].email_is_confirmed = True
+        self.users[0].save()
+        stdout = StringIO()
+
+        call_command('resend_confirmation_mails', '--domain', 'hotel.test', stdout=stdout)
+
+        self.assertIn('Sent 2 confirmation mails.', stdout.getvalue())
+        self.assertEqual([message.to for message in mail.outbox], [[user.email] for user in self.users[1:]])
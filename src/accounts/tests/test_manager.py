@@ -1,7 +1,8 @@
+from django.contrib.auth.hashers import make_password
 from django.test import TestCase
 
 from accounts.manager import EMAIL_ERROR_MESSAGE, UserManager
-from accounts.models import User
+from accounts.models import Profile, User
 
 
 class UserManagerTest(TestCase):
@@ -46,3 +47,41 @@ class UserManagerTest(TestCase):
         self.data['email'] = ''
         with self.assertRaisesRegex(ValueError, EMAIL_ERROR_MESSAGE):
             self.manager.create_superuser(**self.data)
+
+
+class BulkCreateUsersTest(TestCase):
+    def setUp(self) -> None:
+        self.rows = [
+            {'email': 'rick.sanchez@TEST.com', 'password': 'qwe123!@#', 'profile': {'first_name': 'Rick'}},
+            {'email': 'morty.smith@test.com', 'email_is_confirmed': True},
+            {'email': 'summer.smith@test.com', 'password_hash': make_password('asd123!@#')},
+        ]
+
+    def test_bulk_create_users_creates_users_and_profiles_in_two_inserts(self):
+        with self.assertNumQueries(4):  # savepoint, users, profiles, release
+            users = User.objects.bulk_create_users(self.rows)
+
+        self.assertEqual(User.objects.count(), 3)
+        self.assertEqual(Profile.objects.count(), 3)
+        self.assertEqual(users[0].email, 'rick.sanchez@test.com')
+        self.assertEqual(User.objects.get(email='rick.sanchez@test.com').profile.first_name, 'Rick')
+        self.assertTrue(User.objects.get(email='morty.smith@test.com').email_is_confirmed)
+
+    def test_bulk_create_users_hashes_passwords(self):
+        User.objects.bulk_create_users(self.rows)
+
+        self.assertTrue(User.objects.get(email='rick.sanchez@test.com').check_password('qwe123!@#'))
+        self.assertFalse(User.objects.get(email='morty.smith@test.com').has_usable_password())
+        self.assertTrue(User.objects.get(email='summer.smith@test.com').check_password('asd123!@#'))
+
+    def test_bulk_create_users_raises_EmptyEmailError(self):
+        with self.assertRaisesRegex(ValueError, EMAIL_ERROR_MESSAGE):
+            User.objects.bulk_create_users([{'email': ''}])
+
+    def test_bulk_create_users_doesnt_leave_users_without_profiles(self):
+        rows = [{'email': 'rick.sanchez@test.com', 'profile': {'unknown': 1}}]
+
+        with self.assertRaises(TypeError):
+            User.objects.bulk_create_users(rows)
+
+        self.assertFalse(User.objects.exists())
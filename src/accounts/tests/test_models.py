@@ -40,9 +40,9 @@ class UserModelTest(ModelTestCase):
         field = self.get_field(User, 'email')
         self.assertTrue(field.unique)
 
-    def test_password_field_max_length_is_20(self):
+    def test_password_field_max_length_is_128(self):
         field = self.get_field(User, 'password')
-        self.assertEqual(field.max_length, 20)
+        self.assertEqual(field.max_length, 128)
 
     def test_is_active_field_is_true_by_default(self):
         field = self.get_field(User, 'is_active')
@@ -22,3 +22,10 @@ class CreateProfileSignalTest(TestCase):
         user.save()
 
         self.assertEqual(Profile.objects.count(), 1)
+
+    def test_signal_doesnt_query_profile_when_user_is_updated(self):
+        user = create_test_user()
+        user = type(user).objects.get(pk=user.pk)
+
+        with self.assertNumQueries(1):
+            user.save()
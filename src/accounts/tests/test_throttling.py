@@ -0,0 +1,141 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.http import HttpRequest
+from django.test import TestCase, override_settings
+
+from accounts.backends import ModelBackend
+from accounts.tests import create_test_user
+from accounts.throttling import LoginThrottle, SlidingWindow, is_unknown_email, remember_unknown_email
+
+User = get_user_model()
+
+
+class SlidingWindowTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.window = SlidingWindow('test', limit=10, window=60)
+
+    def get_count(self, now):
+        return self.window.count(cache.get_many(self.window.get_keys(now)), now)
+
+    def test_hit_counts_in_current_window(self):
+        for _ in range(3):
+            self.window.hit(120)
+
+        self.assertEqual(self.get_count(150), 3)
+
+    def test_previous_window_is_weighted_by_overlap(self):
+        for _ in range(4):
+            self.window.hit(110)
+
+        self.assertEqual(self.get_count(135), 3)
+
+    def test_hits_older_than_two_windows_are_not_counted(self):
+        self.window.hit(10)
+
+        self.assertEqual(self.get_count(130), 0)
+
+
+@override_settings(LOGIN_THROTTLE_EMAIL_LIMIT=2, LOGIN_THROTTLE_IP_LIMIT=3)
+class LoginThrottleTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.request = HttpRequest()
+        self.request.META['REMOTE_ADDR'] = '127.0.0.1'
+
+    def test_throttle_allows_until_email_limit(self):
+        throttle = LoginThrottle(self.request, 'rick.sanchez@test.com')
+
+        throttle.register_failure()
+        self.assertTrue(throttle.is_allowed())
+        throttle.register_failure()
+        self.assertFalse(throttle.is_allowed())
+
+    def test_throttle_limits_ip_across_emails(self):
+        for number in range(3):
+            LoginThrottle(self.request, f'user{number}@test.com').register_failure()
+
+        self.assertFalse(LoginThrottle(self.request, 'rick.sanchez@test.com').is_allowed())
+
+    def test_throttle_keeps_other_ips_allowed(self):
+        for number in range(3):
+            LoginThrottle(self.request, f'user{number}@test.com').register_failure()
+        self.request.META['REMOTE_ADDR'] = '10.0.0.1'
+
+        self.assertTrue(LoginThrottle(self.request, 'rick.sanchez@test.com').is_allowed())
+
+    def test_reset_clears_only_email_attempts(self):
+        throttle = LoginThrottle(self.request, 'rick.sanchez@test.com')
+        for _ in range(2):
+            throttle.register_failure()
+
+        throttle.reset()
+
+        self.assertTrue(throttle.is_allowed())
+        LoginThrottle(self.request, 'user@test.com').register_failure()
+        self.assertFalse(LoginThrottle(self.request, 'other@test.com').is_allowed())
+
+    def test_throttle_window_slides(self):
+        throttle = LoginThrottle(self.request, 'rick.sanchez@test.com')
+        with patch('accounts.throttling.time', return_value=1000):
+            throttle.register_failure()
+            throttle.register_failure()
+
+        with patch('accounts.throttling.time', return_value=1000 + 300 * 2):
+            self.assertTrue(throttle.is_allowed())
+
+
+class UnknownEmailCacheTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.backend = ModelBackend()
+
+    def test_backend_remembers_unknown_email(self):
+        self.assertIsNone(self.backend.authenticate(None, email='rick.sanchez@test.com', password='qwe123!@#'))
+
+        self.assertTrue(is_unknown_email('rick.sanchez@test.com'))
+
+    def test_backend_hashes_password_of_cached_unknown_email_without_queries(self):
+        remember_unknown_email('rick.sanchez@test.com')
+
+        with self.assertNumQueries(0), patch.object(User, 'set_password') as set_password:
+            user = self.backend.authenticate(None, email='rick.sanchez@test.com', password='qwe123!@#')
+
+        self.assertIsNone(user)
+        set_password.assert_called_once_with('qwe123!@#')
+
+    def test_backend_authenticates_user_with_one_query(self):
+        user = create_test_user('rick.sanchez@test.com', 'qwe123!@#')
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.backend.authenticate(None, email=user.email, password='qwe123!@#'), user)
+
+    def test_remember_unknown_email(self):
+        remember_unknown_email('rick.sanchez@test.com')
+
+        self.assertTrue(is_unknown_email('rick.sanchez@test.com'))
+        self.assertFalse(is_unknown_email('Rick.Sanchez@test.com'))
+
+    def test_created_user_is_forgotten(self):
+        remember_unknown_email('rick.sanchez@test.com')
+
+        create_test_user('rick.sanchez@test.com')
+
+        self.assertFalse(is_unknown_email('rick.sanchez@test.com'))
+
+    def test_saving_existing_user_doesnt_touch_unknown_email_cache(self):
+        user = create_test_user('rick.sanchez@test.com')
+
+        with patch('accounts.signals.forget_unknown_emails') as mock:
+            user.save()
+
+        mock.assert_not_called()
+
+    def test_bulk_created_users_are_forgotten(self):
+        remember_unknown_email('rick.sanchez@test.com')
+
+        User.objects.bulk_create_users([{'email': 'rick.sanchez@test.com'}])
+
+        self.assertFalse(is_unknown_email('rick.sanchez@test.com'))
@@ -3,13 +3,15 @@ from unittest.mock import patch
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
 from django.core import mail
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
 
 from accounts.tests import create_test_user
 from accounts.views import UserRegisterView
+from mails.models import OutgoingMail
 
 User = get_user_model()
 
@@ -50,6 +52,13 @@ class UserRegisterViewTest(TestCase):
 
         self.assertIsNotNone(mail.outbox)
 
+    @override_settings(EMAIL_BACKEND='mails.backends.OutboxBackend')
+    def test_view_enqueues_mail_instead_of_sending_it_POST(self):
+        self.client.post(self.url, self.data)
+
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(OutgoingMail.objects.get().to, [self.data['email']])
+
     def test_view_uses_necessary_templates_make_mail(self):
         self.assertEqual(UserRegisterView.subject_template_name, 'accounts/subject_of_register_data_confirmation.html')
         self.assertEqual(UserRegisterView.body_template_name, 'accounts/body_of_register_data_confirmation.html')
@@ -145,6 +154,7 @@ class UserConfirmEmailFailureViewTest(TestCase):
 
 class UserLoginViewTest(TestCase):
     def setUp(self) -> None:
+        cache.clear()
         self.url = reverse('accounts:user-login')
         self.data = {
             'email': 'rick.sanchez@test.com',
@@ -0,0 +1,78 @@
+from hashlib import sha256
+from time import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+THROTTLE_KEY = 'accounts:login:{}:{}:{}'
+UNKNOWN_EMAIL_KEY = 'accounts:unknown-email:{}'
+
+
+def _digest(value):
+    return sha256(value.encode()).hexdigest()
+
+
+def get_client_ip(request):
+    return getattr(request, 'META', {}).get('REMOTE_ADDR') or ''
+
+
+class SlidingWindow:
+    def __init__(self, name, limit, window):
+        self.name = name
+        self.limit = limit
+        self.window = window
+
+    def get_keys(self, now):
+        bucket = int(now // self.window)
+        return THROTTLE_KEY.format(self.name, bucket, self.window), THROTTLE_KEY.format(
+            self.name, bucket - 1, self.window
+        )
+
+    def count(self, values, now):
+        current, previous = self.get_keys(now)
+        # Weight the previous bucket by the part of the window that still overlaps it.
+        overlap = 1 - (now % self.window) / self.window
+        return values.get(current, 0) + values.get(previous, 0) * overlap
+
+    def hit(self, now):
+        current, _ = self.get_keys(now)
+        if not cache.add(current, 1, self.window * 2):
+            try:
+                cache.incr(current)
+            except ValueError:
+                cache.set(current, 1, self.window * 2)
+
+
+class LoginThrottle:
+    def __init__(self, request, email):
+        window = settings.LOGIN_THROTTLE_WINDOW
+        self.windows = [
+            SlidingWindow(f'email:{_digest(email)}', settings.LOGIN_THROTTLE_EMAIL_LIMIT, window),
+            SlidingWindow(f'ip:{_digest(get_client_ip(request))}', settings.LOGIN_THROTTLE_IP_LIMIT, window),
+        ]
+
+    def is_allowed(self):
+        now = time()
+        values = cache.get_many([key for window in self.windows for key in window.get_keys(now)])
+        return all(window.count(values, now) < window.limit for window in self.windows)
+
+    def register_failure(self):
+        now = time()
+        for window in self.windows:
+            window.hit(now)
+
+    def reset(self):
+        now = time()
+        cache.delete_many(self.windows[0].get_keys(now))
+
+
+def is_unknown_email(email):
+    return cache.get(UNKNOWN_EMAIL_KEY.format(_digest(email))) is not None
+
+
+def remember_unknown_email(email):
+    cache.set(UNKNOWN_EMAIL_KEY.format(_digest(email)), True, settings.LOGIN_UNKNOWN_EMAIL_TIMEOUT)
+
+
+def forget_unknown_emails(emails):
+    cache.delete_many([UNKNOWN_EMAIL_KEY.format(_digest(email)) for email in emails])
@@ -0,0 +1,45 @@
+import argparse
+import random
+from datetime import date, timedelta
+from time import perf_counter
+
+from benchmarks import setup
+
+setup()
+
+from bookings.allocation import PendingBooking, allocate  # noqa: E402
+from bookings.availability import AvailabilityIndex  # noqa: E402
+from rooms.models import TYPE  # noqa: E402
+
+START = date(2024, 1, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of the room allocation solver.')
+    parser.add_argument('--rooms', type=int, default=10_000)
+    parser.add_argument('--bookings', type=int, default=50_000)
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    rooms = [(room_id, rnd.choice(TYPE.values), rnd.randint(1, 6)) for room_id in range(args.rooms)]
+    bookings = []
+    for pk in range(args.bookings):
+        check_in = START + timedelta(days=rnd.randrange(args.days))
+        nights = rnd.randint(1, 7)
+        bookings.append(
+            PendingBooking(pk, rnd.choice(TYPE.values), rnd.randint(1, 4), check_in, check_in + timedelta(days=nights))
+        )
+
+    index = AvailabilityIndex(rooms)
+    started = perf_counter()
+    allocation = allocate(bookings, index)
+    elapsed = perf_counter() - started
+
+    print(f'allocate: {elapsed:.2f} s ({args.rooms} rooms, {args.bookings} bookings over {args.days} days)')
+    print(f'assigned: {len(allocation.assigned)}, unassigned: {len(allocation.unassigned)}')
+
+
+if __name__ == '__main__':
+    main()
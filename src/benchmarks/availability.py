@@ -0,0 +1,86 @@
+import argparse
+import random
+from datetime import date, timedelta
+from time import perf_counter
+
+from benchmarks import setup
+
+setup()
+
+from bookings.availability import AvailabilityIndex  # noqa: E402
+from rooms.models import TYPE  # noqa: E402
+
+START = date(2024, 1, 1)
+
+
+def generate_rooms(count, rnd):
+    return [(room_id, rnd.choice(TYPE.values), rnd.randint(1, 6)) for room_id in range(count)]
+
+
+def generate_bookings(count, rooms, rnd):
+    bookings = []
+    for _ in range(count):
+        room_id = rnd.randrange(rooms)
+        check_in = START + timedelta(days=rnd.randrange(365))
+        bookings.append((room_id, check_in, check_in + timedelta(days=rnd.randint(1, 14))))
+    return bookings
+
+
+def generate_queries(count, rnd):
+    queries = []
+    for _ in range(count):
+        check_in = START + timedelta(days=rnd.randrange(365))
+        queries.append(
+            (check_in, check_in + timedelta(days=rnd.randint(1, 14)), rnd.choice(TYPE.values), rnd.randint(1, 4))
+        )
+    return queries
+
+
+def scan(rooms, bookings, check_in, check_out, type, persons):
+    busy = {room_id for room_id, start, end in bookings if start < check_out and end > check_in}
+    return [
+        room_id
+        for room_id, room_type, capacity in rooms
+        if room_type == type and capacity >= persons and room_id not in busy
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of the room availability index.')
+    parser.add_argument('--rooms', type=int, default=10_000)
+    parser.add_argument('--bookings', type=int, default=1_000_000)
+    parser.add_argument('--queries', type=int, default=1_000)
+    parser.add_argument('--scans', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    rooms = generate_rooms(args.rooms, rnd)
+    bookings = generate_bookings(args.bookings, args.rooms, rnd)
+    queries = generate_queries(args.queries, rnd)
+
+    started = perf_counter()
+    index = AvailabilityIndex(rooms)
+    for booking in bookings:
+        index.add_booking(*booking)
+    for room_id in index.rooms:
+        index.is_free(room_id, START, START + timedelta(days=1))
+    print(f'build: {perf_counter() - started:.2f} s ({args.rooms} rooms, {args.bookings} bookings)')
+
+    started = perf_counter()
+    for query in queries:
+        index.free_rooms(*query)
+    elapsed = perf_counter() - started
+    print(f'index: {elapsed / len(queries) * 1000:.3f} ms/query ({len(queries)} queries)')
+
+    elapsed = 0.0
+    for query in queries[: args.scans]:
+        started = perf_counter()
+        expected = scan(rooms, bookings, *query)
+        elapsed += perf_counter() - started
+        assert sorted(expected) == sorted(index.free_rooms(*query))
+    print(f'scan:  {elapsed / args.scans * 1000:.3f} ms/query ({args.scans} queries)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+import argparse
+import os
+import random
+import tempfile
+from datetime import date, timedelta
+from time import perf_counter
+
+from benchmarks import setup
+
+setup()
+
+from django.core.cache import cache  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+
+from bookings.api import AvailabilityView  # noqa: E402
+from rooms.models import TYPE, Room, RoomData  # noqa: E402
+
+
+def create_rooms(count, seed):
+    rnd = random.Random(seed)
+    room_data = RoomData.objects.bulk_create(
+        RoomData(
+            name=f'Type {i}',
+            slug=f'type-{i}',
+            type=rnd.choice(TYPE.values),
+            single_beds=rnd.randint(0, 2),
+            double_beds=rnd.randint(1, 2),
+            price=rnd.randint(50, 500),
+        )
+        for i in range(20)
+    )
+    Room.objects.bulk_create(Room(room_data=rnd.choice(room_data), number=str(number)) for number in range(count))
+
+
+def request(view, factory, query):
+    response = view(factory.get('/api/availability/', query))
+    return b''.join(response.streaming_content)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of the availability API with and without cache.')
+    parser.add_argument('--rooms', type=int, default=1000)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    old_name = connection.settings_dict['NAME']
+    connection.settings_dict['TEST']['NAME'] = os.path.join(tempfile.mkdtemp(), 'benchmark.sqlite3')
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        create_rooms(args.rooms, args.seed)
+        view = AvailabilityView.as_view()
+        factory = RequestFactory()
+        check_in = date.today() + timedelta(days=1)
+        queries = [
+            {'check_in': check_in + timedelta(days=day), 'check_out': check_in + timedelta(days=day + 3)}
+            for day in range(30)
+        ]
+
+        cache.clear()
+        started = perf_counter()
+        for query in queries:
+            request(view, factory, query)
+        uncached = (perf_counter() - started) / len(queries)
+
+        started = perf_counter()
+        for i in range(args.requests):
+            request(view, factory, queries[i % len(queries)])
+        cached = (perf_counter() - started) / args.requests
+
+        print(f'uncached: {uncached * 1000:.2f} ms/request ({1 / uncached:.0f} req/s)')
+        print(f'cached:   {cached * 1000:.2f} ms/request ({1 / cached:.0f} req/s)')
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
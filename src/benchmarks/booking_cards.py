@@ -0,0 +1,78 @@
+import argparse
+import os
+import tempfile
+from datetime import date, timedelta
+from time import perf_counter
+
+from benchmarks import setup
+
+setup()
+
+from django.core.cache import cache  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.template import loader  # noqa: E402
+
+from accounts.models import User  # noqa: E402
+from bookings.cache import BOOKING_CARD_TIMEOUT, get_card_version  # noqa: E402
+from bookings.ledger import build_room_nights  # noqa: E402
+from bookings.models import Booking, RoomNight  # noqa: E402
+from rooms.models import Room, RoomData  # noqa: E402
+
+START = date(2030, 1, 1)
+
+
+def create_bookings(count):
+    room_data = RoomData.objects.create(name='Standard', slug='standard', single_beds=2, price=100)
+    rooms = Room.objects.bulk_create(Room(room_data=room_data, number=str(number)) for number in range(count))
+    user = User.objects.create_user('benchmark@test.com', 'qwe123!@#')
+    bookings = Booking.objects.bulk_create(
+        Booking(user=user, check_in=START, check_out=START + timedelta(days=3)) for _ in range(count)
+    )
+    Booking.rooms.through.objects.bulk_create(
+        Booking.rooms.through(booking=booking, room=room) for booking, room in zip(bookings, rooms)
+    )
+    RoomNight.objects.bulk_create(
+        night
+        for booking, room in zip(bookings, rooms)
+        for night in build_room_nights(booking.pk, [room.pk], booking.check_in, booking.check_out)
+    )
+
+
+def render(template):
+    context = {
+        'object_list': Booking.objects.with_rooms().with_total_price(),
+        'card_cache_timeout': BOOKING_CARD_TIMEOUT,
+        'card_version': get_card_version(),
+    }
+    started = perf_counter()
+    template.render(context)
+    return perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of rendering booking cards with and without cache.')
+    parser.add_argument('--bookings', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    old_name = connection.settings_dict['NAME']
+    connection.settings_dict['TEST']['NAME'] = os.path.join(tempfile.mkdtemp(), 'benchmark.sqlite3')
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        create_bookings(args.bookings)
+        template = loader.get_template('bookings/list.html')
+
+        cold = []
+        for _ in range(args.repeat):
+            cache.clear()
+            cold.append(render(template))
+        warm = [render(template) for _ in range(args.repeat)]
+
+        print(f'cold: {min(cold) * 1000:.1f} ms for {args.bookings} cards')
+        print(f'warm: {min(warm) * 1000:.1f} ms for {args.bookings} cards')
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
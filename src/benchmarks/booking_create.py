@@ -0,0 +1,106 @@
+import argparse
+import os
+import tempfile
+import threading
+from datetime import date, timedelta
+from time import perf_counter
+
+from benchmarks import setup
+
+setup()
+
+from django.db import OperationalError, connection, connections  # noqa: E402
+
+from accounts.models import User  # noqa: E402
+from bookings.forms import BookingCreateForm  # noqa: E402
+from bookings.models import Booking  # noqa: E402
+from rooms.models import TYPE  # noqa: E402
+
+SQLITE_PROFILES = {
+    'default': {'init_command': 'PRAGMA journal_mode=DELETE'},
+    'settings': dict(connection.settings_dict['OPTIONS']),
+}
+
+
+def create_test_db():
+    if connection.vendor == 'sqlite':
+        path = os.path.join(tempfile.mkdtemp(), 'benchmark.sqlite3')
+        connection.settings_dict['TEST']['NAME'] = path
+    return connection.creation.create_test_db(verbosity=0, autoclobber=True)
+
+
+def create_bookings(user, count, results):
+    check_in = date.today() + timedelta(days=1)
+    data = {
+        'persons': 2,
+        'type': TYPE.STANDARD,
+        'check_in': check_in,
+        'check_out': check_in + timedelta(days=2),
+    }
+    created = errors = 0
+
+    for _ in range(count):
+        form = BookingCreateForm(user, data)
+        try:
+            if form.is_valid():
+                form.save()
+                created += 1
+        except OperationalError:
+            errors += 1
+
+    results.append((created, errors))
+    connections.close_all()
+
+
+def run(threads, bookings):
+    user = User.objects.create_user('benchmark@test.com', 'qwe123!@#')
+    results = []
+    workers = [threading.Thread(target=create_bookings, args=(user, bookings, results)) for _ in range(threads)]
+
+    started = perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = perf_counter() - started
+
+    Booking.objects.all().delete()
+    User.objects.all().delete()
+
+    created = sum(result[0] for result in results)
+    errors = sum(result[1] for result in results)
+    return created / elapsed, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test of creating bookings from concurrent threads.')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--bookings', type=int, default=200, help='Bookings per thread.')
+    parser.add_argument(
+        '--sqlite-profiles',
+        nargs='+',
+        choices=SQLITE_PROFILES,
+        default=list(SQLITE_PROFILES),
+        help='Connection options to compare on SQLite: Django defaults or the ones from settings.',
+    )
+    args = parser.parse_args()
+
+    old_name = connection.settings_dict['NAME']
+    create_test_db()
+    try:
+        profiles = args.sqlite_profiles if connection.vendor == 'sqlite' else [None]
+        for profile in profiles:
+            if profile is not None:
+                connection.settings_dict['OPTIONS'] = SQLITE_PROFILES[profile]
+                connection.close()
+            print(f'backend: {connection.vendor}' + (f', profile: {profile}' if profile else ''))
+
+            for threads in args.threads:
+                throughput, errors = run(threads, args.bookings)
+                print(f'{threads:>3} threads: {throughput:8.1f} bookings/s, {errors} errors')
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+import argparse
+import os
+import tempfile
+from time import perf_counter
+
+from benchmarks import setup
+
+setup()
+
+from django.contrib.auth.hashers import make_password  # noqa: E402
+from django.db import connection  # noqa: E402
+
+from accounts.models import User  # noqa: E402
+
+
+def get_rows(count, offset, password=None, password_hash=None):
+    for number in range(offset, offset + count):
+        row = {'email': f'guest{number}@partner.test', 'profile': {'first_name': 'Guest', 'last_name': str(number)}}
+        if password is not None:
+            row['password'] = password
+        if password_hash is not None:
+            row['password_hash'] = password_hash
+        yield row
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of importing guest accounts one by one and in bulk.')
+    parser.add_argument('--users', type=int, default=100_000)
+    parser.add_argument('--hashed-users', type=int, default=200, help='Users with raw passwords hashed in a pool.')
+    parser.add_argument('--sample', type=int, default=20, help='Users created one by one for comparison.')
+    parser.add_argument('--processes', type=int)
+    args = parser.parse_args()
+
+    old_name = connection.settings_dict['NAME']
+    connection.settings_dict['TEST']['NAME'] = os.path.join(tempfile.mkdtemp(), 'benchmark.sqlite3')
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        started = perf_counter()
+        for row in get_rows(args.sample, 0, password='qwe123!@#'):
+            user = User.objects.create_user(row['email'], row['password'])
+            user.profile.first_name, user.profile.last_name = row['profile'].values()
+            user.profile.save()
+        one_by_one = (perf_counter() - started) / args.sample
+
+        started = perf_counter()
+        User.objects.bulk_create_users(get_rows(args.users, args.sample, password_hash=make_password('qwe123!@#')))
+        bulk = perf_counter() - started
+
+        started = perf_counter()
+        User.objects.bulk_create_users(
+            get_rows(args.hashed_users, args.sample + args.users, password='qwe123!@#'), processes=args.processes
+        )
+        hashed = (perf_counter() - started) / args.hashed_users
+
+        print(f'one by one: {one_by_one * 1000:.1f} ms per user, {one_by_one * args.users / 3600:.1f} h estimated')
+        print(f'bulk with prepared hashes: {bulk:.2f} s for {args.users} users')
+        print(f'bulk hashing raw passwords: {hashed * 1000:.1f} ms per user on {os.cpu_count()} cpus')
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
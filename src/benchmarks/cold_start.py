@@ -0,0 +1,65 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from time import perf_counter
+
+URLS = ['/', '/account/login/', '/account/register/']
+
+
+def child(warm):
+    started = perf_counter()
+    from benchmarks import setup
+
+    setup()
+
+    from django.test import Client
+    from django.test.utils import setup_test_environment
+
+    from utils.warmup import warm_templates, warm_urls
+
+    setup_test_environment()
+    if warm:
+        warm_templates()
+        warm_urls()
+    booted = perf_counter()
+
+    client = Client()
+    first = {}
+    for url in URLS:
+        request_started = perf_counter()
+        client.get(url)
+        first[url] = perf_counter() - request_started
+
+    print(json.dumps({'boot': booted - started, 'first': first}))
+
+
+def run(warm):
+    command = [sys.executable, '-m', 'benchmarks.cold_start', '--child'] + (['--warm'] if warm else [])
+    output = subprocess.run(command, capture_output=True, text=True, check=True, env=os.environ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of the first responses of a fresh worker.')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--warm', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return child(args.warm)
+
+    for warm in (False, True):
+        runs = [run(warm) for _ in range(args.repeat)]
+        boot = statistics.median(result['boot'] for result in runs)
+        print(f'{"warm" if warm else "cold"}: boot {boot * 1000:.1f} ms')
+        for url in URLS:
+            first = statistics.median(result['first'][url] for result in runs)
+            print(f'  first {url}: {first * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
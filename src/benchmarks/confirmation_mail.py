@@ -0,0 +1,52 @@
+import argparse
+from time import perf_counter
+
+from benchmarks import setup
+
+setup()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.contrib.auth.tokens import default_token_generator  # noqa: E402
+from django.template import loader  # noqa: E402
+from django.utils.encoding import force_bytes  # noqa: E402
+from django.utils.http import urlsafe_base64_encode  # noqa: E402
+
+from accounts.mails import BODY_TEMPLATE_NAME, SUBJECT_TEMPLATE_NAME, ConfirmationMailRenderer  # noqa: E402
+
+User = get_user_model()
+
+
+def render_uncached(user):
+    context = {
+        'site_name': 'hotel.test',
+        'domain': 'hotel.test',
+        'protocol': 'https',
+        'uid': urlsafe_base64_encode(force_bytes(user.pk)),
+        'token': default_token_generator.make_token(user),
+    }
+    subject = ''.join(loader.render_to_string(SUBJECT_TEMPLATE_NAME, context).splitlines())
+    return subject, loader.render_to_string(BODY_TEMPLATE_NAME, context)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of rendering registration confirmation mails.')
+    parser.add_argument('--mails', type=int, default=5_000)
+    args = parser.parse_args()
+
+    users = [User(pk=pk, email=f'user{pk}@test.com', password='!') for pk in range(1, args.mails + 1)]
+
+    started = perf_counter()
+    for user in users:
+        render_uncached(user)
+    uncached = perf_counter() - started
+
+    started = perf_counter()
+    ConfirmationMailRenderer('hotel.test', 'hotel.test', 'https').render_many(users)
+    cached = perf_counter() - started
+
+    print(f'render_to_string: {uncached / args.mails * 1e6:.1f} us/mail')
+    print(f'renderer:         {cached / args.mails * 1e6:.1f} us/mail ({args.mails} mails)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+import argparse
+import os
+import tempfile
+from time import perf_counter
+
+from benchmarks import setup
+
+setup()
+
+from django.core.cache import cache  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.http import HttpRequest  # noqa: E402
+from django.test import override_settings  # noqa: E402
+
+from accounts.forms import UserLoginForm  # noqa: E402
+from accounts.models import User  # noqa: E402
+from accounts.throttling import LoginThrottle  # noqa: E402
+
+EMAIL = 'rick.sanchez@test.com'
+
+
+def measure(seconds, data, throttled=False):
+    request = HttpRequest()
+    request.META['REMOTE_ADDR'] = '127.0.0.1'
+    if throttled:
+        throttle = LoginThrottle(request, data['email'])
+        while throttle.is_allowed():
+            throttle.register_failure()
+
+    attempts = 0
+    started = perf_counter()
+    while perf_counter() - started < seconds:
+        if UserLoginForm(request, data=data).is_valid():
+            raise RuntimeError('Benchmark attempt must be rejected.')
+        attempts += 1
+    return attempts / (perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of rejected login attempts per second.')
+    parser.add_argument('--seconds', type=float, default=3)
+    args = parser.parse_args()
+
+    old_name = connection.settings_dict['NAME']
+    connection.settings_dict['TEST']['NAME'] = os.path.join(tempfile.mkdtemp(), 'benchmark.sqlite3')
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        User.objects.create_user(EMAIL, 'qwe123!@#')
+        unlimited = {'LOGIN_THROTTLE_EMAIL_LIMIT': 10**9, 'LOGIN_THROTTLE_IP_LIMIT': 10**9}
+        scenarios = {
+            'wrong password': ({'email': EMAIL, 'password': 'wrong'}, unlimited, False),
+            'unknown email, cached': ({'email': 'unknown@test.com', 'password': 'wrong'}, unlimited, False),
+            'throttled': ({'email': EMAIL, 'password': 'wrong'}, {}, True),
+        }
+
+        for name, (data, limits, throttled) in scenarios.items():
+            cache.clear()
+            with override_settings(**limits):
+                print(f'{name:<24} {measure(args.seconds, data, throttled):>10.1f} rejected attempts/s')
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+import argparse
+import os
+import tempfile
+from datetime import date, timedelta
+from statistics import median
+from time import perf_counter
+
+from benchmarks import setup
+
+setup()
+
+from django.db import connection  # noqa: E402
+from django.test import Client, override_settings  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+from django.urls import reverse  # noqa: E402
+
+from accounts.models import User  # noqa: E402
+from bookings.models import Booking  # noqa: E402
+from rooms.models import Room, RoomData  # noqa: E402
+
+START = date(2030, 1, 1)
+
+
+def create_data(count):
+    room_data = RoomData.objects.bulk_create(
+        RoomData(name=f'Room {number}', slug=f'room-{number}', single_beds=2, price=100) for number in range(count)
+    )
+    Room.objects.bulk_create(Room(room_data=data, number=str(number)) for number, data in enumerate(room_data))
+    user = User.objects.create_user('benchmark@test.com', 'qwe123!@#')
+    Booking.objects.bulk_create(
+        Booking(user=user, check_in=START, check_out=START + timedelta(days=3)) for _ in range(count)
+    )
+    return user
+
+
+def create_client(user, urls, enabled):
+    with override_settings(PERFORMANCE_MIDDLEWARE=enabled):
+        client = Client()
+        client.force_login(user)
+        for url in urls:
+            client.get(url)
+    return client
+
+
+def measure(client, urls):
+    started = perf_counter()
+    for url in urls:
+        client.get(url)
+    return perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of the performance middleware overhead.')
+    parser.add_argument('--rooms', type=int, default=20)
+    parser.add_argument('--requests', type=int, default=2000)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.settings_dict['NAME']
+    connection.settings_dict['TEST']['NAME'] = os.path.join(tempfile.mkdtemp(), 'benchmark.sqlite3')
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        user = create_data(args.rooms)
+        urls = [reverse('home'), reverse('rooms:room-list'), reverse('bookings:booking-list')]
+
+        clients = {enabled: create_client(user, urls, enabled) for enabled in (False, True)}
+
+        timings = {False: [], True: []}
+        for _ in range(args.requests):
+            for enabled, client in clients.items():
+                timings[enabled].append(measure(client, urls))
+        disabled, enabled = median(timings[False]), median(timings[True])
+
+        print(f'disabled: {disabled * 1000:.2f} ms per {len(urls)} requests')
+        print(f'enabled: {enabled * 1000:.2f} ms per {len(urls)} requests')
+        print(f'overhead: {(enabled / disabled - 1) * 100:.2f} %')
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+import argparse
+from importlib.util import find_spec
+from time import perf_counter
+
+from benchmarks import setup
+
+setup()
+
+from django.conf import settings  # noqa: E402
+from django.contrib.auth.hashers import check_password, identify_hasher, make_password  # noqa: E402
+from django.test import override_settings  # noqa: E402
+
+from accounts.hashers import hash_passwords  # noqa: E402
+
+PASSWORD = 'qwe123!@#'
+
+
+def measure_logins(seconds):
+    encoded = make_password(PASSWORD)
+    logins = 0
+    started = perf_counter()
+    while perf_counter() - started < seconds:
+        check_password(PASSWORD, encoded)
+        logins += 1
+    return logins / (perf_counter() - started), encoded
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of logins per second per core for each hasher profile.')
+    parser.add_argument('--seconds', type=float, default=3)
+    parser.add_argument('--passwords', type=int, default=0, help='Also hash this many passwords in a process pool.')
+    parser.add_argument('--processes', type=int)
+    parser.add_argument('--profiles', nargs='*', default=list(settings.PASSWORD_HASHER_PROFILES))
+    args = parser.parse_args()
+
+    for profile in args.profiles:
+        if profile == 'argon2' and not find_spec('argon2'):
+            print(f'{profile:<8} skipped, argon2-cffi is not installed')
+            continue
+
+        hasher = settings.PASSWORD_HASHER_PROFILES[profile]
+        others = [other for other in settings.PASSWORD_HASHERS if other != hasher]
+        with override_settings(PASSWORD_HASHERS=[hasher, *others]):
+            rate, encoded = measure_logins(args.seconds)
+            decoded = identify_hasher(encoded).decode(encoded)
+            params = ', '.join(f'{key}={value}' for key, value in decoded.items() if key not in ('salt', 'hash'))
+            line = f'{profile:<8} {rate:>8.1f} logins/s per core  ({params})'
+
+            if args.passwords:
+                started = perf_counter()
+                hash_passwords([PASSWORD] * args.passwords, args.processes)
+                line += f'  {args.passwords / (perf_counter() - started):.1f} passwords/s in a pool'
+
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+import argparse
+import os
+import random
+import resource
+import tempfile
+from time import perf_counter
+
+from benchmarks import setup
+
+setup()
+
+from django.db import connection  # noqa: E402
+
+from rooms.inventory import FIELDS, import_rooms  # noqa: E402
+from rooms.models import TYPE  # noqa: E402
+from utils.streams import iter_lines, read_rows  # noqa: E402
+
+
+def generate_rows(count, room_types, seed):
+    rnd = random.Random(seed)
+    for number in range(count):
+        type_number = rnd.randrange(room_types)
+        yield {
+            'number': str(number),
+            'status': 0,
+            'is_available': True,
+            'slug': f'type-{type_number}',
+            'name': f'Type {type_number}',
+            'type': type_number % len(TYPE.values),
+            'single_beds': type_number % 3,
+            'double_beds': 1,
+            'price': 100 + type_number,
+            'description': '',
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of importing rooms from a CSV file.')
+    parser.add_argument('--rooms', type=int, default=100_000)
+    parser.add_argument('--room-types', type=int, default=50)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'rooms.csv')
+    with open(path, 'w', newline='') as file:
+        file.writelines(iter_lines(generate_rows(args.rooms, args.room_types, args.seed), FIELDS, 'csv'))
+
+    old_name = connection.settings_dict['NAME']
+    connection.settings_dict['TEST']['NAME'] = os.path.join(directory, 'benchmark.sqlite3')
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        for run in ('insert', 'update'):
+            started = perf_counter()
+            with open(path, newline='') as file:
+                _, rooms = import_rooms(read_rows(file, 'csv'), args.batch_size)
+            elapsed = perf_counter() - started
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            print(f'{run}: {rooms} rooms in {elapsed:.2f} s, peak RSS {peak / 1024:.1f} MiB')
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
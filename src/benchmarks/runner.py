@@ -0,0 +1,145 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from statistics import quantiles
+from time import perf_counter
+
+from benchmarks import setup
+
+setup()
+
+from django.core.management import call_command  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test import Client  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+from django.urls import reverse  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from accounts.models import User  # noqa: E402
+from bookings.models import Booking  # noqa: E402
+from utils.seeding import SEED_PASSWORD  # noqa: E402
+
+
+def get_scenarios():
+    check_in = timezone.now().date() + timedelta(days=7)
+    dates = {'check_in': check_in, 'check_out': check_in + timedelta(days=3)}
+    return {
+        'home': (reverse('home'), None),
+        'room-list': (reverse('rooms:room-list'), None),
+        'availability': (reverse('api:availability'), dates),
+        'booking-create': (reverse('bookings:booking-create'), {**dates, 'persons': 2}),
+        'booking-list': (reverse('bookings:booking-list'), None),
+        'user-account': (reverse('accounts:user-account'), None),
+    }
+
+
+def get_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_scenario(client, url, data, requests, warmup):
+    for _ in range(warmup):
+        client.get(url, data)
+
+    timings = []
+    started = perf_counter()
+    for _ in range(requests):
+        request_started = perf_counter()
+        response = client.get(url, data)
+        if response.streaming:
+            b''.join(response.streaming_content)
+        timings.append(perf_counter() - request_started)
+    elapsed = perf_counter() - started
+
+    p50, p95, p99 = (quantiles(timings, n=100)[index] * 1000 for index in (49, 94, 98))
+    return {
+        'status': response.status_code,
+        'requests': requests,
+        'throughput': round(requests / elapsed, 1),
+        'p50_ms': round(p50, 2),
+        'p95_ms': round(p95, 2),
+        'p99_ms': round(p99, 2),
+    }
+
+
+def print_report(report, baseline=None):
+    for name, result in report['scenarios'].items():
+        line = f'{name:<16} {result["throughput"]:>8.1f} req/s'
+        line += f'  p50 {result["p50_ms"]:>7.2f} ms  p95 {result["p95_ms"]:>7.2f} ms'
+        previous = (baseline or {}).get('scenarios', {}).get(name)
+        if previous:
+            line += f'  p50 {(result["p50_ms"] / previous["p50_ms"] - 1) * 100:+.1f}% vs {baseline["commit"]}'
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load benchmark of the main views on seeded data.')
+    parser.add_argument('--rooms', type=int, default=1000)
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--bookings', type=int, default=20_000)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--warmup', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--scenarios', nargs='*', help='Defaults to all scenarios.')
+    parser.add_argument('--output', default='benchmark.json', help='JSON file to write the report to.')
+    parser.add_argument('--compare', help='JSON report of a previous run to compare with.')
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.settings_dict['NAME']
+    connection.settings_dict['TEST']['NAME'] = os.path.join(tempfile.mkdtemp(), 'benchmark.sqlite3')
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        started = perf_counter()
+        call_command(
+            'seed_hotel',
+            rooms=args.rooms,
+            users=args.users,
+            bookings=args.bookings,
+            allocate=True,
+            seed=args.seed,
+            stdout=StringIO(),
+        )
+        seed_time = perf_counter() - started
+
+        user = User.objects.get(pk=Booking.objects.values('user').order_by('user').first()['user'])
+        client = Client()
+        client.login(email=user.email, password=SEED_PASSWORD)
+
+        scenarios = get_scenarios()
+        report = {
+            'commit': get_commit(),
+            'python': platform.python_version(),
+            'database': connection.vendor,
+            'data': {'rooms': args.rooms, 'users': args.users, 'bookings': args.bookings, 'seed': args.seed},
+            'seed_s': round(seed_time, 2),
+            'scenarios': {
+                name: run_scenario(client, *scenarios[name], args.requests, args.warmup)
+                for name in args.scenarios or scenarios
+            },
+        }
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=4)
+
+    print(f'seeded in {report["seed_s"]:.2f} s, report written to {args.output}')
+    print_report(report, baseline)
+
+
+if __name__ == '__main__':
+    main()
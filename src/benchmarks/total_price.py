@@ -0,0 +1,89 @@
+import argparse
+import os
+import random
+import tempfile
+from datetime import date, timedelta
+from time import perf_counter
+
+from benchmarks import setup
+
+setup()
+
+from django.db import connection  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+
+from accounts.models import User  # noqa: E402
+from bookings.ledger import build_room_nights  # noqa: E402
+from bookings.models import Booking, RoomNight  # noqa: E402
+from rooms.models import Room, RoomData, RoomRate  # noqa: E402
+from rooms.pricing import rebuild_rate_nights  # noqa: E402
+
+START = date(2030, 1, 1)
+
+
+def create_data(rooms, bookings, seed):
+    rnd = random.Random(seed)
+    room_data = RoomData.objects.bulk_create(
+        RoomData(name=f'Type {i}', slug=f'type-{i}', single_beds=2, price=rnd.randint(50, 500)) for i in range(20)
+    )
+    RoomRate.objects.bulk_create(
+        RoomRate(
+            room_data=data,
+            start=START + timedelta(days=week * 7),
+            end=START + timedelta(days=week * 7 + 7),
+            price=rnd.randint(50, 500),
+        )
+        for data in room_data
+        for week in range(0, 104, 2)
+    )
+    rebuild_rate_nights()
+
+    rooms = Room.objects.bulk_create(
+        Room(room_data=rnd.choice(room_data), number=str(number)) for number in range(rooms)
+    )
+    user = User.objects.create_user('benchmark@test.com', 'qwe123!@#')
+    next_free = {room.pk: START for room in rooms}
+    links, nights = [], []
+
+    for _ in range(bookings):
+        room = rnd.choice(rooms)
+        check_in = next_free[room.pk]
+        check_out = check_in + timedelta(days=rnd.randint(1, 5))
+        next_free[room.pk] = check_out
+        booking = Booking(user=user, check_in=check_in, check_out=check_out)
+        links.append((booking, room))
+
+    Booking.objects.bulk_create((booking for booking, _ in links), batch_size=1000)
+    Booking.rooms.through.objects.bulk_create(
+        (Booking.rooms.through(booking=booking, room=room) for booking, room in links), batch_size=1000
+    )
+    for booking, room in links:
+        nights += build_room_nights(booking.pk, [room.pk], booking.check_in, booking.check_out)
+    RoomNight.objects.bulk_create(nights, batch_size=1000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of computing booking total prices in the database.')
+    parser.add_argument('--rooms', type=int, default=1000)
+    parser.add_argument('--bookings', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    old_name = connection.settings_dict['NAME']
+    connection.settings_dict['TEST']['NAME'] = os.path.join(tempfile.mkdtemp(), 'benchmark.sqlite3')
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        create_data(args.rooms, args.bookings, args.seed)
+
+        with CaptureQueriesContext(connection) as queries:
+            started = perf_counter()
+            prices = list(Booking.objects.with_total_price().values_list('pk', 'total_price'))
+            elapsed = perf_counter() - started
+
+        print(f'with_total_price: {len(prices)} bookings in {elapsed:.2f} s, {len(queries)} queries')
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,15 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 
+from bookings.allocation import allocate_rooms
+from bookings.availability import get_free_rooms
+from bookings.exports import export_response
 from bookings.models import Booking
 
 
 @admin.register(Booking)
 class BookingAdmin(admin.ModelAdmin):
     list_display = ['uuid', 'user', 'is_paid', 'check_in', 'check_out', 'created']
+    list_filter = ['is_paid']
     fields = [
         'uuid',
         'user',
@@ -20,3 +24,30 @@ class BookingAdmin(admin.ModelAdmin):
         'created',
     ]
     readonly_fields = ['uuid', 'updated', 'created']
+    actions = ['assign_rooms', 'export_csv', 'export_jsonl']
+
+    def formfield_for_manytomany(self, db_field, request, **kwargs):
+        if db_field.name == 'rooms':
+            booking = self.get_object(request, request.resolver_match.kwargs.get('object_id'))
+            if booking is not None:
+                free_rooms = get_free_rooms(booking.check_in, booking.check_out, booking.type, exclude=booking)
+                kwargs['queryset'] = free_rooms | booking.rooms.all()
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
+
+    @admin.action(description='Assign rooms to selected bookings')
+    def assign_rooms(self, request, queryset):
+        allocation = allocate_rooms(bookings=queryset)
+
+        if allocation.assigned:
+            self.message_user(request, f'Rooms are assigned to {len(allocation.assigned)} bookings.')
+        if allocation.unassigned:
+            bookings = ', '.join(str(booking_id) for booking_id in allocation.unassigned)
+            self.message_user(request, f'No free rooms for bookings: {bookings}', messages.WARNING)
+
+    @admin.action(description='Export selected bookings to CSV')
+    def export_csv(self, request, queryset):
+        return export_response(queryset, 'csv')
+
+    @admin.action(description='Export selected bookings to JSONL')
+    def export_jsonl(self, request, queryset):
+        return export_response(queryset, 'jsonl')
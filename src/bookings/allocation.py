@@ -0,0 +1,149 @@
+from bisect import bisect_right, insort
+from collections import defaultdict
+from datetime import date
+from typing import NamedTuple
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from bookings.availability import AvailabilityIndex
+from bookings.cache import AVAILABILITY
+from bookings.ledger import build_room_nights, get_nights
+from bookings.models import Booking, RoomNight
+from utils.cache import bump_version
+
+
+class PendingBooking(NamedTuple):
+    pk: object
+    type: int
+    persons: int
+    check_in: date
+    check_out: date
+
+
+class Allocation(NamedTuple):
+    assigned: dict
+    unassigned: list
+
+
+def allocate(bookings, index):
+    lanes = defaultdict(lambda: defaultdict(list))
+    for room_id, (type, capacity) in index.rooms.items():
+        lanes[type][capacity].append((date.min, room_id))
+    capacities = {type: sorted(lanes[type]) for type in lanes}
+
+    assigned, unassigned = {}, []
+
+    for booking in sorted(bookings, key=lambda booking: (booking.check_in, booking.check_out)):
+        room_id = None
+        for capacity in capacities.get(booking.type, []):
+            if capacity < booking.persons:
+                continue
+            room_id = _take_room(lanes[booking.type][capacity], index, booking)
+            if room_id is not None:
+                break
+
+        if room_id is None:
+            unassigned.append(booking.pk)
+        else:
+            assigned[booking.pk] = room_id
+
+    return Allocation(assigned, unassigned)
+
+
+def _take_room(lane, index, booking):
+    position = bisect_right(lane, (booking.check_in, float('inf')))
+
+    for position in range(position - 1, -1, -1):
+        _, room_id = lane[position]
+        if index.is_free(room_id, booking.check_in, booking.check_out):
+            del lane[position]
+            insort(lane, (booking.check_out, room_id))
+            index.add_booking(room_id, booking.check_in, booking.check_out)
+            return room_id
+
+    return None
+
+
+def get_pending_bookings(start=None, end=None, bookings=None):
+    if bookings is None:
+        bookings = Booking.objects.all()
+
+    bookings = bookings.filter(rooms__isnull=True)
+    if start is not None:
+        bookings = bookings.filter(check_out__gt=start)
+    if end is not None:
+        bookings = bookings.filter(check_in__lt=end)
+
+    values = bookings.values_list('pk', 'type', 'persons', 'check_in', 'check_out')
+    return [PendingBooking(*row) for row in values.iterator(chunk_size=10_000)]
+
+
+def write_allocation(bookings, assigned, batch_size=1000):
+    links, nights = [], []
+
+    for booking_id, room_id in assigned.items():
+        booking = bookings[booking_id]
+        links.append(Booking.rooms.through(booking_id=booking_id, room_id=room_id))
+        nights += build_room_nights(booking_id, [room_id], booking.check_in, booking.check_out)
+
+    with transaction.atomic():
+        Booking.rooms.through.objects.bulk_create(links, batch_size=batch_size)
+        RoomNight.objects.bulk_create(nights, batch_size=batch_size)
+        Booking.objects.filter(pk__in=assigned).update(updated=timezone.now())
+
+
+def get_conflicts(bookings, assigned):
+    if not assigned:
+        return []
+
+    planned = [bookings[booking_id] for booking_id in assigned]
+    booked = RoomNight.objects.filter(
+        room__in=set(assigned.values()),
+        date__gte=min(booking.check_in for booking in planned),
+        date__lt=max(booking.check_out for booking in planned),
+    )
+    booked = set(booked.values_list('room_id', 'date').iterator())
+    return [
+        booking.pk
+        for booking in planned
+        if any((assigned[booking.pk], night) in booked for night in get_nights(booking.check_in, booking.check_out))
+    ]
+
+
+def apply_allocation(bookings, allocation, batch_size=1000):
+    bookings = {booking.pk: booking for booking in bookings}
+
+    while True:
+        try:
+            write_allocation(bookings, allocation.assigned, batch_size)
+            break
+        except IntegrityError:
+            # The plan was made without locks, so a reservation may have taken a planned room since. Those bookings
+            # are left for the next run and the rest are written again.
+            conflicts = get_conflicts(bookings, allocation.assigned)
+            if not conflicts:
+                raise
+            for booking_id in conflicts:
+                del allocation.assigned[booking_id]
+                allocation.unassigned.append(booking_id)
+
+    bump_version(AVAILABILITY)
+    return allocation
+
+
+def allocate_rooms(start=None, end=None, bookings=None, dry_run=False, batch_size=1000):
+    pending = get_pending_bookings(start, end, bookings)
+    if not pending:
+        return Allocation({}, [])
+
+    index = AvailabilityIndex.from_db(
+        min(booking.check_in for booking in pending),
+        max(booking.check_out for booking in pending),
+    )
+    allocation = allocate(pending, index)
+
+    if not dry_run:
+        allocation = apply_allocation(pending, allocation, batch_size)
+
+    return allocation
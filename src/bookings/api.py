@@ -0,0 +1,25 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views import generic
+
+from bookings.cache import iter_availability
+from bookings.forms import AvailabilitySearchForm
+
+
+def iter_json_list(name, items):
+    yield f'{{"{name}": ['
+    for position, item in enumerate(items):
+        yield (',' if position else '') + json.dumps(item, cls=DjangoJSONEncoder)
+    yield ']}'
+
+
+class AvailabilityView(generic.View):
+    def get(self, request, *args, **kwargs):
+        form = AvailabilitySearchForm(request.GET)
+        if not form.is_valid():
+            return JsonResponse({'errors': form.errors}, status=400)
+
+        results = iter_availability(**form.cleaned_data)
+        return StreamingHttpResponse(iter_json_list('results', results), content_type='application/json')
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from bookings import api
+
+app_name = 'api'
+
+urlpatterns = [
+    path('availability/', api.AvailabilityView.as_view(), name='availability'),
+]
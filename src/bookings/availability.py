@@ -0,0 +1,134 @@
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from itertools import accumulate
+
+from django.db.models import Count, Exists, F, OuterRef
+
+from bookings.models import Booking, RoomNight
+from rooms.models import Room
+
+CAPACITY = F('room_data__capacity')
+
+
+def get_busy_nights(check_in, check_out, exclude=None):
+    nights = RoomNight.objects.filter(date__gte=check_in, date__lt=check_out)
+    if exclude is not None:
+        nights = nights.exclude(booking=exclude)
+    return nights
+
+
+def get_free_rooms(check_in, check_out, type=None, persons=None, exclude=None):
+    busy = get_busy_nights(check_in, check_out, exclude).filter(room=OuterRef('pk'))
+    rooms = Room.objects.filter(is_available=True).filter(~Exists(busy))
+
+    if type is not None:
+        rooms = rooms.filter(room_data__type=type)
+
+    if persons:
+        rooms = rooms.filter(room_data__capacity__gte=persons)
+
+    return rooms
+
+
+def get_free_room_types(check_in, check_out, type=None, persons=None):
+    rooms = get_free_rooms(check_in, check_out, type, persons).order_by()
+    return (
+        rooms.values(
+            slug=F('room_data__slug'),
+            name=F('room_data__name'),
+            room_type=F('room_data__type'),
+            capacity=CAPACITY,
+            price=F('room_data__price'),
+        )
+        .annotate(free_rooms=Count('pk'))
+        .order_by('room_type', 'price', 'slug')
+    )
+
+
+class RoomIntervals:
+    __slots__ = ('starts', 'ends', '_max_ends')
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self._max_ends = None
+
+    def __len__(self):
+        return len(self.starts)
+
+    def add(self, start, end):
+        if end <= start:
+            return
+        index = bisect_right(self.starts, start)
+        self.starts.insert(index, start)
+        self.ends.insert(index, end)
+        self._max_ends = None
+
+    def is_free(self, start, end):
+        index = bisect_left(self.starts, end)
+        if not index:
+            return True
+        if self._max_ends is None:
+            self._max_ends = list(accumulate(self.ends, max))
+        return self._max_ends[index - 1] <= start
+
+
+class AvailabilityIndex:
+    def __init__(self, rooms=()):
+        self.rooms = {}
+        self.intervals = defaultdict(RoomIntervals)
+        self._groups = defaultdict(list)
+        self._capacities = {}
+
+        for room_id, type, capacity in rooms:
+            self.add_room(room_id, type, capacity)
+
+    def __contains__(self, room_id):
+        return room_id in self.rooms
+
+    def add_room(self, room_id, type, capacity):
+        self.rooms[room_id] = (type, capacity)
+        group = self._groups[type]
+        group.insert(bisect_right(group, (capacity, room_id)), (capacity, room_id))
+        self._capacities.pop(type, None)
+
+    def add_booking(self, room_id, check_in, check_out):
+        self.intervals[room_id].add(check_in, check_out)
+
+    def is_free(self, room_id, check_in, check_out):
+        intervals = self.intervals.get(room_id)
+        return intervals is None or intervals.is_free(check_in, check_out)
+
+    def get_candidates(self, type=None, persons=None):
+        types = self._groups if type is None else [type]
+
+        for type in types:
+            group = self._groups.get(type, [])
+            start = 0
+            if persons:
+                capacities = self._capacities.get(type)
+                if capacities is None:
+                    capacities = self._capacities[type] = [capacity for capacity, _ in group]
+                start = bisect_left(capacities, persons)
+            for _, room_id in group[start:]:
+                yield room_id
+
+    def free_rooms(self, check_in, check_out, type=None, persons=None):
+        return [room_id for room_id in self.get_candidates(type, persons) if self.is_free(room_id, check_in, check_out)]
+
+    @classmethod
+    def from_db(cls, start=None, end=None):
+        rooms = Room.objects.filter(is_available=True).values_list('pk', 'room_data__type', CAPACITY)
+        index = cls(rooms.iterator())
+
+        links = Booking.rooms.through.objects.all()
+        if start is not None:
+            links = links.filter(booking__check_out__gt=start)
+        if end is not None:
+            links = links.filter(booking__check_in__lt=end)
+
+        values = links.values_list('room_id', 'booking__check_in', 'booking__check_out')
+        for room_id, check_in, check_out in values.iterator(chunk_size=10_000):
+            index.add_booking(room_id, check_in, check_out)
+
+        return index
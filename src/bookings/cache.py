@@ -0,0 +1,32 @@
+from django.core.cache import cache
+
+from bookings.availability import get_free_room_types
+from rooms.cache import CATALOGUE, PRICING
+from utils.cache import get_version, make_versioned_key
+
+AVAILABILITY = 'bookings:availability'
+AVAILABILITY_TIMEOUT = 30
+BOOKING_CARD_TIMEOUT = 60 * 60 * 24 * 7
+
+
+def get_availability_key(check_in, check_out, type=None, persons=None):
+    return make_versioned_key(AVAILABILITY, get_version(CATALOGUE), check_in, check_out, type, persons)
+
+
+def get_card_version():
+    return f'{get_version(CATALOGUE)}:{get_version(PRICING)}'
+
+
+def iter_availability(check_in, check_out, type=None, persons=None):
+    key = get_availability_key(check_in, check_out, type, persons)
+    results = cache.get(key)
+
+    if results is not None:
+        yield from results
+        return
+
+    results = []
+    for room_type in get_free_room_types(check_in, check_out, type, persons).iterator():
+        results.append(room_type)
+        yield room_type
+    cache.set(key, results, AVAILABILITY_TIMEOUT)
@@ -0,0 +1,36 @@
+from django.http import StreamingHttpResponse
+
+from bookings.models import Booking
+from utils.streams import iter_lines
+
+FIELDS = ['uuid', 'email', 'rooms', 'type', 'persons', 'check_in', 'check_out', 'total_price', 'is_paid', 'created']
+CONTENT_TYPES = {'csv': 'text/csv', 'jsonl': 'application/jsonl'}
+
+
+def iter_bookings(bookings=None, chunk_size=1000):
+    if bookings is None:
+        bookings = Booking.objects.all()
+
+    bookings = bookings.select_related('user').with_rooms().with_total_price().order_by('created', 'pk')
+    for booking in bookings.iterator(chunk_size=chunk_size):
+        yield {
+            'uuid': booking.uuid,
+            'email': booking.user.email,
+            'rooms': booking.get_str_rooms(),
+            'type': booking.get_str_type(),
+            'persons': booking.persons,
+            'check_in': booking.check_in,
+            'check_out': booking.check_out,
+            'total_price': booking.get_total_price(),
+            'is_paid': booking.is_paid,
+            'created': booking.created,
+        }
+
+
+def export_response(bookings, format, chunk_size=1000):
+    response = StreamingHttpResponse(
+        iter_lines(iter_bookings(bookings, chunk_size), FIELDS, format),
+        content_type=CONTENT_TYPES[format],
+    )
+    response['Content-Disposition'] = f'attachment; filename="bookings.{format}"'
+    return response
@@ -1,20 +1,30 @@
+from uuid import uuid4
+
 from django import forms
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError
 
 from bookings.models import Booking
+from bookings.reservation import reserve
+from bookings.validators import validate_check_in_date, validate_check_out_date
+from rooms.models import TYPE
 
 NO_PERSONS_ERROR_MESSAGE = 'Persons can only be 1 and more.'
+NO_FREE_ROOM_MESSAGE = 'There is no free room for these dates right now. The booking waits for a room to be assigned.'
 
 
 class BookingCreateForm(forms.ModelForm):
     class Meta:
         model = Booking
-        fields = ['persons', 'type', 'has_children', 'check_in', 'check_out']
-        widgets = {'user': forms.HiddenInput()}
+        fields = ['persons', 'type', 'has_children', 'check_in', 'check_out', 'idempotency_key']
+        widgets = {'user': forms.HiddenInput(), 'idempotency_key': forms.HiddenInput()}
 
     def __init__(self, user, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.user = user
+        self.room = None
+        if not self.is_bound:
+            self.initial.setdefault('idempotency_key', uuid4())
 
     def clean_persons(self):
         persons = self.cleaned_data.get('persons')
@@ -26,4 +36,45 @@ class BookingCreateForm(forms.ModelForm):
 
     def save(self, commit=True):
         self.instance.user = self.user
-        return super().save(commit)
+        if not commit:
+            return super().save(commit)
+
+        key = self.cleaned_data.get('idempotency_key')
+        if key is not None:
+            booking = self.get_booking_by_key(key)
+            if booking is not None:
+                return self.use_existing_booking(booking)
+
+        try:
+            self.room = reserve(self.instance)
+        except IntegrityError:
+            booking = self.get_booking_by_key(key) if key is not None else None
+            if booking is None:
+                raise
+            return self.use_existing_booking(booking)
+        return self.instance
+
+    def use_existing_booking(self, booking):
+        self.instance = booking
+        self.room = booking.rooms.first()
+        return booking
+
+    def get_booking_by_key(self, key):
+        return Booking.objects.filter(user=self.user, idempotency_key=key).first()
+
+
+class AvailabilitySearchForm(forms.Form):
+    check_in = forms.DateField()
+    check_out = forms.DateField()
+    type = forms.TypedChoiceField(choices=TYPE.choices, coerce=int, required=False, empty_value=None)
+    persons = forms.IntegerField(min_value=1, required=False)
+
+    def clean(self):
+        check_in = self.cleaned_data.get('check_in')
+        check_out = self.cleaned_data.get('check_out')
+
+        validate_check_in_date(check_in)
+        if check_in:
+            validate_check_out_date(check_out, check_in)
+
+        return self.cleaned_data
@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta
+
+from django.db import transaction
+from django.db.models import Count
+
+from bookings.cache import AVAILABILITY
+from bookings.models import Booking, RoomNight
+from utils.cache import bump_version
+
+
+def as_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def get_nights(check_in, check_out):
+    check_in, check_out = as_date(check_in), as_date(check_out)
+    return [check_in + timedelta(days=night) for night in range((check_out - check_in).days)]
+
+
+def build_room_nights(booking_id, room_ids, check_in, check_out):
+    nights = get_nights(check_in, check_out)
+    return [RoomNight(booking_id=booking_id, room_id=room_id, date=night) for room_id in room_ids for night in nights]
+
+
+def add_room_nights(booking, room_ids):
+    RoomNight.objects.bulk_create(build_room_nights(booking.pk, room_ids, booking.check_in, booking.check_out))
+
+
+def write_booking_nights(booking):
+    with transaction.atomic():
+        RoomNight.objects.filter(booking=booking).delete()
+        add_room_nights(booking, booking.rooms.values_list('pk', flat=True))
+
+
+def get_occupancy(start, end):
+    nights = RoomNight.objects.filter(date__gte=start, date__lt=end)
+    return nights.values('date').annotate(rooms=Count('room')).order_by('date')
+
+
+def iter_booking_batches(batch_size):
+    bookings = Booking.objects.filter(rooms__isnull=False).distinct().order_by('pk')
+    booking_ids = bookings.values_list('pk', flat=True)
+    last_id = None
+
+    while True:
+        page = booking_ids if last_id is None else booking_ids.filter(pk__gt=last_id)
+        batch = list(page[:batch_size])
+        if not batch:
+            return
+
+        links = Booking.rooms.through.objects.filter(booking__in=batch)
+        values = links.values_list('booking_id', 'booking__check_in', 'booking__check_out', 'room_id')
+        yield batch, values
+        last_id = batch[-1]
+
+
+def rebuild(batch_size=1000):
+    created = 0
+
+    with transaction.atomic():
+        RoomNight.objects.all().delete()
+
+        for _, links in iter_booking_batches(batch_size):
+            nights = []
+            for booking_id, check_in, check_out, room_id in links:
+                nights += build_room_nights(booking_id, [room_id], check_in, check_out)
+            RoomNight.objects.bulk_create(nights, batch_size=batch_size, ignore_conflicts=True)
+            created += len(nights)
+
+    bump_version(AVAILABILITY)
+    return created
+
+
+def verify(batch_size=1000):
+    missing, extra = set(), set()
+
+    for batch, links in iter_booking_batches(batch_size):
+        expected = set()
+        for booking_id, check_in, check_out, room_id in links:
+            expected.update((booking_id, room_id, night) for night in get_nights(check_in, check_out))
+
+        actual = set(RoomNight.objects.filter(booking__in=batch).values_list('booking_id', 'room_id', 'date'))
+        missing |= expected - actual
+        extra |= actual - expected
+
+    orphans = RoomNight.objects.filter(booking__rooms__isnull=True)
+    extra.update(orphans.values_list('booking_id', 'room_id', 'date'))
+
+    return sorted(missing), sorted(extra)
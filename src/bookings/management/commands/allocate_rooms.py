@@ -0,0 +1,24 @@
+from datetime import date
+
+from django.core.management import BaseCommand
+
+from bookings.allocation import allocate_rooms
+
+
+class Command(BaseCommand):
+    help = 'Assigns free rooms to bookings without rooms.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', type=date.fromisoformat, help='Only bookings checking out after this date.')
+        parser.add_argument('--end', type=date.fromisoformat, help='Only bookings checking in before this date.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--dry-run', action='store_true', help='Compute the allocation without saving it.')
+
+    def handle(self, *args, start, end, batch_size, dry_run, **options):
+        allocation = allocate_rooms(start, end, dry_run=dry_run, batch_size=batch_size)
+
+        for booking_id in allocation.unassigned:
+            self.stderr.write(f'Unassignable: booking {booking_id}')
+
+        verb = 'Would assign' if dry_run else 'Assigned'
+        self.stdout.write(f'{verb} rooms to {len(allocation.assigned)} bookings, {len(allocation.unassigned)} left.')
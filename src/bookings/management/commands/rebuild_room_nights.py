@@ -0,0 +1,28 @@
+from django.core.management import BaseCommand, CommandError
+
+from bookings import ledger
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the per-night room occupancy ledger from bookings and verifies it.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--verify-only', action='store_true', help='Only compare the ledger with bookings.')
+
+    def handle(self, *args, batch_size, verify_only, **options):
+        if not verify_only:
+            created = ledger.rebuild(batch_size)
+            self.stdout.write(f'Written {created} room nights.')
+
+        missing, extra = ledger.verify(batch_size)
+
+        for booking_id, room_id, date in missing:
+            self.stderr.write(f'Missing: booking {booking_id}, room {room_id}, {date}')
+        for booking_id, room_id, date in extra:
+            self.stderr.write(f'Extra: booking {booking_id}, room {room_id}, {date}')
+
+        if missing or extra:
+            raise CommandError(f'Ledger does not match bookings: {len(missing)} missing, {len(extra)} extra.')
+
+        self.stdout.write(self.style.SUCCESS('Ledger matches bookings.'))
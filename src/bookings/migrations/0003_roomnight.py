@@ -0,0 +1,51 @@
+# Generated by Django 5.1.15 on 2026-10-18 11:29
+
+from datetime import timedelta
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def fill_room_nights(apps, schema_editor):
+    Booking = apps.get_model('bookings', 'Booking')
+    RoomNight = apps.get_model('bookings', 'RoomNight')
+    links = Booking.rooms.through.objects.values_list(
+        'booking_id', 'booking__check_in', 'booking__check_out', 'room_id'
+    )
+
+    nights = [
+        RoomNight(booking_id=booking_id, room_id=room_id, date=check_in + timedelta(days=night))
+        for booking_id, check_in, check_out, room_id in links.iterator()
+        for night in range((check_out - check_in).days)
+    ]
+    RoomNight.objects.bulk_create(nights, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('bookings', '0002_rename_is_children_booking_has_children'),
+        ('rooms', '0002_alter_roomdata_double_beds_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoomNight',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                (
+                    'booking',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name='nights', to='bookings.booking'
+                    ),
+                ),
+                ('room', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='rooms.room')),
+            ],
+            options={
+                'ordering': ['room', 'date'],
+                'indexes': [models.Index(fields=['date'], name='room_night_date_idx')],
+                'constraints': [models.UniqueConstraint(fields=('room', 'date'), name='unique_room_night')],
+            },
+        ),
+        migrations.RunPython(fill_room_nights, migrations.RunPython.noop),
+    ]
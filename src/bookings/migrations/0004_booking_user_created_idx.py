@@ -0,0 +1,19 @@
+# Generated by Django 5.1.15 on 2026-10-18 11:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('bookings', '0003_roomnight'),
+        ('rooms', '0002_alter_roomdata_double_beds_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['user', '-created', '-uuid'], name='booking_user_created_idx'),
+        ),
+    ]
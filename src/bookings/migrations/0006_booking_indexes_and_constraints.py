@@ -0,0 +1,37 @@
+# Generated by Django 5.1.15 on 2026-10-18 11:56
+
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('bookings', '0005_booking_idempotency_key'),
+        ('rooms', '0003_room_indexes_and_unique_slug'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='booking',
+            name='uuid',
+            field=models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['check_in', 'check_out'], name='booking_dates_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(condition=models.Q(('is_paid', False)), fields=['-created'], name='booking_unpaid_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='booking',
+            constraint=models.CheckConstraint(
+                condition=models.Q(('check_out__gte', models.F('check_in'))),
+                name='booking_check_out_after_check_in',
+                violation_error_message='Check out date cannot be earlier than check in date.',
+            ),
+        ),
+    ]
@@ -1,17 +1,30 @@
 from uuid import uuid4
 
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Coalesce
 
-from bookings.validators import validate_check_in_date, validate_check_out_date
-from rooms.models import TYPE, Room
+from bookings.validators import CHECK_OUT_DATE_ERROR_MESSAGE, validate_check_in_date, validate_check_out_date
+from rooms.models import TYPE, TYPE_LABELS, Room, RoomRateNight
 from utils.models import DateMixin
 
 User = get_user_model()
 
 
+class BookingQuerySet(models.QuerySet):
+    def with_rooms(self):
+        return self.prefetch_related('rooms__room_data')
+
+    def with_total_price(self):
+        rate = RoomRateNight.objects.filter(room_data=models.OuterRef('room__room_data'), date=models.OuterRef('date'))
+        price = Coalesce(models.Subquery(rate.values('price')[:1]), models.F('room__room_data__price'))
+        nights = RoomNight.objects.filter(booking=models.OuterRef('pk')).values('booking')
+        prices = nights.annotate(total=models.Sum(price)).values('total')
+        return self.annotate(total_price=models.Subquery(prices))
+
+
 class Booking(DateMixin):
-    uuid = models.UUIDField(default=uuid4, max_length=10, primary_key=True, unique=True)
+    uuid = models.UUIDField(default=uuid4, primary_key=True)
     user = models.ForeignKey(User, models.PROTECT)
     rooms = models.ManyToManyField(Room)
     persons = models.PositiveSmallIntegerField(default=1)
@@ -20,13 +33,33 @@ class Booking(DateMixin):
     is_paid = models.BooleanField(default=False)
     check_in = models.DateField()
     check_out = models.DateField()
+    idempotency_key = models.UUIDField(null=True, blank=True)
+
+    objects = BookingQuerySet.as_manager()
 
     def clean(self):
         validate_check_in_date(self.check_in)
         validate_check_out_date(self.check_out, self.check_in)
 
+    def validate_constraints(self, exclude=None):
+        # clean() already reports the order of dates, the check constraint only guards the database.
+        super().validate_constraints(exclude={*(exclude or ()), 'check_out'})
+
     class Meta:
         ordering = ['-created']
+        indexes = [
+            models.Index(fields=['user', '-created', '-uuid'], name='booking_user_created_idx'),
+            models.Index(fields=['check_in', 'check_out'], name='booking_dates_idx'),
+            models.Index(fields=['-created'], condition=models.Q(is_paid=False), name='booking_unpaid_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'idempotency_key'], name='unique_booking_idempotency_key'),
+            models.CheckConstraint(
+                condition=models.Q(check_out__gte=models.F('check_in')),
+                name='booking_check_out_after_check_in',
+                violation_error_message=CHECK_OUT_DATE_ERROR_MESSAGE,
+            ),
+        ]
 
     def __str__(self):
         return str(self.uuid)
@@ -36,8 +69,44 @@ class Booking(DateMixin):
         return ', '.join(rooms)
 
     def get_total_price(self):
-        prices = [room.room_data.price for room in self.rooms.all()]
-        return sum(prices)
+        if not hasattr(self, 'total_price'):
+            # Without with_total_price() the total is fetched once and kept like the annotation. An unsaved booking
+            # has no room nights to price.
+            bookings = Booking.objects.with_total_price().filter(pk=self.pk).values_list('total_price', flat=True)
+            self.total_price = None if self._state.adding else bookings.first()
+        return round(self.total_price or 0, 2)
 
     def get_str_type(self):
-        return TYPE.choices[self.type][1]
+        return TYPE_LABELS[self.type]
+
+    def save(self, *args, **kwargs):
+        if self._state.adding or not self.dates_changed:
+            return super().save(*args, **kwargs)
+
+        # Moving the dates rewrites the room nights in post_save, a clash must roll back the new dates as well.
+        with transaction.atomic(using=kwargs.get('using')):
+            return super().save(*args, **kwargs)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_dates = (instance.__dict__.get('check_in'), instance.__dict__.get('check_out'))
+        return instance
+
+    @property
+    def dates_changed(self):
+        return getattr(self, '_loaded_dates', None) != (self.check_in, self.check_out)
+
+
+class RoomNight(models.Model):
+    room = models.ForeignKey(Room, models.CASCADE)
+    booking = models.ForeignKey(Booking, models.CASCADE, related_name='nights')
+    date = models.DateField()
+
+    class Meta:
+        ordering = ['room', 'date']
+        constraints = [models.UniqueConstraint(fields=['room', 'date'], name='unique_room_night')]
+        indexes = [models.Index(fields=['date'], name='room_night_date_idx')]
+
+    def __str__(self):
+        return f'{self.room} {self.date}'
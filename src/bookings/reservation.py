@@ -0,0 +1,27 @@
+from django.db import IntegrityError, transaction
+
+from bookings.availability import CAPACITY, get_free_rooms
+
+
+def get_lockable_free_rooms(booking):
+    rooms = get_free_rooms(booking.check_in, booking.check_out, booking.type, booking.persons, exclude=booking)
+    return rooms.select_for_update(skip_locked=True, of=('self',)).order_by(CAPACITY.asc(), 'pk')
+
+
+def reserve(booking, attempts=3):
+    room = None
+
+    with transaction.atomic():
+        booking.save()
+
+        for _ in range(attempts):
+            try:
+                with transaction.atomic():
+                    room = get_lockable_free_rooms(booking).first()
+                    if room is not None:
+                        booking.rooms.add(room)
+                break
+            except IntegrityError:
+                room = None
+
+    return room
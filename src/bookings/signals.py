@@ -0,0 +1,57 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from bookings.cache import AVAILABILITY
+from bookings.ledger import add_room_nights, write_booking_nights
+from bookings.models import Booking, RoomNight
+from utils.cache import bump_version
+
+
+@receiver(m2m_changed, sender=Booking.rooms.through)
+def sync_room_nights(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == 'post_add':
+        if reverse:
+            for booking in Booking.objects.filter(pk__in=pk_set):
+                add_room_nights(booking, [instance.pk])
+        else:
+            add_room_nights(instance, pk_set)
+
+    elif action == 'post_remove':
+        if reverse:
+            RoomNight.objects.filter(room=instance, booking__in=pk_set).delete()
+        else:
+            RoomNight.objects.filter(booking=instance, room__in=pk_set).delete()
+
+    elif action == 'post_clear':
+        lookup = 'room' if reverse else 'booking'
+        RoomNight.objects.filter(**{lookup: instance}).delete()
+
+
+@receiver(post_save, sender=Booking)
+def move_room_nights(sender, instance, created, raw=False, **kwargs):
+    if not created and not raw and instance.dates_changed:
+        write_booking_nights(instance)
+    instance._loaded_dates = (instance.check_in, instance.check_out)
+
+
+@receiver(m2m_changed, sender=Booking.rooms.through)
+@receiver([post_save, post_delete], sender=Booking)
+def invalidate_availability(sender, action=None, **kwargs):
+    if action is None or action.startswith('post_'):
+        bump_version(AVAILABILITY)
+
+
+@receiver(m2m_changed, sender=Booking.rooms.through)
+def touch_bookings(sender, instance, action, reverse, pk_set, **kwargs):
+    now = timezone.now()
+
+    if reverse:
+        if action in ('post_add', 'post_remove'):
+            Booking.objects.filter(pk__in=pk_set).update(updated=now)
+        elif action == 'pre_clear':
+            Booking.objects.filter(rooms=instance).update(updated=now)
+
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        Booking.objects.filter(pk=instance.pk).update(updated=now)
+        instance.updated = now
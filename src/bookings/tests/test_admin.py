@@ -0,0 +1,31 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from accounts.tests import create_test_user
+from bookings.tests.test_models import create_test_booking
+from rooms.tests.test_models import create_test_room, create_test_room_data
+
+User = get_user_model()
+
+
+class BookingAdminTest(TestCase):
+    def setUp(self) -> None:
+        self.admin = User.objects.create_superuser('admin@test.com', 'qwe123!@#')
+        self.client.force_login(self.admin)
+        room_data = create_test_room_data()
+        self.room_1 = create_test_room(room_data, number='1')
+        self.room_2 = create_test_room(room_data, number='2')
+        self.room_3 = create_test_room(room_data, number='3')
+        self.booking = create_test_booking()
+        self.booking.rooms.add(self.room_1)
+        other_booking = create_test_booking(create_test_user('morty@test.com'))
+        other_booking.rooms.add(self.room_2)
+
+    def test_rooms_field_offers_only_free_and_assigned_rooms(self):
+        url = reverse('admin:bookings_booking_change', args=[self.booking.pk])
+        response = self.client.get(url)
+
+        queryset = response.context['adminform'].form.fields['rooms'].queryset
+
+        self.assertQuerySetEqual(queryset, [self.room_1, self.room_3])
@@ -0,0 +1,139 @@
+from datetime import date, timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.tests import create_test_user
+from bookings import ledger
+from bookings import allocation
+from bookings.allocation import PendingBooking, allocate, allocate_rooms
+from bookings.availability import AvailabilityIndex
+from bookings.models import Booking
+from bookings.tests.test_models import create_test_booking
+from rooms.models import TYPE
+from rooms.tests.test_models import create_test_room, create_test_room_data
+
+DAY = timedelta(days=1)
+User = get_user_model()
+
+
+class AllocateTest(SimpleTestCase):
+    def setUp(self) -> None:
+        self.start = date(2024, 1, 10)
+        self.index = AvailabilityIndex([(1, TYPE.STANDARD, 2), (2, TYPE.STANDARD, 4), (3, TYPE.LUXE, 2)])
+
+    def create_booking(self, pk, check_in, nights, persons=1, type=TYPE.STANDARD):
+        check_in = self.start + DAY * check_in
+        return PendingBooking(pk, type, persons, check_in, check_in + DAY * nights)
+
+    def test_allocate_prefers_smallest_room_that_fits(self):
+        allocation = allocate([self.create_booking('a', 0, 2), self.create_booking('b', 0, 2, persons=3)], self.index)
+
+        self.assertEqual(allocation.assigned, {'a': 1, 'b': 2})
+        self.assertEqual(allocation.unassigned, [])
+
+    def test_allocate_reuses_room_after_check_out(self):
+        bookings = [self.create_booking('a', 0, 2), self.create_booking('b', 2, 2), self.create_booking('c', 1, 3)]
+
+        allocation = allocate(bookings, self.index)
+
+        self.assertEqual(allocation.assigned, {'a': 1, 'c': 2, 'b': 1})
+
+    def test_allocate_picks_room_with_tightest_gap(self):
+        index = AvailabilityIndex([(1, TYPE.STANDARD, 2), (2, TYPE.STANDARD, 2)])
+        bookings = [self.create_booking('a', 0, 1), self.create_booking('b', 0, 3), self.create_booking('c', 3, 1)]
+
+        allocation = allocate(bookings, index)
+
+        self.assertEqual(allocation.assigned['c'], allocation.assigned['b'])
+
+    def test_allocate_respects_existing_bookings(self):
+        self.index.add_booking(1, self.start, self.start + DAY * 5)
+
+        allocation = allocate([self.create_booking('a', 1, 1)], self.index)
+
+        self.assertEqual(allocation.assigned, {'a': 2})
+
+    def test_allocate_reports_unassignable_bookings(self):
+        bookings = [
+            self.create_booking('a', 0, 1, persons=5),
+            self.create_booking('b', 0, 1, type=TYPE.ECONOMY),
+            self.create_booking('c', 0, 1, type=TYPE.LUXE),
+            self.create_booking('d', 0, 1, type=TYPE.LUXE),
+        ]
+
+        allocation = allocate(bookings, self.index)
+
+        self.assertEqual(allocation.assigned, {'c': 3})
+        self.assertEqual(allocation.unassigned, ['a', 'b', 'd'])
+
+
+class AllocateRoomsTest(TestCase):
+    def setUp(self) -> None:
+        self.check_in = timezone.now().date() + DAY
+        room_data = create_test_room_data(single_beds=2)
+        self.room_1 = create_test_room(room_data, number='1')
+        self.room_2 = create_test_room(room_data, number='2')
+        self.user = create_test_user()
+        self.booking_1 = create_test_booking(self.user, self.check_in, self.check_in + DAY * 2, persons=2)
+        self.booking_2 = create_test_booking(self.user, self.check_in, self.check_in + DAY * 2, persons=2)
+        self.booking_3 = create_test_booking(self.user, self.check_in + DAY, self.check_in + DAY * 2, persons=1)
+
+    def test_allocate_rooms_assigns_rooms_and_writes_ledger(self):
+        allocation = allocate_rooms()
+
+        self.assertEqual(len(allocation.assigned), 2)
+        self.assertEqual(allocation.unassigned, [self.booking_3.pk])
+        self.assertEqual(Booking.objects.filter(rooms__isnull=False).count(), 2)
+        self.assertEqual(ledger.verify(), ([], []))
+
+    def test_allocate_rooms_skips_bookings_with_rooms_and_outside_window(self):
+        self.booking_1.rooms.add(self.room_1)
+
+        allocation = allocate_rooms(self.check_in + DAY, self.check_in + DAY * 2)
+
+        self.assertEqual(allocation.assigned, {self.booking_2.pk: self.room_2.pk})
+        self.assertEqual(allocation.unassigned, [self.booking_3.pk])
+
+    def test_allocate_rooms_leaves_bookings_whose_room_was_reserved_after_planning_unassigned(self):
+        def allocate_and_reserve(bookings, index):
+            planned = allocate(bookings, index)
+            booking = create_test_booking(self.user, self.check_in + DAY, self.check_in + DAY * 3)
+            booking.rooms.add(planned.assigned[self.booking_1.pk])
+            return planned
+
+        with patch.object(allocation, 'allocate', allocate_and_reserve):
+            result = allocate_rooms()
+
+        self.assertNotIn(self.booking_1.pk, result.assigned)
+        self.assertIn(self.booking_2.pk, result.assigned)
+        self.assertEqual(sorted(result.unassigned), sorted([self.booking_1.pk, self.booking_3.pk]))
+        self.assertFalse(self.booking_1.rooms.exists())
+        self.assertTrue(self.booking_2.rooms.exists())
+        self.assertEqual(ledger.verify(), ([], []))
+
+    def test_allocate_rooms_doesnt_save_in_dry_run(self):
+        allocate_rooms(dry_run=True)
+
+        self.assertFalse(Booking.objects.filter(rooms__isnull=False).exists())
+
+    def test_command_reports_assigned_and_unassignable_bookings(self):
+        stdout, stderr = StringIO(), StringIO()
+
+        call_command('allocate_rooms', stdout=stdout, stderr=stderr)
+
+        self.assertIn('Assigned rooms to 2 bookings, 1 left.', stdout.getvalue())
+        self.assertIn(str(self.booking_3.pk), stderr.getvalue())
+
+    def test_admin_action_assigns_rooms_to_selected_bookings(self):
+        self.client.force_login(User.objects.create_superuser('admin@test.com', 'qwe123!@#'))
+        data = {'action': 'assign_rooms', '_selected_action': [self.booking_1.pk]}
+
+        self.client.post(reverse('admin:bookings_booking_changelist'), data)
+
+        self.assertEqual(list(Booking.objects.filter(rooms__isnull=False)), [self.booking_1])
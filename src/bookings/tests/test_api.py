@@ -0,0 +1,80 @@
+import json
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.tests import create_test_user
+from bookings.tests.test_models import create_test_booking
+from rooms.models import TYPE
+from rooms.tests.test_models import create_test_room, create_test_room_data
+
+DAY = timedelta(days=1)
+
+
+class AvailabilityViewTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.url = reverse('api:availability')
+        self.check_in = timezone.now().date() + DAY
+        self.standard = create_test_room_data(slug='standard', price='100', single_beds=2)
+        self.luxe = create_test_room_data(slug='luxe', price='500', type=TYPE.LUXE, double_beds=2)
+        self.room_1 = create_test_room(self.standard, number='1')
+        self.room_2 = create_test_room(self.standard, number='2')
+        self.room_3 = create_test_room(self.luxe, number='3')
+        self.query = {'check_in': self.check_in, 'check_out': self.check_in + DAY * 2}
+
+    def get_results(self, **query):
+        response = self.client.get(self.url, {**self.query, **query})
+        return json.loads(b''.join(response.streaming_content))['results']
+
+    def test_view_returns_free_room_types_with_counts_and_prices(self):
+        results = self.get_results()
+
+        self.assertEqual(
+            results,
+            [
+                {
+                    'slug': 'standard',
+                    'name': 'title',
+                    'room_type': TYPE.STANDARD,
+                    'capacity': 2,
+                    'price': '100.00',
+                    'free_rooms': 2,
+                },
+                {
+                    'slug': 'luxe',
+                    'name': 'title',
+                    'room_type': TYPE.LUXE,
+                    'capacity': 4,
+                    'price': '500.00',
+                    'free_rooms': 1,
+                },
+            ],
+        )
+
+    def test_view_filters_by_type_and_persons(self):
+        self.assertEqual([result['slug'] for result in self.get_results(type=TYPE.LUXE)], ['luxe'])
+        self.assertEqual([result['slug'] for result in self.get_results(persons=3)], ['luxe'])
+
+    def test_view_returns_errors_for_invalid_query(self):
+        response = self.client.get(self.url, {'check_in': 'x'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('check_in', response.json()['errors'])
+
+    def test_view_serves_repeated_query_from_cache(self):
+        self.get_results()
+
+        with self.assertNumQueries(0):
+            self.get_results()
+
+    def test_view_cache_is_invalidated_on_booking_changes(self):
+        self.get_results()
+        booking = create_test_booking(create_test_user(), self.check_in, self.check_in + DAY)
+
+        booking.rooms.add(self.room_3)
+
+        self.assertEqual([result['slug'] for result in self.get_results()], ['standard'])
@@ -0,0 +1,110 @@
+from datetime import date, timedelta
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from bookings.availability import AvailabilityIndex, RoomIntervals, get_free_rooms
+from bookings.tests.test_models import create_test_booking
+from rooms.models import TYPE
+from rooms.tests.test_models import create_test_room, create_test_room_data
+
+DAY = timedelta(days=1)
+
+
+class RoomIntervalsTest(SimpleTestCase):
+    def setUp(self) -> None:
+        self.start = date(2024, 1, 10)
+        self.intervals = RoomIntervals()
+        self.intervals.add(self.start, self.start + DAY * 5)
+
+    def test_room_is_free_before_and_after_interval(self):
+        self.assertTrue(self.intervals.is_free(self.start - DAY * 3, self.start))
+        self.assertTrue(self.intervals.is_free(self.start + DAY * 5, self.start + DAY * 7))
+
+    def test_room_is_not_free_for_overlapping_interval(self):
+        self.assertFalse(self.intervals.is_free(self.start - DAY, self.start + DAY))
+        self.assertFalse(self.intervals.is_free(self.start + DAY, self.start + DAY * 2))
+        self.assertFalse(self.intervals.is_free(self.start + DAY * 4, self.start + DAY * 9))
+
+    def test_room_is_not_free_inside_long_interval_added_before_short_one(self):
+        self.intervals.add(self.start + DAY, self.start + DAY * 2)
+
+        self.assertFalse(self.intervals.is_free(self.start + DAY * 3, self.start + DAY * 4))
+
+    def test_empty_intervals_are_ignored(self):
+        intervals = RoomIntervals()
+        intervals.add(self.start, self.start)
+
+        self.assertEqual(len(intervals), 0)
+
+
+class AvailabilityIndexTest(SimpleTestCase):
+    def setUp(self) -> None:
+        self.start = date(2024, 1, 10)
+        self.index = AvailabilityIndex(
+            [
+                (1, TYPE.STANDARD, 2),
+                (2, TYPE.STANDARD, 4),
+                (3, TYPE.LUXE, 2),
+            ]
+        )
+
+    def test_free_rooms_returns_all_rooms_without_bookings(self):
+        self.assertEqual(sorted(self.index.free_rooms(self.start, self.start + DAY)), [1, 2, 3])
+
+    def test_free_rooms_filters_by_type_and_persons(self):
+        self.assertEqual(self.index.free_rooms(self.start, self.start + DAY, TYPE.STANDARD), [1, 2])
+        self.assertEqual(self.index.free_rooms(self.start, self.start + DAY, TYPE.STANDARD, 3), [2])
+        self.assertEqual(self.index.free_rooms(self.start, self.start + DAY, TYPE.ECONOMY), [])
+
+    def test_free_rooms_excludes_booked_rooms(self):
+        self.index.add_booking(1, self.start, self.start + DAY * 3)
+
+        self.assertEqual(self.index.free_rooms(self.start + DAY, self.start + DAY * 2, TYPE.STANDARD), [2])
+        self.assertEqual(self.index.free_rooms(self.start + DAY * 3, self.start + DAY * 4, TYPE.STANDARD), [1, 2])
+
+
+class AvailabilityFromDatabaseTest(TestCase):
+    def setUp(self) -> None:
+        self.check_in = timezone.now().date() + DAY
+        self.check_out = self.check_in + DAY * 5
+        self.room_data = create_test_room_data(single_beds=2, double_beds=1)
+        self.room_1 = create_test_room(self.room_data, number='1')
+        self.room_2 = create_test_room(self.room_data, number='2')
+        self.booking = create_test_booking(check_in=self.check_in, check_out=self.check_out)
+        self.booking.rooms.add(self.room_1)
+
+    def test_get_free_rooms_excludes_rooms_of_overlapping_bookings(self):
+        rooms = get_free_rooms(self.check_in + DAY, self.check_out + DAY)
+
+        self.assertQuerySetEqual(rooms, [self.room_2])
+
+    def test_get_free_rooms_returns_rooms_after_check_out(self):
+        rooms = get_free_rooms(self.check_out, self.check_out + DAY)
+
+        self.assertQuerySetEqual(rooms, [self.room_1, self.room_2])
+
+    def test_get_free_rooms_filters_by_type_and_persons(self):
+        self.assertQuerySetEqual(
+            get_free_rooms(self.check_out, self.check_out + DAY, persons=4), [self.room_1, self.room_2]
+        )
+        self.assertQuerySetEqual(get_free_rooms(self.check_out, self.check_out + DAY, persons=5), [])
+        self.assertQuerySetEqual(get_free_rooms(self.check_out, self.check_out + DAY, type=TYPE.LUXE), [])
+
+    def test_get_free_rooms_ignores_excluded_booking(self):
+        rooms = get_free_rooms(self.check_in, self.check_out, exclude=self.booking)
+
+        self.assertQuerySetEqual(rooms, [self.room_1, self.room_2])
+
+    def test_get_free_rooms_excludes_unavailable_rooms(self):
+        self.room_2.is_available = False
+        self.room_2.save()
+
+        self.assertQuerySetEqual(get_free_rooms(self.check_out, self.check_out + DAY), [self.room_1])
+
+    def test_index_from_db_matches_get_free_rooms(self):
+        index = AvailabilityIndex.from_db(self.check_in, self.check_out)
+
+        self.assertEqual(index.free_rooms(self.check_in, self.check_out), [self.room_2.pk])
+        self.assertEqual(index.free_rooms(self.check_in, self.check_out, persons=4), [self.room_2.pk])
+        self.assertEqual(index.free_rooms(self.check_in, self.check_out, persons=5), [])
@@ -0,0 +1,81 @@
+import csv
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from accounts.tests import create_test_user
+from bookings.exports import iter_bookings
+from bookings.tests.test_models import create_test_booking
+from rooms.tests.test_models import create_test_room, create_test_room_data
+
+User = get_user_model()
+
+
+class ExportBookingsTest(TestCase):
+    def setUp(self) -> None:
+        self.user = create_test_user()
+        room_data = create_test_room_data(price='100')
+        self.room_1 = create_test_room(room_data, number='1')
+        self.room_2 = create_test_room(room_data, number='2')
+        self.booking = create_test_booking(self.user, is_paid=True)
+        self.booking.rooms.add(self.room_1, self.room_2)
+
+    def test_iter_bookings_returns_accounting_fields(self):
+        row = next(iter_bookings())
+
+        self.assertEqual(row['uuid'], self.booking.uuid)
+        self.assertEqual(row['email'], self.user.email)
+        self.assertEqual(row['rooms'], '1, 2')
+        self.assertEqual(row['total_price'], self.booking.get_total_price())
+        self.assertTrue(row['is_paid'])
+
+    def test_iter_bookings_queries_per_chunk_not_per_booking(self):
+        room_data = create_test_room_data()
+        for number in range(3, 12):
+            create_test_booking(self.user).rooms.add(create_test_room(room_data, number=str(number)))
+
+        with self.assertNumQueries(5):
+            rows = list(iter_bookings(chunk_size=5))
+
+        self.assertEqual(len(rows), 10)
+
+    def test_command_writes_csv(self):
+        stdout = StringIO()
+
+        call_command('export_bookings', '-', '--format', 'csv', stdout=stdout)
+
+        rows = list(csv.DictReader(StringIO(stdout.getvalue())))
+        self.assertEqual(rows[0]['email'], self.user.email)
+        self.assertEqual(rows[0]['is_paid'], 'True')
+
+    def test_command_writes_file_in_format_of_extension(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'bookings.jsonl')
+
+            call_command('export_bookings', path)
+
+            with open(path) as file:
+                rows = [json.loads(line) for line in file]
+        self.assertEqual(rows[0]['uuid'], str(self.booking.uuid))
+
+    def test_command_rejects_unknown_format(self):
+        with self.assertRaisesRegex(CommandError, 'Unknown format "txt"'):
+            call_command('export_bookings', 'bookings.txt', stdout=StringIO())
+
+    def test_admin_action_streams_selected_bookings(self):
+        create_test_booking(self.user)
+        self.client.force_login(User.objects.create_superuser('admin@test.com', 'qwe123!@#'))
+        data = {'action': 'export_jsonl', '_selected_action': [self.booking.pk]}
+
+        response = self.client.post(reverse('admin:bookings_booking_changelist'), data)
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="bookings.jsonl"')
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        self.assertEqual([row['uuid'] for row in rows], [str(self.booking.uuid)])
@@ -1,13 +1,22 @@
-from datetime import timedelta, datetime
+import threading
+from datetime import date, timedelta, datetime
+from unittest.mock import patch
+from uuid import uuid4
 
+from django.db import IntegrityError, connection
+from django.test import TransactionTestCase
 
 from accounts.tests import create_test_user
 from bookings.forms import BookingCreateForm, NO_PERSONS_ERROR_MESSAGE
-from bookings.models import Booking
+from bookings.models import Booking, RoomNight
+from bookings.tests.test_models import create_test_booking
 from bookings.validators import PAST_DATE_ERROR_MESSAGE, CHECK_OUT_DATE_ERROR_MESSAGE
 from rooms.models import TYPE
+from rooms.tests.test_models import create_test_room, create_test_room_data
 from utils.cases import FormTestCase
 
+DAY = timedelta(days=1)
+
 
 class BookingCreateFormTest(FormTestCase):
     def setUp(self) -> None:
@@ -29,6 +38,7 @@ class BookingCreateFormTest(FormTestCase):
             'has_children',
             'check_in',
             'check_out',
+            'idempotency_key',
         ]
 
         fields = self.get_fields(self.Form, only_names=True, user=self.user)
@@ -85,3 +95,99 @@ class BookingCreateFormTest(FormTestCase):
         booking = form.save()
 
         self.assertEqual(booking.user.pk, self.user.pk)
+
+    def test_form_generates_idempotency_key_for_unbound_form(self):
+        form = self.Form(user=self.user)
+
+        self.assertIsNotNone(form['idempotency_key'].value())
+        self.assertNotEqual(form['idempotency_key'].value(), self.Form(user=self.user)['idempotency_key'].value())
+
+    def test_form_returns_original_booking_for_repeated_idempotency_key(self):
+        self.data['idempotency_key'] = uuid4()
+        booking = self.Form(data=self.data, user=self.user)
+        booking.is_valid()
+        booking = booking.save()
+
+        form = self.Form(data=self.data, user=self.user)
+        form.is_valid()
+
+        self.assertEqual(form.save(), booking)
+        self.assertEqual(Booking.objects.count(), 1)
+
+    def test_form_assigns_free_room_on_save(self):
+        room = create_test_room(create_test_room_data(single_beds=10))
+        form = self.Form(data=self.data, user=self.user)
+        form.is_valid()
+
+        booking = form.save()
+
+        self.assertEqual(list(booking.rooms.all()), [room])
+        self.assertEqual(booking.nights.count(), 9)
+
+    def test_form_leaves_booking_without_room_if_no_room_is_free(self):
+        create_test_room(create_test_room_data(single_beds=1))
+        form = self.Form(data=self.data, user=self.user)
+        form.is_valid()
+
+        booking = form.save()
+
+        self.assertFalse(booking.rooms.exists())
+        self.assertIsNone(form.room)
+
+    def test_form_reports_reserved_room(self):
+        room = create_test_room(create_test_room_data(single_beds=10))
+        form = self.Form(data=self.data, user=self.user)
+        form.is_valid()
+
+        form.save()
+
+        self.assertEqual(form.room, room)
+
+    def test_form_reraises_integrity_error_if_no_booking_has_idempotency_key(self):
+        self.data['idempotency_key'] = uuid4()
+        form = self.Form(data=self.data, user=self.user)
+        form.is_valid()
+
+        with patch('bookings.forms.reserve', side_effect=IntegrityError), self.assertRaises(IntegrityError):
+            form.save()
+
+    def test_form_returns_booking_saved_concurrently_with_same_idempotency_key(self):
+        self.data['idempotency_key'] = uuid4()
+        form = self.Form(data=self.data, user=self.user)
+        form.is_valid()
+        booking = create_test_booking(self.user, idempotency_key=self.data['idempotency_key'])
+
+        with (
+            patch.object(form, 'get_booking_by_key', side_effect=[None, booking]),
+            patch('bookings.forms.reserve', side_effect=IntegrityError),
+        ):
+            self.assertEqual(form.save(), booking)
+
+
+class BookingCreateFormConcurrencyTest(TransactionTestCase):
+    def setUp(self) -> None:
+        self.room = create_test_room(create_test_room_data(single_beds=2))
+        self.check_in = date.today() + timedelta(days=1)
+
+    def book(self, user, results):
+        data = {'persons': 2, 'type': TYPE.STANDARD, 'check_in': self.check_in, 'check_out': self.check_in + DAY * 3}
+        try:
+            form = BookingCreateForm(data=data, user=user)
+            form.is_valid()
+            results.append(form.save())
+        finally:
+            connection.close()
+
+    def test_only_one_of_racing_bookings_gets_the_last_room(self):
+        users = [create_test_user(email=f'user{i}@test.com') for i in range(8)]
+        results = []
+        threads = [threading.Thread(target=self.book, args=(user, results)) for user in users]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), len(users))
+        self.assertEqual(Booking.objects.filter(rooms=self.room).count(), 1)
+        self.assertEqual(RoomNight.objects.filter(room=self.room).count(), 3)
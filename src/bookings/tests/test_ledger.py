@@ -0,0 +1,166 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+from django.utils import timezone
+
+from accounts.tests import create_test_user
+from bookings import ledger
+from bookings.models import RoomNight
+from bookings.tests.test_models import create_test_booking
+from rooms.tests.test_models import create_test_room, create_test_room_data
+
+DAY = timedelta(days=1)
+
+
+class LedgerTestMixin:
+    def setUp(self) -> None:
+        self.check_in = timezone.now().date() + DAY
+        self.check_out = self.check_in + DAY * 3
+        room_data = create_test_room_data()
+        self.room_1 = create_test_room(room_data, number='1')
+        self.room_2 = create_test_room(room_data, number='2')
+        self.booking = create_test_booking(check_in=self.check_in, check_out=self.check_out)
+
+    def get_nights(self, booking=None):
+        nights = RoomNight.objects.filter(booking=booking or self.booking)
+        return list(nights.values_list('room__number', 'date'))
+
+
+class GetNightsTest(TestCase):
+    def test_get_nights_returns_dates_without_check_out_date(self):
+        check_in = timezone.now().date()
+
+        self.assertEqual(ledger.get_nights(check_in, check_in + DAY * 2), [check_in, check_in + DAY])
+
+    def test_get_nights_accepts_datetimes(self):
+        check_in = timezone.now()
+
+        self.assertEqual(ledger.get_nights(check_in, check_in + DAY), [check_in.date()])
+
+    def test_get_nights_returns_nothing_for_same_day(self):
+        check_in = timezone.now().date()
+
+        self.assertEqual(ledger.get_nights(check_in, check_in), [])
+
+
+class RoomNightSignalsTest(LedgerTestMixin, TestCase):
+    def test_adding_rooms_writes_nights(self):
+        self.booking.rooms.add(self.room_1)
+
+        expected_nights = [('1', self.check_in + DAY * night) for night in range(3)]
+        self.assertEqual(self.get_nights(), expected_nights)
+
+    def test_adding_booking_to_room_writes_nights(self):
+        self.room_2.booking_set.add(self.booking)
+
+        self.assertEqual(len(self.get_nights()), 3)
+
+    def test_removing_rooms_deletes_nights(self):
+        self.booking.rooms.add(self.room_1, self.room_2)
+        self.booking.rooms.remove(self.room_1)
+
+        self.assertEqual({number for number, _ in self.get_nights()}, {'2'})
+
+    def test_clearing_rooms_deletes_nights(self):
+        self.booking.rooms.add(self.room_1, self.room_2)
+        self.booking.rooms.clear()
+
+        self.assertEqual(self.get_nights(), [])
+
+    def test_moving_dates_rewrites_nights(self):
+        self.booking.rooms.add(self.room_1)
+        self.booking.check_out += DAY
+
+        self.booking.save()
+
+        self.assertEqual(len(self.get_nights()), 4)
+        self.assertEqual(self.get_nights()[-1], ('1', self.check_out))
+
+    def test_moving_dates_onto_booked_nights_keeps_old_dates_and_nights(self):
+        self.booking.rooms.add(self.room_1)
+        other_booking = create_test_booking(create_test_user('morty@test.com'), self.check_out, self.check_out + DAY)
+        other_booking.rooms.add(self.room_1)
+        nights = self.get_nights()
+        self.booking.check_out += DAY
+
+        with self.assertRaises(IntegrityError):
+            self.booking.save()
+
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.check_out, self.check_out)
+        self.assertEqual(self.get_nights(), nights)
+
+    def test_saving_without_moving_dates_doesnt_touch_nights(self):
+        self.booking.rooms.add(self.room_1)
+
+        with self.assertNumQueries(1):
+            self.booking.save()
+
+    def test_database_rejects_double_booking(self):
+        self.booking.rooms.add(self.room_1)
+        other_booking = create_test_booking(
+            create_test_user('morty@test.com'), self.check_in + DAY, self.check_out + DAY
+        )
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            other_booking.rooms.add(self.room_1)
+
+        self.assertFalse(other_booking.rooms.exists())
+        self.assertEqual(self.get_nights(other_booking), [])
+
+    def test_deleting_booking_deletes_nights(self):
+        self.booking.rooms.add(self.room_1)
+        self.booking.delete()
+
+        self.assertEqual(RoomNight.objects.count(), 0)
+
+
+class LedgerRebuildTest(LedgerTestMixin, TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.booking.rooms.add(self.room_1, self.room_2)
+
+    def test_verify_returns_no_differences_for_consistent_ledger(self):
+        self.assertEqual(ledger.verify(), ([], []))
+
+    def test_verify_finds_missing_and_extra_nights(self):
+        RoomNight.objects.filter(room=self.room_1, date=self.check_in).delete()
+        RoomNight.objects.filter(room=self.room_2, date=self.check_in).update(date=self.check_out)
+
+        missing, extra = ledger.verify()
+
+        self.assertEqual(len(missing), 2)
+        self.assertEqual(extra, [(self.booking.pk, self.room_2.pk, self.check_out)])
+
+    def test_rebuild_restores_ledger(self):
+        RoomNight.objects.all().delete()
+
+        created = ledger.rebuild(batch_size=1)
+
+        self.assertEqual(created, 6)
+        self.assertEqual(ledger.verify(), ([], []))
+
+    def test_get_occupancy_returns_rooms_per_date(self):
+        occupancy = ledger.get_occupancy(self.check_in, self.check_in + DAY * 2)
+
+        self.assertEqual(
+            list(occupancy), [{'date': self.check_in, 'rooms': 2}, {'date': self.check_in + DAY, 'rooms': 2}]
+        )
+
+    def test_command_rebuilds_and_verifies_ledger(self):
+        RoomNight.objects.all().delete()
+        stdout = StringIO()
+
+        call_command('rebuild_room_nights', batch_size=1, stdout=stdout)
+
+        self.assertIn('Written 6 room nights.', stdout.getvalue())
+        self.assertEqual(RoomNight.objects.count(), 6)
+
+    def test_command_fails_if_ledger_does_not_match(self):
+        RoomNight.objects.all().delete()
+
+        with self.assertRaises(CommandError):
+            call_command('rebuild_room_nights', verify_only=True, stdout=StringIO(), stderr=StringIO())
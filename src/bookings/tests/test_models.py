@@ -1,15 +1,17 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from unittest import skipUnless
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import IntegrityError, connection, models
 from django.utils import timezone
 
 from accounts.tests import create_test_user
 from bookings.models import Booking
 from bookings.validators import PAST_DATE_ERROR_MESSAGE, CHECK_OUT_DATE_ERROR_MESSAGE
-from rooms.models import TYPE, Room
-from rooms.tests.test_models import create_test_room
+from rooms.models import TYPE, Room, RoomRate
+from rooms.tests.test_models import create_test_room, create_test_room_data
 from utils.cases import ModelTestCase
 
 User = get_user_model()
@@ -97,7 +99,7 @@ class BookingModelTest(ModelTestCase):
     def test_check_out_field_cannot_be_past_date(self):
         check_in = datetime.now() + timedelta(days=1)
         invalid_check_out = datetime.now() - timedelta(days=10)
-        booking = create_test_booking(check_in=check_in.date(), check_out=invalid_check_out.date())
+        booking = Booking(user=create_test_user(), check_in=check_in.date(), check_out=invalid_check_out.date())
 
         with self.assertRaisesRegex(ValidationError, PAST_DATE_ERROR_MESSAGE):
             booking.full_clean()
@@ -105,11 +107,17 @@ class BookingModelTest(ModelTestCase):
     def test_check_out_field_cannot_be_earlier_than_check_in_date(self):
         check_in = datetime.now() + timedelta(days=10)
         invalid_check_out = check_in - timedelta(days=1)
-        booking = create_test_booking(check_in=check_in.date(), check_out=invalid_check_out.date())
+        booking = Booking(user=create_test_user(), check_in=check_in.date(), check_out=invalid_check_out.date())
 
         with self.assertRaisesRegex(ValidationError, CHECK_OUT_DATE_ERROR_MESSAGE):
             booking.full_clean()
 
+    def test_database_rejects_check_out_earlier_than_check_in_date(self):
+        check_in = datetime.now() + timedelta(days=10)
+
+        with self.assertRaises(IntegrityError):
+            create_test_booking(check_in=check_in.date(), check_out=(check_in - timedelta(days=1)).date())
+
     def test_model_instances_are_ordered_by_descending_created_date(self):
         attr = self.get_meta_attr(self.Model, 'ordering')
         self.assertIn('-created', attr)
@@ -130,10 +138,58 @@ class BookingModelTest(ModelTestCase):
         bookings.rooms.add(room_1)
         bookings.rooms.add(room_2)
 
-        expected_total_price = sum([room.room_data.price for room in bookings.rooms.all()])
+        nights = (bookings.check_out - bookings.check_in).days
+        expected_total_price = sum([room.room_data.price for room in bookings.rooms.all()]) * nights
 
         self.assertEqual(bookings.get_total_price(), expected_total_price)
 
+    def test_get_total_price_method_queries_once_without_annotation(self):
+        create_test_booking().rooms.add(create_test_room(create_test_room_data(price='100')))
+        booking = Booking.objects.get()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(booking.get_total_price(), Decimal('1000.00'))
+            self.assertEqual(booking.get_total_price(), Decimal('1000.00'))
+
+    def test_get_total_price_method_returns_zero_for_unsaved_booking(self):
+        booking = Booking(check_in=date(2030, 1, 1), check_out=date(2030, 1, 2))
+
+        with self.assertNumQueries(0):
+            self.assertEqual(booking.get_total_price(), 0)
+
+    def test_get_total_price_and_get_str_rooms_use_prefetched_and_annotated_values(self):
+        room_1 = create_test_room(number='1')
+        room_2 = create_test_room(number='2')
+        create_test_booking().rooms.add(room_1, room_2)
+        expected_total_price = sum([room.room_data.price for room in Room.objects.select_related('room_data')]) * 10
+
+        booking = Booking.objects.with_rooms().with_total_price().get()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(booking.get_total_price(), expected_total_price)
+            self.assertEqual(booking.get_str_rooms(), '1, 2')
+
+    def test_with_total_price_uses_nightly_rates_and_falls_back_to_base_price(self):
+        room = create_test_room(create_test_room_data(price='100'), number='1')
+        booking = create_test_booking(check_in=date(2030, 1, 1), check_out=date(2030, 1, 5))
+        booking.rooms.add(room)
+        RoomRate.objects.create(room_data=room.room_data, start=date(2030, 1, 2), end=date(2030, 1, 4), price='150')
+
+        booking = Booking.objects.with_total_price().get()
+
+        self.assertEqual(booking.get_total_price(), Decimal('500.00'))
+
     def test_get_str_type_method_returns_correct_type(self):
         booking = Booking(type=TYPE.LUXE)
         self.assertEqual(booking.get_str_type(), TYPE.choices[booking.type][1])
+
+    @skipUnless(connection.vendor == 'sqlite', 'Query plans are checked on SQLite.')
+    def test_hot_queries_use_indexes(self):
+        user = create_test_user()
+        today = timezone.now().date()
+
+        self.assertQueryUsesIndex(
+            Booking.objects.filter(user=user).order_by('-created', '-uuid'), 'booking_user_created_idx'
+        )
+        self.assertQueryUsesIndex(Booking.objects.filter(check_in__lt=today, check_out__gt=today), 'booking_dates_idx')
+        self.assertQueryUsesIndex(Booking.objects.filter(is_paid=False).order_by('-created'), 'booking_unpaid_idx')
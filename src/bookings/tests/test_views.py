@@ -1,13 +1,17 @@
 from datetime import datetime, timedelta
 
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from accounts.tests import create_test_user
+from bookings.forms import NO_FREE_ROOM_MESSAGE
 from bookings.models import Booking
 from bookings.tests.test_models import create_test_booking
 from rooms.models import TYPE
-from rooms.tests.test_models import create_test_room
+from rooms.tests.test_models import create_test_room, create_test_room_data
 
 
 class BookingCreateViewTest(TestCase):
@@ -57,15 +61,47 @@ class BookingCreateViewTest(TestCase):
         self.assertEqual(booking.check_in, self.data['check_in'])
         self.assertEqual(booking.check_out, self.data['check_out'])
 
+    def test_view_warns_if_no_room_is_free(self):
+        response = self.client.post(self.url, self.data, follow=True)
+
+        self.assertContains(response, NO_FREE_ROOM_MESSAGE)
+
+    def test_view_doesnt_warn_if_room_is_reserved(self):
+        create_test_room(create_test_room_data(single_beds=10))
+
+        response = self.client.post(self.url, self.data, follow=True)
+
+        self.assertNotContains(response, NO_FREE_ROOM_MESSAGE)
+
     def test_view_dont_create_booking_if_data_is_invalid(self):
         del self.data['persons']
         self.client.post(self.url, self.data)
 
         self.assertEqual(Booking.objects.count(), 0)
 
+    def test_view_shows_free_rooms_for_searched_dates(self):
+        room_data = create_test_room_data(type=TYPE.STANDARD, single_beds=2)
+        create_test_room(room_data, number='1')
+        booked_room = create_test_room(room_data, number='2')
+        booking = create_test_booking(self.user, self.data['check_in'], self.data['check_out'])
+        booking.rooms.add(booked_room)
+        params = {'check_in': self.data['check_in'], 'check_out': self.data['check_out'], 'type': TYPE.STANDARD}
+
+        response = self.client.get(self.url, params)
+
+        self.assertEqual(response.context['free_rooms_count'], 1)
+        self.assertContains(response, 'Free rooms: 1')
+        self.assertEqual(response.context['form'].initial['check_in'], self.data['check_in'])
+
+    def test_view_doesnt_show_free_rooms_without_search(self):
+        response = self.client.get(self.url)
+
+        self.assertNotIn('free_rooms_count', response.context)
+
 
 class BookingListViewTest(TestCase):
     def setUp(self) -> None:
+        cache.clear()
         self.user = create_test_user()
         self.client.force_login(self.user)
         self.url = reverse('bookings:booking-list')
@@ -122,6 +158,101 @@ class BookingListViewTest(TestCase):
         for text in expected_text:
             self.assertContains(response, text)
 
+    def test_view_renders_unchanged_booking_cards_from_cache(self):
+        create_test_booking(self.user)
+        self.client.get(self.url)
+
+        response = self.client.get(self.url)
+
+        self.assertTemplateNotUsed(response, 'bookings/card.html')
+
+    def test_view_rerenders_booking_card_after_rooms_change(self):
+        booking = create_test_booking(self.user)
+        self.client.get(self.url)
+
+        booking.rooms.add(create_test_room(number='7'))
+        response = self.client.get(self.url)
+
+        self.assertTemplateUsed(response, 'bookings/card.html')
+        self.assertContains(response, 'Rooms: 7')
+
+    def get_queries_count(self):
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(self.url)
+        return len(context.captured_queries)
+
+    def test_view_makes_constant_number_of_queries(self):
+        room_data = create_test_room_data()
+        check_in = datetime.now().date() + timedelta(days=1)
+        booking = create_test_booking(self.user, check_in, check_in + timedelta(days=1))
+        booking.rooms.add(create_test_room(room_data, number='0'))
+
+        expected_count = self.get_queries_count()
+
+        for number in range(1, 200):
+            booking = create_test_booking(self.user, check_in, check_in + timedelta(days=1))
+            booking.rooms.add(create_test_room(room_data, number=str(number)))
+
+        self.assertEqual(self.get_queries_count(), expected_count)
+
+    def test_view_paginates_bookings_by_cursor(self):
+        bookings = [create_test_booking(self.user) for _ in range(25)]
+        expected_uuids = [str(booking.uuid) for booking in reversed(bookings)]
+
+        response = self.client.get(self.url)
+        first_page = [str(booking.uuid) for booking in response.context['object_list']]
+
+        self.assertTrue(response.context['is_paginated'])
+        self.assertContains(response, 'Next page')
+
+        response = self.client.get(self.url, {'cursor': response.context['page_obj'].next_cursor})
+        second_page = [str(booking.uuid) for booking in response.context['object_list']]
+
+        self.assertTrue(response.context['is_paginated'])
+        self.assertNotContains(response, 'Next page')
+        self.assertContains(response, 'First page')
+        self.assertEqual(first_page + second_page, expected_uuids)
+
+        response = self.client.get(self.url, {'before': response.context['page_obj'].previous_cursor})
+
+        self.assertEqual([str(booking.uuid) for booking in response.context['object_list']], first_page)
+        self.assertNotContains(response, 'Previous page')
+        self.assertContains(response, 'Next page')
+
+    def test_view_is_not_paginated_if_bookings_fit_one_page(self):
+        create_test_booking(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertFalse(response.context['is_paginated'])
+        self.assertNotContains(response, 'Previous page')
+
+    def test_view_returns_404_if_cursor_is_invalid(self):
+        response = self.client.get(self.url, {'cursor': 'invalid'})
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_view_filters_upcoming_bookings(self):
+        today = datetime.now().date()
+        past_booking = create_test_booking(self.user, today - timedelta(days=10), today - timedelta(days=5))
+        upcoming_booking = create_test_booking(self.user, today, today + timedelta(days=1))
+
+        response = self.client.get(self.url, {'upcoming': 1})
+
+        self.assertContains(response, f'UUID: {upcoming_booking.uuid}')
+        self.assertNotContains(response, f'UUID: {past_booking.uuid}')
+        self.assertContains(response, 'All bookings')
+
+    def test_view_shows_all_bookings_if_upcoming_flag_is_off(self):
+        today = datetime.now().date()
+        past_booking = create_test_booking(self.user, today - timedelta(days=10), today - timedelta(days=5))
+
+        for value in ['0', 'false', '']:
+            response = self.client.get(self.url, {'upcoming': value})
+
+            self.assertContains(response, f'UUID: {past_booking.uuid}')
+            self.assertContains(response, 'Upcoming only')
+
     def test_view_contains_only_bookings_of_login_user(self):
         other_user = create_test_user('morty@test.com')
         other_bookings = create_test_booking(other_user)
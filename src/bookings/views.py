@@ -1,9 +1,16 @@
+from django.contrib import messages
 from django.contrib.auth import mixins
+from django.core.paginator import InvalidPage
+from django.http import Http404
 from django.urls import reverse_lazy
+from django.utils import timezone
 from django.views import generic
 
 from bookings import forms
+from bookings.availability import get_free_rooms
+from bookings.cache import BOOKING_CARD_TIMEOUT, get_card_version
 from bookings.models import Booking
+from utils.pagination import KeysetPaginator
 
 
 class BookingCreateView(mixins.LoginRequiredMixin, generic.CreateView):
@@ -17,10 +24,58 @@ class BookingCreateView(mixins.LoginRequiredMixin, generic.CreateView):
         kwargs['user'] = self.request.user
         return kwargs
 
+    def form_valid(self, form):
+        response = super().form_valid(form)
+        if form.room is None:
+            messages.warning(self.request, forms.NO_FREE_ROOM_MESSAGE)
+        return response
+
+    def get_search_form(self):
+        if self.request.method == 'GET' and self.request.GET:
+            return forms.AvailabilitySearchForm(self.request.GET)
+        return None
+
+    def get_initial(self):
+        initial = super().get_initial()
+        search_form = self.get_search_form()
+        if search_form is not None and search_form.is_valid():
+            initial.update({key: value for key, value in search_form.cleaned_data.items() if value is not None})
+        return initial
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        search_form = self.get_search_form()
+        if search_form is not None and search_form.is_valid():
+            context['free_rooms_count'] = get_free_rooms(**search_form.cleaned_data).count()
+        return context
+
 
 class BookingListView(mixins.LoginRequiredMixin, generic.ListView):
     model = Booking
     template_name = 'bookings/list.html'
+    paginate_by = 20
+
+    @property
+    def upcoming(self):
+        return self.request.GET.get('upcoming', '').lower() in ('1', 'true', 'yes')
 
     def get_queryset(self):
-        return self.model.objects.filter(user=self.request.user)
+        bookings = self.model.objects.filter(user=self.request.user)
+        if self.upcoming:
+            bookings = bookings.filter(check_out__gte=timezone.localdate())
+        return bookings.with_rooms().with_total_price()
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = KeysetPaginator(queryset, page_size)
+        try:
+            page = paginator.get_page(self.request.GET.get('cursor'), self.request.GET.get('before'))
+        except InvalidPage as e:
+            raise Http404(str(e))
+        return paginator, page, page.object_list, page.has_next or page.has_previous
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['upcoming'] = self.upcoming
+        context['card_cache_timeout'] = BOOKING_CARD_TIMEOUT
+        context['card_version'] = get_card_version()
+        return context
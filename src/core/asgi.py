@@ -9,8 +9,15 @@ https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 
 application = get_asgi_application()
+
+if settings.WARM_TEMPLATES:
+    from utils.warmup import warm_templates, warm_urls
+
+    warm_templates()
+    warm_urls()
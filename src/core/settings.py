@@ -47,10 +47,12 @@ INSTALLED_APPS = [
     'accounts',
     'rooms',
     'bookings',
+    'mails',
     'utils',
 ]
 
 MIDDLEWARE = [
+    'utils.middleware.PerformanceMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -66,8 +68,16 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [],
-        'APP_DIRS': True,
         'OPTIONS': {
+            'loaders': [
+                (
+                    'django.template.loaders.cached.Loader',
+                    [
+                        'django.template.loaders.filesystem.Loader',
+                        'django.template.loaders.app_directories.Loader',
+                    ],
+                ),
+            ],
             'context_processors': [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
@@ -80,17 +90,122 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'core.wsgi.application'
 
+WARM_TEMPLATES = env.get('WARM_TEMPLATES', 'true').lower() == 'true'
+WARM_TEMPLATES_APPS = ['accounts', 'bookings', 'rooms', 'utils']
+
+QUERY_BUDGETS_FILE = BASE_DIR / 'query_budgets.json'
+QUERY_BUDGET_TIME_FACTOR = float(env.get('QUERY_BUDGET_TIME_FACTOR', 3))
+QUERY_BUDGET_MIN_TIME_MS = float(env.get('QUERY_BUDGET_MIN_TIME_MS', 50))
+QUERY_BUDGET_CHECK_TIME = env.get('QUERY_BUDGET_CHECK_TIME', 'true').lower() == 'true'
+
+PERFORMANCE_MIDDLEWARE = env.get('PERFORMANCE_MIDDLEWARE', 'false').lower() == 'true'
+PERFORMANCE_LOG_LEVEL = env.get('PERFORMANCE_LOG_LEVEL', 'INFO')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'metrics': {'()': 'utils.performance.MetricsFormatter', 'format': '%(asctime)s %(message)s'},
+    },
+    'handlers': {
+        'performance': {'class': 'logging.StreamHandler', 'formatter': 'metrics'},
+    },
+    'loggers': {
+        'performance': {'handlers': ['performance'], 'level': PERFORMANCE_LOG_LEVEL, 'propagate': False},
+    },
+}
+
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
-DATABASES = {
+DB_ENGINE = env.get('DB_ENGINE', 'sqlite3')
+
+if DB_ENGINE == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': env.get('DB_NAME', 'hotel'),
+            'USER': env.get('DB_USER', 'hotel'),
+            'PASSWORD': env.get('DB_PASSWORD', ''),
+            'HOST': env.get('DB_HOST', 'localhost'),
+            'PORT': env.get('DB_PORT', '5432'),
+            'CONN_MAX_AGE': int(env.get('DB_CONN_MAX_AGE', 60)),
+            'CONN_HEALTH_CHECKS': env.get('DB_CONN_HEALTH_CHECKS', 'true').lower() == 'true',
+            'OPTIONS': {},
+        }
+    }
+
+    # Pooling needs psycopg[pool] and doesn't work together with persistent connections.
+    if env.get('DB_POOL', 'false').lower() == 'true':
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+        DATABASES['default']['OPTIONS']['pool'] = {
+            'min_size': int(env.get('DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(env.get('DB_POOL_MAX_SIZE', 10)),
+            'timeout': int(env.get('DB_POOL_TIMEOUT', 10)),
+        }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': env.get('DB_NAME', BASE_DIR / '../db.sqlite3'),
+            'TEST': {'NAME': env.get('DB_TEST_NAME', BASE_DIR / '../test_db.sqlite3')},
+            'OPTIONS': {
+                'timeout': int(env.get('SQLITE_TIMEOUT', 20)),
+                'transaction_mode': env.get('SQLITE_TRANSACTION_MODE', 'IMMEDIATE'),
+                'init_command': ';'.join(
+                    [
+                        f'PRAGMA journal_mode={env.get("SQLITE_JOURNAL_MODE", "WAL")}',
+                        f'PRAGMA synchronous={env.get("SQLITE_SYNCHRONOUS", "NORMAL")}',
+                        f'PRAGMA mmap_size={int(env.get("SQLITE_MMAP_SIZE", 128 * 1024 * 1024))}',
+                    ]
+                ),
+            },
+        }
+    }
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / '../db.sqlite3',
+        'BACKEND': env.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': env.get('CACHE_LOCATION', ''),
     }
 }
 
+# Local memory cache keeps only 300 entries by default, which is less than booking cards of a few users.
+if CACHES['default']['BACKEND'] == 'django.core.cache.backends.locmem.LocMemCache':
+    CACHES['default']['OPTIONS'] = {'MAX_ENTRIES': int(env.get('CACHE_MAX_ENTRIES', 10_000))}
+
+
+# Password hashing
+# https://docs.djangoproject.com/en/5.0/topics/auth/passwords/
+# The first hasher of the profile hashes new passwords, hashes made by the others are upgraded on the next login.
+
+PASSWORD_HASHER_PROFILES = {
+    'pbkdf2': 'accounts.hashers.TunedPBKDF2PasswordHasher',
+    'argon2': 'accounts.hashers.TunedArgon2PasswordHasher',
+    'scrypt': 'accounts.hashers.TunedScryptPasswordHasher',
+}
+PASSWORD_HASHER_PROFILE = env.get('PASSWORD_HASHER_PROFILE', 'pbkdf2')
+PASSWORD_HASHERS = [
+    PASSWORD_HASHER_PROFILES[PASSWORD_HASHER_PROFILE],
+    *(hasher for profile, hasher in PASSWORD_HASHER_PROFILES.items() if profile != PASSWORD_HASHER_PROFILE),
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+]
+
+PBKDF2_ITERATIONS = int(env.get('PBKDF2_ITERATIONS', 870_000))
+# Argon2 memory cost is in KiB. A single lane keeps one login on one core, so throughput scales with workers.
+ARGON2_TIME_COST = int(env.get('ARGON2_TIME_COST', 2))
+ARGON2_MEMORY_COST = int(env.get('ARGON2_MEMORY_COST', 19_456))
+ARGON2_PARALLELISM = int(env.get('ARGON2_PARALLELISM', 1))
+SCRYPT_WORK_FACTOR = int(env.get('SCRYPT_WORK_FACTOR', 2**15))
+SCRYPT_BLOCK_SIZE = int(env.get('SCRYPT_BLOCK_SIZE', 8))
+SCRYPT_PARALLELISM = int(env.get('SCRYPT_PARALLELISM', 1))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -134,11 +249,26 @@ STATIC_URL = 'static/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = 'accounts.User'
+AUTHENTICATION_BACKENDS = ['accounts.backends.ModelBackend']
 LOGIN_URL = reverse_lazy('accounts:user-login')
 
+# Failed logins allowed per email and per client IP within a sliding window of seconds.
+LOGIN_THROTTLE_WINDOW = int(env.get('LOGIN_THROTTLE_WINDOW', 300))
+LOGIN_THROTTLE_EMAIL_LIMIT = int(env.get('LOGIN_THROTTLE_EMAIL_LIMIT', 5))
+LOGIN_THROTTLE_IP_LIMIT = int(env.get('LOGIN_THROTTLE_IP_LIMIT', 50))
+LOGIN_UNKNOWN_EMAIL_TIMEOUT = int(env.get('LOGIN_UNKNOWN_EMAIL_TIMEOUT', 3600))
+
+
+# Email
+# Mails are queued into the outbox and sent by the "send_queued_mail" command
+# through MAILS_DELIVERY_BACKEND.
+
+EMAIL_BACKEND = env.get('EMAIL_BACKEND', 'mails.backends.OutboxBackend')
+MAILS_DELIVERY_BACKEND = env.get('MAILS_DELIVERY_BACKEND', 'django.core.mail.backends.smtp.EmailBackend')
+MAILS_MAX_ATTEMPTS = int(env.get('MAILS_MAX_ATTEMPTS', 5))
+MAILS_RETRY_DELAY = int(env.get('MAILS_RETRY_DELAY', 60))
 
 if DEBUG:
-    EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
     DEFAULT_FROM_EMAIL = 'company@domain.com'
     SERVER_EMAIL = 'company@domain.com'
 
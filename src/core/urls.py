@@ -18,11 +18,15 @@ from django.contrib import admin
 from django.urls import path, include
 from django.views import generic
 
+from utils.views import PerformanceView
+
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('account/', include('accounts.urls')),
     path('rooms/', include('rooms.urls')),
     path('bookings/', include('bookings.urls')),
+    path('api/', include('bookings.api_urls')),
+    path('performance/', PerformanceView.as_view(), name='performance'),
     path('', generic.TemplateView.as_view(template_name='home.html'), name='home'),
 ]
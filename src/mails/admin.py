@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from mails.models import OutgoingMail
+
+
+@admin.register(OutgoingMail)
+class OutgoingMailAdmin(admin.ModelAdmin):
+    list_display = ['subject', 'to', 'status', 'attempts', 'next_attempt', 'sent', 'created']
+    readonly_fields = ['updated', 'created']
+    search_fields = ['subject']
+    list_filter = ['status']
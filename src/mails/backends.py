@@ -0,0 +1,10 @@
+from django.core.mail.backends.base import BaseEmailBackend
+
+from mails.models import OutgoingMail
+
+
+class OutboxBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        mails = [OutgoingMail.from_message(message) for message in email_messages if message.recipients()]
+        OutgoingMail.objects.bulk_create(mails)
+        return len(mails)
@@ -0,0 +1,68 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.db import connection as db_connection
+from django.db import transaction
+from django.utils import timezone
+
+from mails.models import STATUS, OutgoingMail
+
+DELIVERY_FIELDS = ['status', 'attempts', 'next_attempt', 'last_error', 'sent', 'updated']
+
+
+def get_due_mails(due, batch_size):
+    mails = OutgoingMail.objects.filter(status=STATUS.PENDING, next_attempt__lte=due)
+    if db_connection.features.has_select_for_update_skip_locked:
+        mails = mails.select_for_update(skip_locked=True)
+    return list(mails[:batch_size])
+
+
+def get_retry_delay(attempts):
+    return timedelta(seconds=settings.MAILS_RETRY_DELAY * 2 ** (attempts - 1))
+
+
+def claim_due_mails(due, batch_size):
+    # The attempt is counted and the next one scheduled before sending, so the lock is released before talking to
+    # the relay and another worker doesn't pick up the same mails. A mail of a crashed worker is retried later.
+    with transaction.atomic():
+        mails = get_due_mails(due, batch_size)
+        now = timezone.now()
+        for mail in mails:
+            mail.attempts += 1
+            mail.next_attempt = now + get_retry_delay(mail.attempts)
+            mail.updated = now
+        OutgoingMail.objects.bulk_update(mails, ['attempts', 'next_attempt', 'updated'])
+    return mails
+
+
+def deliver(mails, connection):
+    for mail in mails:
+        now = timezone.now()
+        mail.updated = now
+
+        try:
+            connection.send_messages([mail.to_message(connection)])
+        except Exception as e:
+            connection.close()
+            mail.last_error = str(e) or e.__class__.__name__
+            if mail.attempts >= settings.MAILS_MAX_ATTEMPTS:
+                mail.status = STATUS.FAILED
+        else:
+            mail.status = STATUS.SENT
+            mail.sent = now
+            mail.last_error = None
+
+    OutgoingMail.objects.bulk_update(mails, DELIVERY_FIELDS)
+
+
+def send_queued_mails(batch_size=100, backend=None):
+    due = timezone.now()
+    delivered = []
+
+    with get_connection(backend or settings.MAILS_DELIVERY_BACKEND) as connection:
+        while mails := claim_due_mails(due, batch_size):
+            deliver(mails, connection)
+            delivered += mails
+
+    return {status: sum(mail.status == status for mail in delivered) for status in STATUS}
@@ -0,0 +1,27 @@
+from time import sleep
+
+from django.core.management import BaseCommand
+
+from mails.delivery import send_queued_mails
+from mails.models import STATUS
+
+
+class Command(BaseCommand):
+    help = 'Sends queued mails in batches over one connection of the delivery backend.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100)
+        parser.add_argument('--loop', action='store_true', help='Keep polling the queue.')
+        parser.add_argument('--interval', type=float, default=5, help='Seconds between polls with --loop.')
+
+    def handle(self, *args, batch_size, loop, interval, **options):
+        while True:
+            result = send_queued_mails(batch_size)
+            if any(result.values()):
+                self.stdout.write(
+                    f'Sent: {result[STATUS.SENT]}, to retry: {result[STATUS.PENDING]}, failed: {result[STATUS.FAILED]}.'
+                )
+
+            if not loop:
+                return
+            sleep(interval)
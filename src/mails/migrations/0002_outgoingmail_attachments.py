@@ -0,0 +1,23 @@
+# Generated by Django 5.1.15 on 2026-10-18 13:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mails', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outgoingmail',
+            name='attachments',
+            field=models.JSONField(default=list),
+        ),
+        migrations.AddField(
+            model_name='outgoingmail',
+            name='content_subtype',
+            field=models.CharField(default='plain', max_length=50),
+        ),
+    ]
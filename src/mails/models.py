@@ -0,0 +1,88 @@
+from base64 import b64decode, b64encode
+
+from django.core.mail import EmailMultiAlternatives
+from django.db import models
+from django.utils import timezone
+
+from utils.models import DateMixin
+
+UNSUPPORTED_ATTACHMENT_ERROR_MESSAGE = 'Only attachments given as (filename, content, mimetype) can be queued.'
+
+
+class STATUS(models.IntegerChoices):
+    PENDING = 0, 'Pending'
+    SENT = 1, 'Sent'
+    FAILED = 2, 'Failed'
+
+
+class OutgoingMail(DateMixin):
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=255)
+    to = models.JSONField(default=list)
+    cc = models.JSONField(default=list)
+    bcc = models.JSONField(default=list)
+    reply_to = models.JSONField(default=list)
+    headers = models.JSONField(default=dict)
+    alternatives = models.JSONField(default=list)
+    attachments = models.JSONField(default=list)
+    content_subtype = models.CharField(max_length=50, default='plain')
+    status = models.PositiveSmallIntegerField(choices=STATUS.choices, default=STATUS.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(null=True, blank=True)
+    sent = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['next_attempt']
+        indexes = [models.Index(fields=['status', 'next_attempt'], name='outgoing_mail_queue_idx')]
+
+    def __str__(self):
+        return self.subject
+
+    @classmethod
+    def from_message(cls, message):
+        return cls(
+            subject=message.subject,
+            body=message.body,
+            from_email=message.from_email,
+            to=list(message.to),
+            cc=list(message.cc),
+            bcc=list(message.bcc),
+            reply_to=list(message.reply_to),
+            headers=dict(message.extra_headers),
+            alternatives=[list(alternative) for alternative in getattr(message, 'alternatives', [])],
+            attachments=[cls.dump_attachment(attachment) for attachment in message.attachments],
+            content_subtype=message.content_subtype,
+        )
+
+    @staticmethod
+    def dump_attachment(attachment):
+        if not isinstance(attachment, tuple):
+            raise ValueError(UNSUPPORTED_ATTACHMENT_ERROR_MESSAGE)
+        filename, content, mimetype = attachment
+        if isinstance(content, bytes):
+            return [filename, b64encode(content).decode(), mimetype, True]
+        return [filename, content, mimetype, False]
+
+    @staticmethod
+    def load_attachment(attachment):
+        filename, content, mimetype, is_encoded = attachment
+        return filename, b64decode(content) if is_encoded else content, mimetype
+
+    def to_message(self, connection=None):
+        message = EmailMultiAlternatives(
+            subject=self.subject,
+            body=self.body,
+            from_email=self.from_email,
+            to=self.to,
+            cc=self.cc,
+            bcc=self.bcc,
+            reply_to=self.reply_to,
+            headers=self.headers,
+            alternatives=[tuple(alternative) for alternative in self.alternatives],
+            attachments=[self.load_attachment(attachment) for attachment in self.attachments],
+            connection=connection,
+        )
+        message.content_subtype = self.content_subtype
+        return message
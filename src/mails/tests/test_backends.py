@@ -0,0 +1,60 @@
+from email.mime.text import MIMEText
+
+from django.core.mail import EmailMessage, EmailMultiAlternatives, send_mail
+from django.test import TestCase, override_settings
+
+from mails.models import STATUS, UNSUPPORTED_ATTACHMENT_ERROR_MESSAGE, OutgoingMail
+
+
+@override_settings(EMAIL_BACKEND='mails.backends.OutboxBackend')
+class OutboxBackendTest(TestCase):
+    def test_send_mail_enqueues_mail(self):
+        sent = send_mail('subject', 'body', 'from@test.com', ['to@test.com'])
+
+        self.assertEqual(sent, 1)
+        mail = OutgoingMail.objects.get()
+        self.assertEqual(mail.subject, 'subject')
+        self.assertEqual(mail.body, 'body')
+        self.assertEqual(mail.from_email, 'from@test.com')
+        self.assertEqual(mail.to, ['to@test.com'])
+        self.assertEqual(mail.status, STATUS.PENDING)
+
+    def test_mail_is_restored_from_outbox(self):
+        message = EmailMultiAlternatives(
+            'subject', 'body', 'from@test.com', ['to@test.com'], cc=['cc@test.com'], headers={'X-Test': '1'}
+        )
+        message.attach_alternative('<p>body</p>', 'text/html')
+        message.send()
+
+        restored = OutgoingMail.objects.get().to_message()
+
+        self.assertEqual(restored.recipients(), ['to@test.com', 'cc@test.com'])
+        self.assertEqual(restored.extra_headers, {'X-Test': '1'})
+        self.assertEqual(restored.alternatives[0][0], '<p>body</p>')
+        self.assertEqual(restored.alternatives[0][1], 'text/html')
+
+    def test_attachments_and_content_subtype_are_restored_from_outbox(self):
+        message = EmailMessage('subject', '<p>body</p>', 'from@test.com', ['to@test.com'])
+        message.content_subtype = 'html'
+        message.attach('notes.txt', 'notes', 'text/plain')
+        message.attach('logo.png', b'\x89PNG', 'image/png')
+        message.send()
+
+        restored = OutgoingMail.objects.get().to_message()
+
+        self.assertEqual(restored.content_subtype, 'html')
+        self.assertEqual(
+            restored.attachments, [('notes.txt', 'notes', 'text/plain'), ('logo.png', b'\x89PNG', 'image/png')]
+        )
+
+    def test_mail_with_mime_attachment_is_rejected(self):
+        message = EmailMessage('subject', 'body', 'from@test.com', ['to@test.com'])
+        message.attach(MIMEText('notes'))
+
+        with self.assertRaisesMessage(ValueError, UNSUPPORTED_ATTACHMENT_ERROR_MESSAGE):
+            message.send()
+        self.assertFalse(OutgoingMail.objects.exists())
+
+    def test_mail_without_recipients_is_not_enqueued(self):
+        self.assertEqual(send_mail('subject', 'body', 'from@test.com', []), 0)
+        self.assertFalse(OutgoingMail.objects.exists())
@@ -0,0 +1,100 @@
+from datetime import timedelta
+from io import StringIO
+from smtplib import SMTPException
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.mail import send_mail
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from mails.delivery import send_queued_mails
+from mails.models import STATUS, OutgoingMail
+
+LOCMEM_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+
+
+@override_settings(
+    EMAIL_BACKEND='mails.backends.OutboxBackend',
+    MAILS_DELIVERY_BACKEND=LOCMEM_BACKEND,
+    MAILS_MAX_ATTEMPTS=2,
+    MAILS_RETRY_DELAY=60,
+)
+class SendQueuedMailsTest(TestCase):
+    def setUp(self) -> None:
+        for number in range(3):
+            send_mail(f'subject {number}', 'body', 'from@test.com', [f'to{number}@test.com'])
+
+    def test_queued_mails_are_sent_in_batches(self):
+        result = send_queued_mails(batch_size=2)
+
+        self.assertEqual(result[STATUS.SENT], 3)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(OutgoingMail.objects.filter(status=STATUS.SENT, sent__isnull=False).count(), 3)
+
+    @patch(f'{LOCMEM_BACKEND}.open')
+    def test_mails_use_one_connection(self, mock):
+        send_queued_mails(batch_size=1)
+
+        self.assertEqual(len(mail.outbox), 3)
+        mock.assert_called_once()
+
+    def test_sent_mails_are_not_sent_again(self):
+        send_queued_mails()
+        send_queued_mails()
+
+        self.assertEqual(len(mail.outbox), 3)
+
+    def test_mails_are_sent_outside_transaction(self):
+        atomic_blocks = len(connection.atomic_blocks)
+        states = []
+
+        def send_messages(messages):
+            states.append(
+                (len(connection.atomic_blocks), OutgoingMail.objects.get(subject=messages[0].subject).attempts)
+            )
+            return len(messages)
+
+        with patch(f'{LOCMEM_BACKEND}.send_messages', side_effect=send_messages):
+            send_queued_mails()
+
+        self.assertEqual(states, [(atomic_blocks, 1)] * 3)
+
+    def test_not_due_mails_are_not_sent(self):
+        OutgoingMail.objects.update(next_attempt=timezone.now() + timedelta(minutes=1))
+
+        send_queued_mails()
+
+        self.assertEqual(len(mail.outbox), 0)
+
+    @patch(f'{LOCMEM_BACKEND}.send_messages', side_effect=SMTPException('Relay is down'))
+    def test_failed_mails_are_retried_with_backoff(self, mock):
+        started = timezone.now()
+
+        result = send_queued_mails()
+
+        self.assertEqual(result[STATUS.PENDING], 3)
+        for outgoing_mail in OutgoingMail.objects.all():
+            self.assertEqual(outgoing_mail.attempts, 1)
+            self.assertEqual(outgoing_mail.last_error, 'Relay is down')
+            self.assertGreaterEqual(outgoing_mail.next_attempt, started + timedelta(seconds=60))
+
+    @patch(f'{LOCMEM_BACKEND}.send_messages', side_effect=SMTPException('Relay is down'))
+    def test_mails_fail_after_max_attempts(self, mock):
+        send_queued_mails()
+        OutgoingMail.objects.update(next_attempt=timezone.now())
+
+        result = send_queued_mails()
+
+        self.assertEqual(result[STATUS.FAILED], 3)
+        self.assertEqual(OutgoingMail.objects.filter(status=STATUS.FAILED, attempts=2).count(), 3)
+
+    def test_command_sends_queued_mails(self):
+        stdout = StringIO()
+
+        call_command('send_queued_mail', stdout=stdout)
+
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertIn('Sent: 3, to retry: 0, failed: 0.', stdout.getvalue())
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from rooms.models import Room, RoomData
+from rooms.models import Room, RoomData, RoomRate
 
 
 class RoomInline(admin.TabularInline):
@@ -9,6 +9,12 @@ class RoomInline(admin.TabularInline):
     show_change_link = True
 
 
+class RoomRateInline(admin.TabularInline):
+    model = RoomRate
+    extra = 0
+    fields = ['start', 'end', 'price']
+
+
 @admin.register(Room)
 class RoomAdmin(admin.ModelAdmin):
     list_display = ['number', 'status', 'is_available']
@@ -19,13 +25,9 @@ class RoomAdmin(admin.ModelAdmin):
 
 @admin.register(RoomData)
 class RoomDataAdmin(admin.ModelAdmin):
-    list_display = ['name', 'slug', 'type', 'persons', 'single_beds', 'double_beds', 'price']
+    list_display = ['name', 'slug', 'type', 'capacity', 'single_beds', 'double_beds', 'price']
     prepopulated_fields = {'slug': ['name']}
     readonly_fields = ['updated', 'created']
     search_fields = ['name', 'slug']
-    list_filter = ['type', 'single_beds', 'double_beds']
-    inlines = [RoomInline]
-
-    @staticmethod
-    def persons(instance):
-        return instance.persons
+    list_filter = ['type', 'capacity', 'single_beds', 'double_beds']
+    inlines = [RoomRateInline, RoomInline]
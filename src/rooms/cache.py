@@ -0,0 +1,39 @@
+from django.core.cache import cache
+from django.db.models import Max
+
+from rooms.models import Room, RoomData
+from utils.cache import get_version
+
+CATALOGUE = 'rooms:catalogue'
+CATALOGUE_TIMEOUT = 60 * 60 * 24
+PRICING = 'rooms:pricing'
+
+
+def get_catalogue_meta():
+    version = get_version(CATALOGUE)
+    key = f'{CATALOGUE}:{version}:meta'
+    meta = cache.get(key)
+
+    if meta is None:
+        updated = [
+            RoomData.objects.aggregate(updated=Max('updated'))['updated'],
+            Room.objects.aggregate(updated=Max('updated'))['updated'],
+        ]
+        updated = [value for value in updated if value is not None]
+        meta = {'etag': version, 'last_modified': max(updated, default=None)}
+        cache.set(key, meta, CATALOGUE_TIMEOUT)
+
+    return meta
+
+
+# The page navbar depends on the user, so only anonymous pages are validated by the catalogue version.
+def get_catalogue_etag(request, *args, **kwargs):
+    if request.user.is_authenticated:
+        return None
+    return get_catalogue_meta()['etag']
+
+
+def get_catalogue_last_modified(request, *args, **kwargs):
+    if request.user.is_authenticated:
+        return None
+    return get_catalogue_meta()['last_modified']
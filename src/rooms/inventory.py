@@ -0,0 +1,102 @@
+from itertools import islice
+
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+
+from rooms.cache import CATALOGUE
+from rooms.models import Room, RoomData
+from utils.cache import bump_version
+
+ROOM_DATA_FIELDS = ['slug', 'name', 'type', 'single_beds', 'double_beds', 'price', 'description']
+ROOM_FIELDS = ['number', 'status', 'is_available']
+FIELDS = ROOM_FIELDS + ROOM_DATA_FIELDS
+MISSING_FIELD_ERROR_MESSAGE = 'Row {}: missing "{}".'
+INVALID_VALUE_ERROR_MESSAGE = 'Row {}: invalid "{}": {}'
+BOOLEANS = {'true': True, 'false': False, 'yes': True, 'no': False}
+
+
+def parse_value(model, name, value):
+    field = model._meta.get_field(name)
+    if value in ('', None):
+        if field.null:
+            return None
+        if field.has_default():
+            return field.get_default()
+    if isinstance(field, models.BooleanField) and isinstance(value, str):
+        value = BOOLEANS.get(value.lower(), value)
+    return field.to_python(value)
+
+
+def parse_row(line, row):
+    values = {}
+    for model, fields in ((Room, ROOM_FIELDS), (RoomData, ROOM_DATA_FIELDS)):
+        for name in fields:
+            if name not in row:
+                if name in ('number', 'slug'):
+                    raise ValueError(MISSING_FIELD_ERROR_MESSAGE.format(line, name))
+                continue
+            try:
+                values[name] = parse_value(model, name, row[name])
+            except ValidationError as error:
+                raise ValueError(INVALID_VALUE_ERROR_MESSAGE.format(line, name, '; '.join(error.messages)))
+    return values
+
+
+def iter_batches(rows, batch_size):
+    rows = iter(rows)
+    while batch := list(islice(rows, batch_size)):
+        yield batch
+
+
+def group_by_fields(rows, fields):
+    groups = {}
+    for row in rows:
+        groups.setdefault(tuple(name for name in fields if name in row), []).append(row)
+    return groups.items()
+
+
+def upsert_batch(rows):
+    room_data = {row['slug']: row for row in rows}
+    rooms = {row['number']: row for row in rows}
+
+    # Rows may omit optional columns, so every group of rows with the same columns is upserted on its own and
+    # only updates the columns it has.
+    for fields, group in group_by_fields(room_data.values(), ROOM_DATA_FIELDS):
+        RoomData.objects.bulk_create(
+            [RoomData(**{name: row[name] for name in fields}) for row in group],
+            update_conflicts=True,
+            unique_fields=['slug'],
+            update_fields=[*(name for name in fields if name != 'slug'), 'updated'],
+        )
+    room_data_ids = dict(RoomData.objects.filter(slug__in=room_data).values_list('slug', 'pk'))
+
+    for fields, group in group_by_fields(rooms.values(), ROOM_FIELDS):
+        Room.objects.bulk_create(
+            [Room(room_data_id=room_data_ids[row['slug']], **{name: row[name] for name in fields}) for row in group],
+            update_conflicts=True,
+            unique_fields=['number'],
+            update_fields=[*(name for name in fields if name != 'number'), 'room_data', 'updated'],
+        )
+    return len(room_data), len(rooms)
+
+
+def import_rooms(rows, batch_size=1000):
+    room_data_count = rooms_count = 0
+    rows = (parse_row(line, row) for line, row in enumerate(rows, 1))
+
+    with transaction.atomic():
+        for batch in iter_batches(rows, batch_size):
+            counts = upsert_batch(batch)
+            room_data_count += counts[0]
+            rooms_count += counts[1]
+
+    bump_version(CATALOGUE)
+    return room_data_count, rooms_count
+
+
+def iter_rooms(batch_size=1000):
+    rooms = Room.objects.select_related('room_data').order_by('number')
+    for room in rooms.iterator(chunk_size=batch_size):
+        row = {name: getattr(room, name) for name in ROOM_FIELDS}
+        row.update({name: getattr(room.room_data, name) for name in ROOM_DATA_FIELDS})
+        yield row
@@ -0,0 +1,19 @@
+from django.core.management import BaseCommand, CommandError
+
+from rooms.inventory import FIELDS, iter_rooms
+from utils.streams import FORMATS, write_rows
+
+
+class Command(BaseCommand):
+    help = 'Writes room types and rooms to a CSV or JSONL file in the format read by import_rooms.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='File to write, "-" for stdout.')
+        parser.add_argument('--format', choices=FORMATS, help='Defaults to the file extension.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, path, format, batch_size, **options):
+        try:
+            write_rows(iter_rooms(batch_size), FIELDS, path, format, self.stdout)
+        except (OSError, ValueError) as error:
+            raise CommandError(error)
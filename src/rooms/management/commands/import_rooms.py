@@ -0,0 +1,26 @@
+import sys
+
+from django.core.management import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from rooms.inventory import import_rooms
+from utils.streams import FORMATS, get_format, open_stream, read_rows
+
+
+class Command(BaseCommand):
+    help = 'Creates or updates room types and rooms from a CSV or JSONL file, matched by slug and number.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='File to read, "-" for stdin.')
+        parser.add_argument('--format', choices=FORMATS, help='Defaults to the file extension.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, path, format, batch_size, **options):
+        try:
+            format = get_format(path, format)
+            with open_stream(path, 'r', sys.stdin) as file:
+                room_data, rooms = import_rooms(read_rows(file, format), batch_size)
+        except (OSError, ValueError, IntegrityError) as error:
+            raise CommandError(error)
+
+        self.stdout.write(f'Imported {rooms} rooms of {room_data} room types.')
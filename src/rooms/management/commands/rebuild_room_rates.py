@@ -0,0 +1,14 @@
+from django.core.management import BaseCommand
+
+from rooms.pricing import rebuild_rate_nights
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the per-night price table from room rates.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, batch_size, **options):
+        created = rebuild_rate_nights(batch_size=batch_size)
+        self.stdout.write(f'Written {created} night prices.')
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.15 on 2026-10-18 11:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('rooms', '0002_alter_roomdata_double_beds_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='roomdata',
+            name='slug',
+            field=models.SlugField(unique=True),
+        ),
+        migrations.AddIndex(
+            model_name='room',
+            index=models.Index(fields=['status', 'is_available'], name='room_status_available_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.1.15 on 2026-10-18 12:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rooms', '0003_room_indexes_and_unique_slug'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoomRate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('start', models.DateField()),
+                ('end', models.DateField()),
+                ('price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('room_data', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rates', to='rooms.roomdata')),
+            ],
+            options={
+                'ordering': ['room_data', 'start'],
+                'constraints': [models.CheckConstraint(condition=models.Q(('end__gt', models.F('start'))), name='room_rate_end_after_start', violation_error_message='End date must be later than start date.')],
+            },
+        ),
+        migrations.CreateModel(
+            name='RoomRateNight',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('room_data', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='night_prices', to='rooms.roomdata')),
+            ],
+            options={
+                'ordering': ['room_data', 'date'],
+                'constraints': [models.UniqueConstraint(fields=('room_data', 'date'), name='unique_room_rate_night')],
+            },
+        ),
+    ]
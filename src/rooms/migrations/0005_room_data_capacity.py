@@ -0,0 +1,30 @@
+# Generated by Django 5.1.15 on 2026-10-18 12:13
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('rooms', '0004_room_rates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='roomdata',
+            name='capacity',
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.expressions.CombinedExpression(
+                    models.F('single_beds'),
+                    '+',
+                    django.db.models.expressions.CombinedExpression(models.F('double_beds'), '*', models.Value(2)),
+                ),
+                output_field=models.PositiveSmallIntegerField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='roomdata',
+            index=models.Index(fields=['type', 'capacity'], name='room_data_type_capacity_idx'),
+        ),
+    ]
@@ -10,26 +10,69 @@ class TYPE(models.IntegerChoices):
     LUXE = 3, 'Luxe'
 
 
+TYPE_LABELS = dict(TYPE.choices)
+
+
 class RoomData(DateMixin):
     name = models.CharField(max_length=50)
-    slug = models.SlugField(max_length=50)
+    slug = models.SlugField(max_length=50, unique=True)
     type = models.PositiveSmallIntegerField(choices=TYPE.choices, default=TYPE.STANDARD)
     single_beds = models.PositiveSmallIntegerField(default=0)
     double_beds = models.PositiveSmallIntegerField(default=0)
     price = models.DecimalField(max_digits=10, decimal_places=2)
     description = models.TextField(null=True, blank=True)
+    capacity = models.GeneratedField(
+        expression=models.F('single_beds') + models.F('double_beds') * 2,
+        output_field=models.PositiveSmallIntegerField(),
+        db_persist=True,
+    )
 
     class Meta:
         ordering = ['type']
+        indexes = [models.Index(fields=['type', 'capacity'], name='room_data_type_capacity_idx')]
 
     def __str__(self):
         return self.slug
 
     @property
     def persons(self):
-        if self.single_beds and self.double_beds:
-            return self.single_beds + (self.double_beds * 2)
-        return 0
+        return self.single_beds + self.double_beds * 2
+
+
+RATE_END_DATE_ERROR_MESSAGE = 'End date must be later than start date.'
+
+
+class RoomRate(DateMixin):
+    room_data = models.ForeignKey(RoomData, models.CASCADE, related_name='rates')
+    start = models.DateField()
+    end = models.DateField()
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+
+    class Meta:
+        ordering = ['room_data', 'start']
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(end__gt=models.F('start')),
+                name='room_rate_end_after_start',
+                violation_error_message=RATE_END_DATE_ERROR_MESSAGE,
+            )
+        ]
+
+    def __str__(self):
+        return f'{self.room_data} {self.start} - {self.end}'
+
+
+class RoomRateNight(models.Model):
+    room_data = models.ForeignKey(RoomData, models.CASCADE, related_name='night_prices')
+    date = models.DateField()
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+
+    class Meta:
+        ordering = ['room_data', 'date']
+        constraints = [models.UniqueConstraint(fields=['room_data', 'date'], name='unique_room_rate_night')]
+
+    def __str__(self):
+        return f'{self.room_data} {self.date}'
 
 
 class STATUS(models.IntegerChoices):
@@ -45,6 +88,7 @@ class Room(DateMixin):
 
     class Meta:
         ordering = ['number']
+        indexes = [models.Index(fields=['status', 'is_available'], name='room_status_available_idx')]
 
     def __str__(self):
         return self.number
@@ -0,0 +1,40 @@
+from datetime import timedelta
+from itertools import groupby
+
+from django.db import transaction
+
+from rooms.cache import PRICING
+from rooms.models import RoomRate, RoomRateNight
+from utils.cache import bump_version
+
+
+def get_night_prices(rates):
+    prices = {}
+    for rate in rates:
+        date = rate.start
+        while date < rate.end:
+            prices[date] = rate.price
+            date += timedelta(days=1)
+    return prices
+
+
+def rebuild_rate_nights(room_data_ids=None, batch_size=1000):
+    rates = RoomRate.objects.order_by('room_data', 'start', 'pk')
+    nights = RoomRateNight.objects.all()
+    if room_data_ids is not None:
+        rates = rates.filter(room_data__in=room_data_ids)
+        nights = nights.filter(room_data__in=room_data_ids)
+
+    created = 0
+    with transaction.atomic():
+        nights.delete()
+        for room_data_id, group in groupby(rates.iterator(chunk_size=batch_size), key=lambda rate: rate.room_data_id):
+            prices = get_night_prices(group)
+            RoomRateNight.objects.bulk_create(
+                [RoomRateNight(room_data_id=room_data_id, date=date, price=price) for date, price in prices.items()],
+                batch_size=batch_size,
+            )
+            created += len(prices)
+
+    bump_version(PRICING)
+    return created
@@ -0,0 +1,24 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from rooms.cache import CATALOGUE, PRICING
+from rooms.models import Room, RoomData, RoomRate
+from rooms.pricing import rebuild_rate_nights
+from utils.cache import bump_version
+
+
+@receiver([post_save, post_delete], sender=RoomData)
+@receiver([post_save, post_delete], sender=Room)
+def invalidate_catalogue(sender, **kwargs):
+    bump_version(CATALOGUE)
+
+
+@receiver([post_save, post_delete], sender=RoomData)
+def invalidate_pricing(sender, **kwargs):
+    bump_version(PRICING)
+
+
+@receiver([post_save, post_delete], sender=RoomRate)
+def rebuild_room_rate_nights(sender, instance, raw=False, **kwargs):
+    if not raw:
+        rebuild_rate_nights([instance.room_data_id])
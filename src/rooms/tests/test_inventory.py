@@ -0,0 +1,128 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from rooms.cache import CATALOGUE
+from rooms.inventory import import_rooms
+from rooms.models import STATUS, TYPE, Room, RoomData
+from rooms.tests.test_models import create_test_room, create_test_room_data
+from utils.cache import get_version
+
+CSV = """number,status,is_available,slug,name,type,single_beds,double_beds,price,description
+101,0,true,standard,Standard,1,2,0,100.00,
+102,1,false,standard,Standard,1,2,0,100.00,
+201,0,true,luxe,Luxe,3,0,2,500.00,Sea view
+"""
+
+
+class ImportRoomsTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write_file(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w') as file:
+            file.write(content)
+        return path
+
+    def test_import_creates_room_types_and_rooms(self):
+        stdout = StringIO()
+
+        call_command('import_rooms', self.write_file('rooms.csv', CSV), '--batch-size', '2', stdout=stdout)
+
+        self.assertIn('Imported 3 rooms', stdout.getvalue())
+        self.assertEqual(RoomData.objects.count(), 2)
+        room = Room.objects.get(number='102')
+        self.assertEqual(room.room_data.slug, 'standard')
+        self.assertEqual(room.status, STATUS.BOOKED)
+        self.assertFalse(room.is_available)
+        self.assertEqual(RoomData.objects.get(slug='luxe').description, 'Sea view')
+
+    def test_import_updates_rooms_by_number_and_room_types_by_slug(self):
+        room = create_test_room(create_test_room_data(slug='standard', price='10'), number='101')
+        rows = [{'number': '101', 'slug': 'luxe', 'name': 'Luxe', 'type': TYPE.LUXE, 'price': '500'}]
+
+        import_rooms([{'slug': 'standard', 'number': '101', 'price': '99.50'}] + rows)
+
+        room.refresh_from_db()
+        self.assertEqual(room.room_data.slug, 'luxe')
+        self.assertEqual(str(RoomData.objects.get(slug='standard').price), '99.50')
+        self.assertEqual(Room.objects.count(), 1)
+
+    def test_import_keeps_columns_a_row_omits_if_other_rows_in_batch_have_them(self):
+        room_data = create_test_room_data(name='Standard', slug='standard', description='Quiet')
+        room = create_test_room(room_data, number='101', status=STATUS.BOOKED)
+        rows = [
+            {'number': '101', 'slug': 'standard', 'price': '99'},
+            {
+                'number': '201',
+                'status': STATUS.FREE,
+                'slug': 'luxe',
+                'name': 'Luxe',
+                'description': 'Sea view',
+                'price': '500',
+            },
+        ]
+
+        import_rooms(rows)
+
+        room_data.refresh_from_db()
+        room.refresh_from_db()
+        self.assertEqual(room_data.name, 'Standard')
+        self.assertEqual(room_data.description, 'Quiet')
+        self.assertEqual(str(room_data.price), '99.00')
+        self.assertEqual(room.status, STATUS.BOOKED)
+        self.assertEqual(RoomData.objects.get(slug='luxe').description, 'Sea view')
+
+    def test_import_reads_jsonl(self):
+        rows = [{'number': 1, 'slug': 'economy', 'name': 'Economy', 'type': TYPE.ECONOMY, 'price': 20}]
+        path = self.write_file('rooms.jsonl', ''.join(json.dumps(row) + '\n' for row in rows))
+
+        call_command('import_rooms', path, stdout=StringIO())
+
+        self.assertEqual(Room.objects.get().room_data.type, TYPE.ECONOMY)
+
+    def test_import_invalidates_catalogue(self):
+        version = get_version(CATALOGUE)
+
+        import_rooms([{'number': '1', 'slug': 'standard', 'name': 'Standard', 'price': '1'}])
+
+        self.assertNotEqual(get_version(CATALOGUE), version)
+
+    def test_import_reports_invalid_rows_and_saves_nothing(self):
+        path = self.write_file('rooms.csv', CSV.replace('500.00', 'free'))
+
+        with self.assertRaisesRegex(CommandError, 'Row 3: invalid "price"'):
+            call_command('import_rooms', path, '--batch-size', '2', stdout=StringIO())
+
+        self.assertFalse(Room.objects.exists())
+
+
+class ExportRoomsTest(TestCase):
+    def test_export_writes_rows_readable_by_import(self):
+        create_test_room(create_test_room_data(slug='standard', price='100'), number='1')
+        stdout = StringIO()
+
+        call_command('export_rooms', '-', '--format', 'jsonl', stdout=stdout)
+        rows = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        Room.objects.all().delete()
+        import_rooms(rows)
+
+        self.assertEqual(rows[0]['number'], '1')
+        self.assertEqual(rows[0]['slug'], 'standard')
+        self.assertEqual(Room.objects.get().room_data.slug, 'standard')
+
+    def test_export_writes_csv_with_header(self):
+        create_test_room(number='1')
+        stdout = StringIO()
+
+        call_command('export_rooms', '-', '--format', 'csv', stdout=stdout)
+
+        self.assertTrue(stdout.getvalue().startswith('number,status,is_available,slug,'))
@@ -1,11 +1,15 @@
-from django.db import models
+from unittest import skipUnless
+
+from django.db import connection, models
 
 from utils.cases import ModelTestCase
 
 from rooms.models import RoomData, TYPE, Room, STATUS
 
 
-def create_test_room_data(name='title', slug='slug', price='9999', **extra_field) -> RoomData:
+def create_test_room_data(name='title', slug=None, price='9999', **extra_field) -> RoomData:
+    if slug is None:
+        slug = f'slug-{RoomData.objects.count()}'
     return RoomData.objects.create(name=name, slug=slug, price=price, **extra_field)
 
 
@@ -77,6 +81,30 @@ class RoomDataModelTest(ModelTestCase):
         room_data = create_test_room_data(single_beds=1, double_beds=1)
         self.assertEqual(room_data.persons, 3)
 
+    def test_persons_property_reflects_unsaved_beds(self):
+        room_data = self.Model(single_beds=2, double_beds=1)
+        self.assertEqual(room_data.persons, 4)
+
+        room_data = create_test_room_data(single_beds=1)
+        room_data.double_beds = 1
+        self.assertEqual(room_data.persons, 3)
+
+    def test_capacity_is_computed_by_database_for_any_beds(self):
+        create_test_room_data(single_beds=2, double_beds=0)
+        create_test_room_data(single_beds=0, double_beds=2)
+
+        self.assertEqual(list(self.Model.objects.order_by('pk').values_list('capacity', flat=True)), [2, 4])
+        self.assertEqual(self.Model.objects.filter(capacity__gte=3).count(), 1)
+
+    @skipUnless(connection.vendor == 'sqlite', 'Query plans are checked on SQLite.')
+    def test_capacity_search_uses_index(self):
+        room_data = self.Model.objects.filter(type=TYPE.STANDARD, capacity__gte=2)
+        self.assertQueryUsesIndex(room_data, 'room_data_type_capacity_idx')
+
+    def test_slug_field_is_unique(self):
+        field = self.get_field(self.Model, 'slug')
+        self.assertTrue(field.unique)
+
 
 class RoomModelTest(ModelTestCase):
     def setUp(self) -> None:
@@ -123,3 +151,8 @@ class RoomModelTest(ModelTestCase):
     def test_model_instances_are_ordered_by_number(self):
         attr = self.get_meta_attr(self.Model, 'ordering')
         self.assertIn('number', attr)
+
+    @skipUnless(connection.vendor == 'sqlite', 'Query plans are checked on SQLite.')
+    def test_admin_filters_use_index(self):
+        rooms = self.Model.objects.filter(status=STATUS.FREE, is_available=True)
+        self.assertQueryUsesIndex(rooms, 'room_status_available_idx')
@@ -0,0 +1,55 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+from rooms.cache import PRICING
+from rooms.models import RoomRate, RoomRateNight
+from rooms.pricing import rebuild_rate_nights
+from rooms.tests.test_models import create_test_room_data
+from utils.cache import get_version
+
+
+class RoomRateNightsTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.room_data = create_test_room_data()
+
+    def get_prices(self):
+        return dict(RoomRateNight.objects.values_list('date', 'price'))
+
+    def test_saving_rate_writes_price_per_night(self):
+        RoomRate.objects.create(room_data=self.room_data, start=date(2030, 1, 1), end=date(2030, 1, 3), price='10')
+
+        self.assertEqual(self.get_prices(), {date(2030, 1, 1): Decimal('10'), date(2030, 1, 2): Decimal('10')})
+
+    def test_later_rate_overrides_overlapping_nights(self):
+        RoomRate.objects.create(room_data=self.room_data, start=date(2030, 1, 1), end=date(2030, 1, 4), price='10')
+        RoomRate.objects.create(room_data=self.room_data, start=date(2030, 1, 2), end=date(2030, 1, 3), price='20')
+
+        self.assertEqual(self.get_prices()[date(2030, 1, 2)], Decimal('20'))
+        self.assertEqual(self.get_prices()[date(2030, 1, 3)], Decimal('10'))
+
+    def test_deleting_rate_removes_its_nights_and_bumps_pricing_version(self):
+        rate = RoomRate.objects.create(
+            room_data=self.room_data, start=date(2030, 1, 1), end=date(2030, 1, 3), price='1'
+        )
+        version = get_version(PRICING)
+
+        rate.delete()
+
+        self.assertEqual(self.get_prices(), {})
+        self.assertNotEqual(get_version(PRICING), version)
+
+    def test_rebuild_restores_table_and_command_reports_it(self):
+        RoomRate.objects.create(room_data=self.room_data, start=date(2030, 1, 1), end=date(2030, 1, 3), price='1')
+        RoomRateNight.objects.all().delete()
+        stdout = StringIO()
+
+        call_command('rebuild_room_rates', stdout=stdout)
+
+        self.assertIn('Written 2 night prices.', stdout.getvalue())
+        self.assertEqual(rebuild_rate_nights([self.room_data.pk]), 2)
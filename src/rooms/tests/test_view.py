@@ -1,11 +1,15 @@
+from django.core.cache import cache
 from django.urls import reverse
 from django.test import TestCase
+from django.utils.http import http_date
 
-from rooms.tests.test_models import create_test_room_data
+from accounts.tests import create_test_user
+from rooms.tests.test_models import create_test_room, create_test_room_data
 
 
 class RoomDataListViewTest(TestCase):
     def setUp(self) -> None:
+        cache.clear()
         self.url = reverse('rooms:room-list')
 
     def test_view_uses_correct_template(self):
@@ -33,3 +37,75 @@ class RoomDataListViewTest(TestCase):
 
         for text in expected_text:
             self.assertContains(response, text)
+
+    def test_view_makes_no_queries_on_warm_cache(self):
+        create_test_room_data()
+        self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+
+        self.assertContains(response, 'Title: title')
+
+    def test_view_renders_changes_after_room_data_is_saved(self):
+        room_data = create_test_room_data()
+        self.client.get(self.url)
+
+        room_data.name = 'new title'
+        room_data.save()
+        response = self.client.get(self.url)
+
+        self.assertContains(response, 'Title: new title')
+
+    def test_view_renders_changes_after_room_data_is_deleted(self):
+        room_data = create_test_room_data()
+        self.client.get(self.url)
+
+        room_data.delete()
+        response = self.client.get(self.url)
+
+        self.assertContains(response, "Rooms aren't added yet")
+
+    def test_view_returns_etag_and_last_modified_headers(self):
+        room_data = create_test_room_data()
+        create_test_room(room_data)
+        room_data.save()
+
+        response = self.client.get(self.url)
+
+        self.assertTrue(response.has_header('ETag'))
+        self.assertEqual(response['Last-Modified'], http_date(room_data.updated.timestamp()))
+
+    def test_view_returns_not_modified_for_fresh_etag(self):
+        create_test_room_data()
+        etag = self.client.get(self.url)['ETag']
+
+        response = self.client.get(self.url, headers={'if-none-match': etag})
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_view_changes_etag_after_room_is_saved(self):
+        room_data = create_test_room_data()
+        etag = self.client.get(self.url)['ETag']
+
+        create_test_room(room_data)
+        response = self.client.get(self.url, headers={'if-none-match': etag})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_view_varies_on_cookie(self):
+        response = self.client.get(self.url)
+
+        self.assertIn('Cookie', response['Vary'])
+
+    def test_view_doesnt_validate_page_of_authenticated_user(self):
+        create_test_room_data()
+        etag = self.client.get(self.url)['ETag']
+        self.client.force_login(create_test_user())
+
+        response = self.client.get(self.url, headers={'if-none-match': etag})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('ETag'))
+        self.assertFalse(response.has_header('Last-Modified'))
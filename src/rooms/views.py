@@ -1,8 +1,34 @@
+from django.core.cache import cache
+from django.template import loader
+from django.utils.decorators import method_decorator
+from django.utils.safestring import mark_safe
 from django.views import generic
+from django.views.decorators.http import condition
+from django.views.decorators.vary import vary_on_cookie
 
+from rooms.cache import CATALOGUE, CATALOGUE_TIMEOUT, get_catalogue_etag, get_catalogue_last_modified
 from rooms.models import RoomData
+from utils.cache import make_versioned_key
 
 
+@method_decorator(vary_on_cookie, name='dispatch')
+@method_decorator(condition(etag_func=get_catalogue_etag, last_modified_func=get_catalogue_last_modified), name='get')
 class RoomDataListView(generic.ListView):
     model = RoomData
     template_name = 'rooms/list.html'
+    catalogue_template_name = 'rooms/catalogue.html'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['catalogue'] = self.get_catalogue()
+        return context
+
+    def get_catalogue(self):
+        key = make_versioned_key(CATALOGUE, 'html')
+        catalogue = cache.get(key)
+
+        if catalogue is None:
+            catalogue = loader.render_to_string(self.catalogue_template_name, {'object_list': self.object_list})
+            cache.set(key, catalogue, CATALOGUE_TIMEOUT)
+
+        return mark_safe(catalogue)
@@ -0,0 +1,25 @@
+from uuid import uuid4
+
+from django.core.cache import cache
+
+VERSION_KEY = 'version:{}'
+
+
+def get_version(namespace):
+    key = VERSION_KEY.format(namespace)
+    version = cache.get(key)
+
+    if version is None:
+        version = uuid4().hex
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+
+    return version
+
+
+def bump_version(namespace):
+    cache.set(VERSION_KEY.format(namespace), uuid4().hex, timeout=None)
+
+
+def make_versioned_key(namespace, *parts):
+    return ':'.join([namespace, get_version(namespace), *map(str, parts)])
@@ -1,4 +1,5 @@
 from .form_test_case import FormTestCase
 from .model_test_case import ModelTestCase
+from .query_budget_test_case import QueryBudgetTestCase
 
-__all__ = ['ModelTestCase', 'FormTestCase']
+__all__ = ['ModelTestCase', 'FormTestCase', 'QueryBudgetTestCase']
@@ -1,6 +1,6 @@
 from typing import Type
 
-from django.db.models import Field, Model
+from django.db.models import Field, Model, QuerySet
 from django.test import TestCase
 
 
@@ -25,3 +25,7 @@ class ModelTestCase(TestCase):
 
         for field in fields:
             self.assertIn(field, model_fields, msg=f'Model does not has : "{field}"')
+
+    def assertQueryUsesIndex(self, queryset: QuerySet, index: str):
+        plan = queryset.explain()
+        self.assertIn(index, plan, msg=f'Query does not use index "{index}":\n{plan}')
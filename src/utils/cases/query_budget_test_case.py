@@ -0,0 +1,84 @@
+import json
+from time import perf_counter
+from typing import ClassVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+
+def load_query_budgets(path=None):
+    try:
+        with open(path or settings.QUERY_BUDGETS_FILE) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+
+def save_query_budgets(budgets, path=None):
+    with open(path or settings.QUERY_BUDGETS_FILE, 'w') as file:
+        json.dump(dict(sorted(budgets.items())), file, indent=4)
+        file.write('\n')
+
+
+class QueryBudgetTestCase(TestCase):
+    scales = (1, 10)
+    repeat = 3
+    record = False
+    recorded: ClassVar[dict] = {}
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.budgets = load_query_budgets()
+
+    def seed(self, count):
+        pass
+
+    def measure(self, request, prepare=None):
+        cache.clear()
+        if prepare is not None:
+            prepare()
+
+        with CaptureQueriesContext(connection) as context:
+            started = perf_counter()
+            response = request()
+            if response.streaming:
+                b''.join(response.streaming_content)
+            elapsed = perf_counter() - started
+        return response, len(context), elapsed
+
+    def assertWithinBudget(self, name, request, prepare=None):
+        queries, seeded = [], 0
+        for scale in self.scales:
+            self.seed(scale - seeded)
+            seeded = scale
+            response, count, _ = self.measure(request, prepare)
+            self.assertLess(response.status_code, 400, msg=f'"{name}" responded with {response.status_code}')
+            queries.append(count)
+
+        check_time = self.record or settings.QUERY_BUDGET_CHECK_TIME
+        elapsed = min(self.measure(request, prepare)[2] for _ in range(self.repeat)) * 1000 if check_time else 0
+
+        if self.record:
+            self.recorded[name] = {'queries': max(queries), 'time_ms': round(elapsed, 2)}
+            return
+
+        self.assertEqual(
+            len(set(queries)),
+            1,
+            msg=f'"{name}" query count grows with data: {dict(zip(self.scales, queries))}',
+        )
+        budget = self.budgets.get(name)
+        self.assertIsNotNone(budget, msg=f'"{name}" has no budget, run "manage.py update_query_budgets"')
+        self.assertLessEqual(
+            queries[-1],
+            budget['queries'],
+            msg=f'"{name}" runs {queries[-1]} queries, budget is {budget["queries"]}',
+        )
+        if not settings.QUERY_BUDGET_CHECK_TIME:
+            return
+        limit = max(budget['time_ms'] * settings.QUERY_BUDGET_TIME_FACTOR, settings.QUERY_BUDGET_MIN_TIME_MS)
+        self.assertLessEqual(elapsed, limit, msg=f'"{name}" took {elapsed:.2f} ms, limit is {limit:.2f} ms')
@@ -0,0 +1,28 @@
+from time import perf_counter
+
+from django.core.management import BaseCommand
+
+from utils.seeding import seed_hotel
+
+
+class Command(BaseCommand):
+    help = 'Generates room types, rooms, guests with profiles and bookings with overlapping dates.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rooms', type=int, default=100)
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--bookings', type=int, default=5000)
+        parser.add_argument('--room-types', type=int, help='Defaults to a tenth of rooms.')
+        parser.add_argument('--days', type=int, default=180, help='Window of check-in dates from tomorrow.')
+        parser.add_argument('--allocate', action='store_true', help='Assign free rooms to pending bookings.')
+        parser.add_argument('--seed', type=int, help='Seed of the random generator for repeatable data.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, rooms, users, bookings, room_types, days, allocate, seed, batch_size, **options):
+        started = perf_counter()
+        result = seed_hotel(rooms, users, bookings, room_types, days, allocate, seed, batch_size)
+
+        self.stdout.write(
+            f'Created {result.rooms} rooms of {result.room_data} room types, {result.users} users '
+            f'and {result.bookings} bookings ({result.assigned} with rooms) in {perf_counter() - started:.1f} s.'
+        )
@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.management import BaseCommand, call_command
+
+from utils.cases import QueryBudgetTestCase
+from utils.cases.query_budget_test_case import load_query_budgets, save_query_budgets
+
+
+class Command(BaseCommand):
+    help = 'Runs query budget tests in record mode and writes measured budgets to QUERY_BUDGETS_FILE.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('test_labels', nargs='*', help='Defaults to utils.tests.test_query_budgets.')
+
+    def handle(self, *args, test_labels, **options):
+        QueryBudgetTestCase.record = True
+        QueryBudgetTestCase.recorded.clear()
+        try:
+            call_command('test', *(test_labels or ['utils.tests.test_query_budgets']), verbosity=0, interactive=False)
+        finally:
+            QueryBudgetTestCase.record = False
+
+        budgets = load_query_budgets()
+        budgets.update(QueryBudgetTestCase.recorded)
+        save_query_budgets(budgets)
+
+        self.stdout.write(f'Updated {len(QueryBudgetTestCase.recorded)} budgets in {settings.QUERY_BUDGETS_FILE}.')
@@ -0,0 +1,22 @@
+from time import perf_counter
+
+from django.core.management import BaseCommand, CommandError
+from django.template import TemplateSyntaxError
+
+from utils.warmup import warm_templates
+
+
+class Command(BaseCommand):
+    help = 'Compiles templates of the project apps into the cached template loader.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('app_labels', nargs='*', help='Defaults to WARM_TEMPLATES_APPS.')
+
+    def handle(self, *args, app_labels, **options):
+        started = perf_counter()
+        try:
+            names = warm_templates(app_labels or None)
+        except (LookupError, TemplateSyntaxError) as error:
+            raise CommandError(error)
+
+        self.stdout.write(f'Compiled {len(names)} templates in {(perf_counter() - started) * 1000:.1f} ms.')
@@ -0,0 +1,72 @@
+import logging
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+
+from utils.performance import RequestMetrics, current_metrics, instrument_cache, view_stats
+
+logger = logging.getLogger('performance')
+
+
+class PerformanceMiddleware:
+    def __init__(self, get_response):
+        if not settings.PERFORMANCE_MIDDLEWARE:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        instrument_cache(caches['default'])
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        try:
+            with connection.execute_wrapper(metrics):
+                response = self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+        metrics.stop()
+        response['Server-Timing'] = metrics.get_server_timing()
+
+        if response.streaming:
+            # The body of a streaming response is produced while it is sent, after the headers. So Server-Timing
+            # only covers the view, while the stats and the log are recorded once the last chunk is sent.
+            content = response.streaming_content
+            if response.is_async:
+                response.streaming_content = self.measure_async_stream(content, request, response, metrics)
+            else:
+                response.streaming_content = self.measure_stream(content, request, response, metrics)
+        else:
+            self.record(request, response, metrics)
+
+        return response
+
+    def measure_stream(self, content, request, response, metrics):
+        try:
+            with connection.execute_wrapper(metrics):
+                yield from content
+        finally:
+            metrics.stop()
+            self.record(request, response, metrics)
+
+    async def measure_async_stream(self, content, request, response, metrics):
+        try:
+            async for chunk in content:
+                yield chunk
+        finally:
+            metrics.stop()
+            self.record(request, response, metrics)
+
+    def record(self, request, response, metrics):
+        view = request.resolver_match.view_name if request.resolver_match else None
+        view_stats.add(view, metrics)
+
+        if logger.isEnabledFor(logging.INFO):
+            data = {'view': view, 'method': request.method, 'status': response.status_code, **metrics.as_dict()}
+            logger.info('%s %s %s', request.method, request.path, response.status_code, extra={'metrics': data})
+
+    def process_template_response(self, request, response):
+        metrics = current_metrics.get()
+        if metrics is not None:
+            metrics.start_template(response)
+        return response
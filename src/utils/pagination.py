@@ -0,0 +1,89 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage
+from django.db.models import Q
+
+INVALID_CURSOR_ERROR_MESSAGE = 'Invalid page cursor.'
+
+
+class KeysetPage:
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+
+class KeysetPaginator:
+    def __init__(self, queryset, per_page, ordering=('-created', '-pk')):
+        self.queryset = queryset.order_by(*ordering)
+        self.per_page = per_page
+        self.ordering = ordering
+        self.fields = [
+            queryset.model._meta.pk if name.lstrip('-') == 'pk' else queryset.model._meta.get_field(name.lstrip('-'))
+            for name in ordering
+        ]
+
+    def get_page(self, cursor=None, before=None):
+        if before:
+            return self.get_previous_page(before)
+
+        queryset = self.queryset
+        if cursor:
+            queryset = queryset.filter(self.get_seek_filter(self.decode_cursor(cursor)))
+
+        object_list, has_more = self.get_objects(queryset)
+        next_cursor = self.encode_cursor(object_list[-1]) if has_more else None
+        # A page opened by a cursor comes after the objects of the page that gave it.
+        previous_cursor = self.encode_cursor(object_list[0]) if cursor and object_list else None
+        return KeysetPage(object_list, next_cursor, previous_cursor)
+
+    def get_previous_page(self, cursor):
+        queryset = self.queryset.reverse().filter(self.get_seek_filter(self.decode_cursor(cursor), reverse=True))
+
+        object_list, has_more = self.get_objects(queryset)
+        object_list.reverse()
+        previous_cursor = self.encode_cursor(object_list[0]) if has_more else None
+        next_cursor = self.encode_cursor(object_list[-1]) if object_list else None
+        return KeysetPage(object_list, next_cursor, previous_cursor)
+
+    def get_objects(self, queryset):
+        object_list = list(queryset[: self.per_page + 1])
+        return object_list[: self.per_page], len(object_list) > self.per_page
+
+    def get_seek_filter(self, values, reverse=False):
+        seek_filter = Q()
+        for position, name in enumerate(self.ordering):
+            lookup = {field.attname: value for field, value in zip(self.fields[:position], values)}
+            operator = 'lt' if name.startswith('-') != reverse else 'gt'
+            lookup[f'{self.fields[position].attname}__{operator}'] = values[position]
+            seek_filter |= Q(**lookup)
+        return seek_filter
+
+    def encode_cursor(self, obj):
+        values = [field.value_to_string(obj) for field in self.fields]
+        return urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            values = json.loads(urlsafe_b64decode(cursor.encode()))
+            if len(values) != len(self.fields):
+                raise ValueError
+            return [field.to_python(value) for field, value in zip(self.fields, values)]
+        except (TypeError, ValueError, ValidationError):
+            raise InvalidPage(INVALID_CURSOR_ERROR_MESSAGE)
@@ -0,0 +1,148 @@
+import json
+import logging
+import threading
+from collections import defaultdict, deque
+from contextvars import ContextVar
+from time import perf_counter
+
+current_metrics = ContextVar('current_metrics', default=None)
+MISSING = object()
+
+
+class RequestMetrics:
+    __slots__ = (
+        'started',
+        'total',
+        'db_queries',
+        'db_time',
+        'template_started',
+        'template_time',
+        'cache_hits',
+        'cache_misses',
+    )
+
+    def __init__(self):
+        self.started = perf_counter()
+        self.total = 0
+        self.db_queries = 0
+        self.db_time = 0
+        self.template_started = None
+        self.template_time = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += perf_counter() - started
+            self.db_queries += 1
+
+    def start_template(self, response):
+        self.template_started = perf_counter()
+        response.add_post_render_callback(self.stop_template)
+        return response
+
+    def stop_template(self, response):
+        self.template_time += perf_counter() - self.template_started
+
+    def stop(self):
+        self.total = perf_counter() - self.started
+
+    def as_dict(self):
+        return {
+            'total_ms': round(self.total * 1000, 2),
+            'db_queries': self.db_queries,
+            'db_ms': round(self.db_time * 1000, 2),
+            'template_ms': round(self.template_time * 1000, 2),
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+        }
+
+    def get_server_timing(self):
+        return (
+            f'total;dur={self.total * 1000:.2f}, '
+            f'db;dur={self.db_time * 1000:.2f};desc="{self.db_queries} queries", '
+            f'template;dur={self.template_time * 1000:.2f}, '
+            f'cache;desc="{self.cache_hits} hits / {self.cache_misses} misses"'
+        )
+
+
+class MetricsFormatter(logging.Formatter):
+    def format(self, record):
+        message = super().format(record)
+        metrics = getattr(record, 'metrics', None)
+        if metrics is None:
+            return message
+        return f'{message} {json.dumps(metrics, sort_keys=True)}'
+
+
+def instrument_cache(cache):
+    if getattr(cache, '_instrumented', False):
+        return
+
+    get, get_many = cache.get, cache.get_many
+
+    def instrumented_get(key, default=None, version=None):
+        value = get(key, MISSING, version)
+        metrics = current_metrics.get()
+        if metrics is not None:
+            if value is MISSING:
+                metrics.cache_misses += 1
+            else:
+                metrics.cache_hits += 1
+        return default if value is MISSING else value
+
+    def instrumented_get_many(keys, version=None):
+        keys = list(keys)
+        values = get_many(keys, version)
+        metrics = current_metrics.get()
+        if metrics is not None:
+            metrics.cache_hits += len(values)
+            metrics.cache_misses += len(keys) - len(values)
+        return values
+
+    cache.get, cache.get_many = instrumented_get, instrumented_get_many
+    cache._instrumented = True
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+class ViewStats:
+    def __init__(self, size=1000):
+        self.size = size
+        self.lock = threading.Lock()
+        self.durations = defaultdict(lambda: deque(maxlen=self.size))
+        self.queries = defaultdict(lambda: deque(maxlen=self.size))
+
+    def add(self, view, metrics):
+        with self.lock:
+            self.durations[view].append(metrics.total)
+            self.queries[view].append(metrics.db_queries)
+
+    def clear(self):
+        with self.lock:
+            self.durations.clear()
+            self.queries.clear()
+
+    def summary(self):
+        with self.lock:
+            items = [(view, list(durations), list(self.queries[view])) for view, durations in self.durations.items()]
+
+        return [
+            {
+                'view': view,
+                'count': len(durations),
+                'p50_ms': percentile(durations, 0.5) * 1000,
+                'p95_ms': percentile(durations, 0.95) * 1000,
+                'avg_queries': sum(queries) / len(queries),
+            }
+            for view, durations, queries in sorted(items, key=lambda item: item[0] or '')
+        ]
+
+
+view_stats = ViewStats()
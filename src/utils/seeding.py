@@ -0,0 +1,146 @@
+import random
+import re
+from datetime import timedelta
+from decimal import Decimal
+from typing import NamedTuple
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.db.models.functions import Length
+from django.utils import timezone
+
+from bookings.allocation import allocate_rooms
+from bookings.cache import AVAILABILITY
+from bookings.models import Booking
+from rooms.cache import CATALOGUE, PRICING
+from rooms.models import TYPE, TYPE_LABELS, Room, RoomData
+from utils.cache import bump_version
+
+User = get_user_model()
+
+SEED_PASSWORD = 'qwe123!@#'
+FIRST_NAMES = ['Rick', 'Morty', 'Summer', 'Beth', 'Jerry', 'Birdperson', 'Tammy', 'Squanchy', 'Gene', 'Jessica']
+LAST_NAMES = ['Sanchez', 'Smith', 'Poopybutthole', 'Goldenfold', 'Gearhead', 'Krombopulos', 'Vance', 'Shleemypants']
+# Kinds of rooms by type: (single beds, double beds, base price).
+LAYOUTS = {
+    TYPE.ECONOMY: [(1, 0, 40), (2, 0, 55)],
+    TYPE.STANDARD: [(2, 0, 80), (0, 1, 85), (1, 1, 110)],
+    TYPE.DELUXE: [(0, 1, 150), (2, 1, 210)],
+    TYPE.LUXE: [(0, 1, 300), (0, 2, 450)],
+}
+TYPE_WEIGHTS = {TYPE.ECONOMY: 3, TYPE.STANDARD: 5, TYPE.DELUXE: 2, TYPE.LUXE: 1}
+NIGHT_WEIGHTS = {1: 10, 2: 14, 3: 12, 4: 8, 5: 6, 6: 4, 7: 6, 10: 2, 14: 1}
+
+
+class Seed(NamedTuple):
+    room_data: int
+    rooms: int
+    users: int
+    bookings: int
+    assigned: int
+
+
+def get_next_number(queryset, field, prefix, suffix=''):
+    # Seeded values only differ by the number, so the longest and then greatest one has the highest number. Counting
+    # rows instead would reuse numbers after deletions.
+    values = queryset.filter(**{f'{field}__regex': rf'^{re.escape(prefix)}[0-9]+{re.escape(suffix)}$'})
+    last = values.order_by(Length(field).desc(), f'-{field}').values_list(field, flat=True).first()
+    if last is None:
+        return 0
+    return int(last[len(prefix) : len(last) - len(suffix)]) + 1
+
+
+def seed_room_data(count, rnd, batch_size=1000):
+    offset = get_next_number(RoomData.objects.all(), 'slug', 'seed-')
+    types = rnd.choices(list(TYPE_WEIGHTS), weights=TYPE_WEIGHTS.values(), k=count)
+    room_data = []
+
+    for number, type in enumerate(types, offset):
+        single_beds, double_beds, price = rnd.choice(LAYOUTS[type])
+        room_data.append(
+            RoomData(
+                name=f'{TYPE_LABELS[type]} {number}',
+                slug=f'seed-{number}',
+                type=type,
+                single_beds=single_beds,
+                double_beds=double_beds,
+                price=Decimal(price + rnd.randrange(0, 30, 5)),
+                description=f'{TYPE_LABELS[type]} room with {single_beds} single and {double_beds} double beds.',
+            )
+        )
+
+    return RoomData.objects.bulk_create(room_data, batch_size=batch_size)
+
+
+def seed_rooms(count, room_data, rnd, batch_size=1000):
+    offset = get_next_number(Room.objects.all(), 'number', 'S')
+    rooms = (
+        Room(room_data=room_data[number % len(room_data)], number=f'S{number}', is_available=rnd.random() > 0.02)
+        for number in range(offset, offset + count)
+    )
+    return Room.objects.bulk_create(rooms, batch_size=batch_size)
+
+
+def seed_users(count, rnd, password=SEED_PASSWORD, batch_size=1000):
+    offset = get_next_number(User.objects.all(), 'email', 'guest', '@seed.test')
+    password_hash = make_password(password)
+    rows = (
+        {
+            'email': f'guest{number}@seed.test',
+            'password_hash': password_hash,
+            'email_is_confirmed': rnd.random() > 0.1,
+            'profile': {
+                'first_name': rnd.choice(FIRST_NAMES),
+                'last_name': rnd.choice(LAST_NAMES),
+                'birthday': timezone.now().date() - timedelta(days=rnd.randint(18 * 365, 80 * 365)),
+                'telephone': f'+380{rnd.randrange(10**9):09}',
+            },
+        }
+        for number in range(offset, offset + count)
+    )
+    return User.objects.bulk_create_users(rows, batch_size=batch_size)
+
+
+def seed_bookings(count, users, rnd, days=180, batch_size=1000):
+    start = timezone.now().date() + timedelta(days=1)
+    types = rnd.choices(list(TYPE_WEIGHTS), weights=TYPE_WEIGHTS.values(), k=count)
+    nights = rnd.choices(list(NIGHT_WEIGHTS), weights=NIGHT_WEIGHTS.values(), k=count)
+    bookings = []
+
+    for type, length in zip(types, nights):
+        # Most guests book a few weeks ahead, so check-ins crowd at the start of the window and overlap.
+        check_in = start + timedelta(days=int(rnd.triangular(0, days, 0)))
+        bookings.append(
+            Booking(
+                user=rnd.choice(users),
+                type=type,
+                persons=rnd.randint(1, 2 if type == TYPE.ECONOMY else 4),
+                has_children=rnd.random() < 0.2,
+                is_paid=rnd.random() < 0.6,
+                check_in=check_in,
+                check_out=check_in + timedelta(days=length),
+            )
+        )
+
+    return Booking.objects.bulk_create(bookings, batch_size=batch_size)
+
+
+def seed_hotel(rooms, users, bookings, room_types=None, days=180, allocate=False, seed=None, batch_size=1000):
+    rnd = random.Random(seed)
+    room_types = room_types or max(1, rooms // 10)
+
+    with transaction.atomic():
+        room_data = seed_room_data(room_types, rnd, batch_size) if rooms else []
+        created_rooms = seed_rooms(rooms, room_data, rnd, batch_size) if rooms else []
+        created_users = seed_users(users, rnd, batch_size=batch_size)
+        guests = created_users or list(User.objects.filter(is_staff=False)[:1000])
+        created_bookings = seed_bookings(bookings, guests, rnd, days, batch_size) if guests else []
+
+    bump_version(CATALOGUE)
+    bump_version(PRICING)
+    bump_version(AVAILABILITY)
+
+    assigned = len(allocate_rooms(batch_size=batch_size).assigned) if allocate else 0
+
+    return Seed(len(room_data), len(created_rooms), len(created_users), len(created_bookings), assigned)
@@ -0,0 +1,57 @@
+import csv
+import json
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+FORMATS = ['csv', 'jsonl']
+UNKNOWN_FORMAT_ERROR_MESSAGE = 'Unknown format "{}", use one of: {}.'
+
+
+class Echo:
+    def write(self, value):
+        return value
+
+
+def get_format(path, format=None):
+    format = format or Path(path).suffix.lstrip('.').lower()
+    if format not in FORMATS:
+        raise ValueError(UNKNOWN_FORMAT_ERROR_MESSAGE.format(format, ', '.join(FORMATS)))
+    return format
+
+
+@contextmanager
+def open_stream(path, mode, stream):
+    if path == '-':
+        yield stream
+    else:
+        with open(path, mode, newline='', encoding='utf-8') as file:
+            yield file
+
+
+def read_rows(file, format):
+    if format == 'csv':
+        yield from csv.DictReader(file)
+    else:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_lines(rows, fields, format):
+    if format == 'csv':
+        writer = csv.writer(Echo())
+        yield writer.writerow(fields)
+        for row in rows:
+            yield writer.writerow([row[field] for field in fields])
+    else:
+        for row in rows:
+            yield json.dumps({field: row[field] for field in fields}, cls=DjangoJSONEncoder) + '\n'
+
+
+def write_rows(rows, fields, path, format, stream):
+    format = get_format(path, format)
+    with open_stream(path, 'w', stream) as file:
+        for line in iter_lines(rows, fields, format):
+            file.write(line)
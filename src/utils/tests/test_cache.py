@@ -0,0 +1,35 @@
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from utils.cache import bump_version, get_version, make_versioned_key
+
+
+class VersionedCacheTest(SimpleTestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_get_version_returns_same_version_until_bump(self):
+        version = get_version('namespace')
+
+        self.assertEqual(get_version('namespace'), version)
+
+        bump_version('namespace')
+
+        self.assertNotEqual(get_version('namespace'), version)
+
+    def test_versions_of_namespaces_are_independent(self):
+        version = get_version('namespace')
+
+        bump_version('other')
+
+        self.assertEqual(get_version('namespace'), version)
+
+    def test_make_versioned_key_changes_after_bump(self):
+        key = make_versioned_key('namespace', 'part', 1)
+
+        self.assertTrue(key.startswith('namespace:'))
+        self.assertTrue(key.endswith(':part:1'))
+
+        bump_version('namespace')
+
+        self.assertNotEqual(make_versioned_key('namespace', 'part', 1), key)
@@ -1,7 +1,19 @@
+import os
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+
 from django import forms
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.db import models
+from django.http import HttpResponse
+from django.test import override_settings
+
+from utils.cases import FormTestCase, ModelTestCase, QueryBudgetTestCase
+from utils.cases.query_budget_test_case import load_query_budgets, save_query_budgets
 
-from utils.cases import FormTestCase, ModelTestCase
+User = get_user_model()
 
 
 class TestModel(models.Model):
@@ -91,3 +103,79 @@ class FormTestCaseTest(FormTestCase):
 
         with self.assertRaises(AssertionError):
             self.assertFieldListEqual(fields, expected_fields)
+
+
+class QueryBudgetTestCaseTest(QueryBudgetTestCase):
+    def setUp(self) -> None:
+        self.rows = 0
+        self.budgets = {'view': {'queries': 1, 'time_ms': 10}}
+
+    def seed(self, count):
+        self.rows += count
+
+    def request(self, queries):
+        def request():
+            for _ in range(queries()):
+                User.objects.exists()
+            return HttpResponse()
+
+        return request
+
+    def test_assertWithinBudget_not_raise_error(self):
+        self.assertWithinBudget('view', self.request(lambda: 1))  # not raise
+
+    def test_assertWithinBudget_raise_error_for_n_plus_one(self):
+        with self.assertRaisesRegex(AssertionError, 'query count grows with data'):
+            self.assertWithinBudget('view', self.request(lambda: self.rows))
+
+    def test_assertWithinBudget_raise_error_for_exceeded_query_budget(self):
+        with self.assertRaisesRegex(AssertionError, 'runs 2 queries, budget is 1'):
+            self.assertWithinBudget('view', self.request(lambda: 2))
+
+    def test_assertWithinBudget_raise_error_for_missing_budget(self):
+        with self.assertRaisesRegex(AssertionError, 'has no budget'):
+            self.assertWithinBudget('unknown', self.request(lambda: 1))
+
+    @override_settings(QUERY_BUDGET_TIME_FACTOR=0, QUERY_BUDGET_MIN_TIME_MS=0)
+    def test_assertWithinBudget_raise_error_for_exceeded_time_budget(self):
+        with self.assertRaisesRegex(AssertionError, 'limit is 0.00 ms'):
+            self.assertWithinBudget('view', self.request(lambda: 1))
+
+    @override_settings(QUERY_BUDGET_CHECK_TIME=False, QUERY_BUDGET_TIME_FACTOR=0, QUERY_BUDGET_MIN_TIME_MS=0)
+    def test_assertWithinBudget_skips_time_budget_if_check_is_off(self):
+        self.assertWithinBudget('view', self.request(lambda: 1))  # not raise
+
+    def test_assertWithinBudget_records_budget(self):
+        with patch.object(QueryBudgetTestCase, 'record', True), patch.object(QueryBudgetTestCase, 'recorded', {}):
+            self.assertWithinBudget('view', self.request(lambda: 3))
+
+            self.assertEqual(QueryBudgetTestCase.recorded['view']['queries'], 3)
+
+    def test_save_query_budgets_writes_file_readable_by_load(self):
+        path = os.path.join(tempfile.mkdtemp(), 'budgets.json')
+
+        save_query_budgets({'view': {'queries': 1, 'time_ms': 1.5}}, path)
+
+        self.assertEqual(load_query_budgets(path), {'view': {'queries': 1, 'time_ms': 1.5}})
+
+    def test_load_query_budgets_returns_empty_dict_for_missing_file(self):
+        self.assertEqual(load_query_budgets(os.path.join(tempfile.mkdtemp(), 'budgets.json')), {})
+
+    def test_command_merges_recorded_budgets_into_file(self):
+        path = os.path.join(tempfile.mkdtemp(), 'budgets.json')
+        save_query_budgets({'old': {'queries': 1, 'time_ms': 1}, 'view': {'queries': 9, 'time_ms': 9}}, path)
+
+        def run_tests(*args, **kwargs):
+            QueryBudgetTestCase.recorded['view'] = {'queries': 2, 'time_ms': 2}
+
+        with (
+            override_settings(QUERY_BUDGETS_FILE=path),
+            patch.object(QueryBudgetTestCase, 'recorded', {}),
+            patch('utils.management.commands.update_query_budgets.call_command', run_tests),
+        ):
+            call_command('update_query_budgets', stdout=StringIO())
+
+        self.assertEqual(
+            load_query_budgets(path), {'old': {'queries': 1, 'time_ms': 1}, 'view': {'queries': 2, 'time_ms': 2}}
+        )
+        self.assertFalse(QueryBudgetTestCase.record)
@@ -0,0 +1,181 @@
+import json
+import logging
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.tests import create_test_user
+from bookings.tests.test_models import create_test_booking
+from rooms.tests.test_models import create_test_room
+from utils.performance import MetricsFormatter, RequestMetrics, ViewStats, view_stats
+
+User = get_user_model()
+
+
+@override_settings(PERFORMANCE_MIDDLEWARE=True)
+class PerformanceMiddlewareTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        view_stats.clear()
+        patcher = patch.object(logging.getLogger('performance'), 'handlers', [])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_timing(self, response):
+        return dict(
+            (part.strip().split(';', 1) + [''])[:2] for part in response['Server-Timing'].split(',') if part.strip()
+        )
+
+    def test_response_has_server_timing_header(self):
+        response = self.client.get(reverse('rooms:room-list'))
+
+        timing = self.get_timing(response)
+        self.assertEqual(set(timing), {'total', 'db', 'template', 'cache'})
+        self.assertRegex(timing['db'], r'dur=[\d.]+;desc="\d+ queries"')
+
+    def test_middleware_counts_db_queries(self):
+        self.client.force_login(create_test_user())
+
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('bookings:booking-list'))
+
+        self.assertIn('desc="3 queries"', response['Server-Timing'])
+
+    def test_middleware_counts_cache_hits_and_misses(self):
+        user = create_test_user()
+        create_test_booking(user)
+        self.client.force_login(user)
+
+        first = self.client.get(reverse('bookings:booking-list'))
+        second = self.client.get(reverse('bookings:booking-list'))
+
+        self.assertIn('desc="0 hits / 3 misses"', first['Server-Timing'])
+        self.assertIn('desc="3 hits / 0 misses"', second['Server-Timing'])
+
+    def test_middleware_logs_metrics(self):
+        with self.assertLogs('performance', 'INFO') as logs:
+            self.client.get(reverse('home'))
+
+        metrics = logs.records[0].metrics
+        self.assertEqual(metrics['view'], 'home')
+        self.assertEqual(metrics['status'], 200)
+        self.assertGreater(metrics['total_ms'], 0)
+
+    def test_middleware_records_streaming_response_after_body_is_sent(self):
+        create_test_room()
+        check_in = timezone.now().date() + timedelta(days=1)
+        query = {'check_in': check_in, 'check_out': check_in + timedelta(days=1)}
+
+        response = self.client.get(reverse('api:availability'), query)
+
+        self.assertEqual(view_stats.summary(), [])
+        b''.join(response.streaming_content)
+        row = view_stats.summary()[0]
+        self.assertEqual(row['view'], 'api:availability')
+        self.assertEqual(row['count'], 1)
+        self.assertGreater(row['avg_queries'], 0)
+
+    def test_middleware_aggregates_stats_per_view(self):
+        self.client.get(reverse('home'))
+        self.client.get(reverse('home'))
+
+        stats = {row['view']: row for row in view_stats.summary()}
+        self.assertEqual(stats['home']['count'], 2)
+
+    def test_middleware_aggregates_requests_without_view(self):
+        self.client.get(reverse('home'))
+        self.client.get('/unknown/')
+
+        stats = {row['view']: row for row in view_stats.summary()}
+        self.assertEqual(stats[None]['count'], 1)
+        self.assertEqual(stats['home']['count'], 1)
+
+    @override_settings(PERFORMANCE_MIDDLEWARE=False)
+    def test_middleware_is_not_used_when_disabled(self):
+        self.client = self.client_class()
+
+        response = self.client.get(reverse('home'))
+
+        self.assertFalse(response.has_header('Server-Timing'))
+
+
+class ViewStatsTest(TestCase):
+    def create_metrics(self, total, queries=0):
+        metrics = RequestMetrics()
+        metrics.total, metrics.db_queries = total, queries
+        return metrics
+
+    def test_summary_returns_percentiles(self):
+        stats = ViewStats()
+        for total in range(1, 101):
+            stats.add('home', self.create_metrics(total / 1000, queries=2))
+
+        row = stats.summary()[0]
+
+        self.assertEqual(row['count'], 100)
+        self.assertAlmostEqual(row['p50_ms'], 51)
+        self.assertAlmostEqual(row['p95_ms'], 96)
+        self.assertEqual(row['avg_queries'], 2)
+
+    def test_stats_keep_only_last_requests(self):
+        stats = ViewStats(size=10)
+        for total in range(20):
+            stats.add('home', self.create_metrics(total))
+
+        self.assertEqual(stats.summary()[0]['count'], 10)
+
+
+class MetricsFormatterTest(TestCase):
+    def test_formatter_appends_metrics_as_json(self):
+        record = logging.makeLogRecord({'msg': 'GET / 200', 'metrics': {'view': 'home', 'db_queries': 2}})
+
+        message = MetricsFormatter().format(record)
+
+        self.assertEqual(message, 'GET / 200 ' + json.dumps({'db_queries': 2, 'view': 'home'}))
+
+    def test_formatter_keeps_records_without_metrics(self):
+        self.assertEqual(MetricsFormatter().format(logging.makeLogRecord({'msg': 'message'})), 'message')
+
+
+class PerformanceViewTest(TestCase):
+    def setUp(self) -> None:
+        view_stats.clear()
+        self.url = reverse('performance')
+
+    def test_view_redirects_anonymous_user_to_login(self):
+        response = self.client.get(self.url)
+
+        self.assertRedirects(
+            response, f'{reverse("accounts:user-login")}?next={self.url}', fetch_redirect_response=False
+        )
+
+    def test_view_is_forbidden_for_non_staff_user(self):
+        self.client.force_login(create_test_user())
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_view_shows_requests_without_view(self):
+        view_stats.add(None, RequestMetrics())
+        view_stats.add('home', RequestMetrics())
+        self.client.force_login(create_test_user(is_staff=True))
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, '<td>-</td>', html=True)
+
+    def test_view_shows_stats_to_staff(self):
+        view_stats.add('rooms:room-list', RequestMetrics())
+        self.client.force_login(create_test_user(is_staff=True))
+
+        response = self.client.get(self.url)
+
+        self.assertTemplateUsed(response, 'performance.html')
+        self.assertContains(response, 'rooms:room-list')
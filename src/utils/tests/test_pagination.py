@@ -0,0 +1,71 @@
+from django.contrib.auth import get_user_model
+from django.core.paginator import InvalidPage
+from django.test import TestCase
+from django.utils import timezone
+
+from accounts.tests import create_test_user
+from utils.pagination import KeysetPaginator
+
+User = get_user_model()
+
+
+class KeysetPaginatorTest(TestCase):
+    def setUp(self) -> None:
+        for number in range(5):
+            create_test_user(f'user{number}@test.com')
+        self.paginator = KeysetPaginator(User.objects.all(), 2, ordering=('-joined', '-pk'))
+
+    def get_all_pages(self):
+        pages, cursor = [], None
+        while True:
+            page = self.paginator.get_page(cursor)
+            pages.append([user.email for user in page])
+            if not page.has_next:
+                return pages
+            cursor = page.next_cursor
+
+    def test_paginator_walks_all_objects_in_order(self):
+        expected_emails = list(User.objects.order_by('-joined', '-pk').values_list('email', flat=True))
+
+        pages = self.get_all_pages()
+
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        self.assertEqual(sum(pages, []), expected_emails)
+
+    def test_paginator_breaks_ties_by_last_ordering_field(self):
+        User.objects.update(joined=timezone.now())
+        expected_emails = list(User.objects.order_by('-pk').values_list('email', flat=True))
+
+        self.assertEqual(sum(self.get_all_pages(), []), expected_emails)
+
+    def test_paginator_walks_back_to_first_page(self):
+        pages = [self.paginator.get_page()]
+        pages.append(self.paginator.get_page(pages[-1].next_cursor))
+        pages.append(self.paginator.get_page(pages[-1].next_cursor))
+
+        second_page = self.paginator.get_page(before=pages[2].previous_cursor)
+        first_page = self.paginator.get_page(before=second_page.previous_cursor)
+
+        self.assertEqual(list(second_page), list(pages[1]))
+        self.assertEqual(list(first_page), list(pages[0]))
+        self.assertFalse(first_page.has_previous)
+        self.assertEqual(first_page.next_cursor, pages[0].next_cursor)
+
+    def test_first_page_has_no_previous_cursor(self):
+        page = self.paginator.get_page()
+
+        self.assertFalse(page.has_previous)
+        self.assertTrue(self.paginator.get_page(page.next_cursor).has_previous)
+
+    def test_last_page_has_no_next_cursor(self):
+        paginator = KeysetPaginator(User.objects.all(), 5, ordering=('-joined', '-pk'))
+        page = paginator.get_page()
+
+        self.assertEqual(len(page), 5)
+        self.assertFalse(page.has_next)
+        self.assertIsNone(page.next_cursor)
+
+    def test_paginator_raises_error_if_cursor_is_invalid(self):
+        for cursor in ['invalid', 'W10=', 'WyJ4IiwgInkiXQ==']:
+            with self.assertRaises(InvalidPage):
+                self.paginator.get_page(cursor)
@@ -0,0 +1,114 @@
+from datetime import timedelta
+
+from django.contrib.auth.tokens import default_token_generator
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from django.utils import timezone
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+
+from accounts.tests import create_test_user
+from bookings.tests.test_models import create_test_booking
+from rooms.tests.test_models import create_test_room, create_test_room_data
+from utils.cases import QueryBudgetTestCase
+from utils.cases.query_budget_test_case import load_query_budgets
+
+
+def get_route_names(patterns=None, namespace=None):
+    names = []
+    for pattern in get_resolver().url_patterns if patterns is None else patterns:
+        if isinstance(pattern, URLResolver):
+            if pattern.namespace == 'admin':
+                names.append('admin:index')
+            else:
+                names += get_route_names(pattern.url_patterns, pattern.namespace)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            names.append(f'{namespace}:{pattern.name}' if namespace else pattern.name)
+    return names
+
+
+class ViewQueryBudgetTest(QueryBudgetTestCase):
+    def setUp(self) -> None:
+        self.seeded = 0
+        self.user = create_test_user()
+        self.user.profile.first_name = 'Rick'
+        self.user.profile.last_name = 'Sanchez'
+        self.user.profile.birthday = '1950-01-01'
+        self.user.profile.telephone = '+380123456789'
+        self.user.profile.save()
+        self.staff = create_test_user(email='staff@test.com', is_staff=True, is_superuser=True)
+        self.check_in = timezone.now().date() + timedelta(days=1)
+
+    def seed(self, count):
+        for _ in range(count):
+            self.seeded += 1
+            room = create_test_room(create_test_room_data(single_beds=2), number=str(self.seeded))
+            booking = create_test_booking(self.user, persons=1)
+            booking.rooms.add(room)
+
+    def get(self, name, user=None, data=None, **kwargs):
+        url = reverse(name, kwargs=kwargs)
+
+        def prepare():
+            self.client.logout()
+            if user is not None:
+                self.client.force_login(user)
+
+        self.assertWithinBudget(name, lambda: self.client.get(url, data), prepare)
+
+    def test_every_route_has_budget(self):
+        if self.record:
+            self.skipTest('Budgets are being recorded.')
+        self.assertEqual(sorted(get_route_names()), sorted(load_query_budgets()))
+
+    def test_admin_index(self):
+        self.get('admin:index', self.staff)
+
+    def test_home(self):
+        self.get('home')
+
+    def test_performance(self):
+        self.get('performance', self.staff)
+
+    def test_user_register(self):
+        self.get('accounts:user-register')
+
+    def test_user_register_success(self):
+        self.get('accounts:user-register-success')
+
+    def test_user_register_continue(self):
+        self.get('accounts:user-register-continue', self.user)
+
+    def test_user_confirm_email(self):
+        uidb64 = urlsafe_base64_encode(force_bytes(self.user.pk))
+        token = default_token_generator.make_token(self.user)
+
+        self.get('accounts:user-confirm-email', uidb64=uidb64, token=token)
+
+    def test_user_confirm_email_success(self):
+        self.get('accounts:user-confirm-email-success')
+
+    def test_user_confirm_email_failure(self):
+        self.get('accounts:user-confirm-email-failure')
+
+    def test_user_login(self):
+        self.get('accounts:user-login')
+
+    def test_user_logout(self):
+        self.get('accounts:user-logout', self.user)
+
+    def test_user_account(self):
+        self.get('accounts:user-account', self.user)
+
+    def test_room_list(self):
+        self.get('rooms:room-list')
+
+    def test_booking_create(self):
+        data = {'check_in': self.check_in, 'check_out': self.check_in + timedelta(days=3), 'persons': 1}
+        self.get('bookings:booking-create', self.user, data)
+
+    def test_booking_list(self):
+        self.get('bookings:booking-list', self.user)
+
+    def test_availability(self):
+        data = {'check_in': self.check_in, 'check_out': self.check_in + timedelta(days=3)}
+        self.get('api:availability', data=data)
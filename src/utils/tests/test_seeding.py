@@ -0,0 +1,91 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db.models import Count
+from django.test import TestCase
+from django.utils import timezone
+
+from accounts.models import Profile
+from bookings.models import Booking
+from rooms.models import Room, RoomData
+from utils.seeding import SEED_PASSWORD, seed_hotel
+
+User = get_user_model()
+
+
+class SeedHotelTest(TestCase):
+    def test_seed_hotel_creates_rows(self):
+        result = seed_hotel(rooms=20, users=10, bookings=50, seed=1)
+
+        self.assertEqual(result, (2, 20, 10, 50, 0))
+        self.assertEqual(RoomData.objects.count(), 2)
+        self.assertEqual(Room.objects.count(), 20)
+        self.assertEqual(User.objects.count(), 10)
+        self.assertEqual(Profile.objects.count(), 10)
+        self.assertEqual(Booking.objects.count(), 50)
+
+    def test_seeded_users_can_log_in(self):
+        seed_hotel(rooms=0, users=1, bookings=0, seed=1)
+
+        self.assertTrue(User.objects.get().check_password(SEED_PASSWORD))
+
+    def test_seeded_bookings_overlap(self):
+        seed_hotel(rooms=10, users=10, bookings=200, days=30, seed=1)
+
+        busiest = Booking.objects.values('check_in').annotate(count=Count('pk')).order_by('-count').first()
+        self.assertGreater(busiest['count'], 1)
+        self.assertFalse(Booking.objects.filter(check_in__lte=timezone.now().date()).exists())
+
+    def test_seed_hotel_is_repeatable_with_seed(self):
+        fields = ['check_in', 'check_out', 'persons', 'type', 'is_paid']
+
+        seed_hotel(rooms=0, users=5, bookings=20, seed=7)
+        first = list(Booking.objects.order_by(*fields).values_list(*fields))
+        Booking.objects.all().delete()
+        seed_hotel(rooms=0, users=5, bookings=20, seed=7)
+        second = list(Booking.objects.order_by(*fields).values_list(*fields))
+
+        self.assertEqual(first, second)
+
+    def test_seed_hotel_appends_to_existing_data(self):
+        seed_hotel(rooms=10, users=5, bookings=0, seed=1)
+        seed_hotel(rooms=10, users=5, bookings=0, seed=1)
+
+        self.assertEqual(Room.objects.count(), 20)
+        self.assertEqual(User.objects.count(), 10)
+
+    def test_seed_hotel_appends_after_deleted_rows(self):
+        seed_hotel(rooms=10, users=5, bookings=0, seed=1)
+        Room.objects.filter(number='S0').delete()
+        User.objects.filter(email='guest0@seed.test').delete()
+
+        seed_hotel(rooms=10, users=5, bookings=0, seed=1)
+
+        self.assertEqual(Room.objects.count(), 19)
+        self.assertEqual(User.objects.count(), 9)
+        self.assertTrue(Room.objects.filter(number='S19').exists())
+        self.assertTrue(User.objects.filter(email='guest9@seed.test').exists())
+
+    def test_seed_hotel_appends_after_deleted_room_types(self):
+        seed_hotel(rooms=30, users=0, bookings=0, room_types=3, seed=1)
+        Room.objects.filter(room_data__slug='seed-0').delete()
+        RoomData.objects.filter(slug='seed-0').delete()
+
+        seed_hotel(rooms=30, users=0, bookings=0, room_types=3, seed=1)
+
+        self.assertEqual(RoomData.objects.count(), 5)
+        self.assertTrue(RoomData.objects.filter(slug='seed-5').exists())
+
+    def test_seed_hotel_allocates_rooms(self):
+        result = seed_hotel(rooms=50, users=5, bookings=20, allocate=True, seed=1)
+
+        self.assertGreater(result.assigned, 0)
+        self.assertEqual(Booking.objects.filter(rooms__isnull=False).distinct().count(), result.assigned)
+
+    def test_command_reports_created_rows(self):
+        stdout = StringIO()
+
+        call_command('seed_hotel', '--rooms=10', '--users=2', '--bookings=5', '--seed=1', stdout=stdout)
+
+        self.assertIn('Created 10 rooms of 1 room types, 2 users and 5 bookings (0 with rooms)', stdout.getvalue())
@@ -0,0 +1,44 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+from django.template import engines
+from django.test import SimpleTestCase
+
+from utils.warmup import get_template_names, warm_templates, warm_urls
+
+
+class WarmTemplatesTest(SimpleTestCase):
+    def setUp(self) -> None:
+        self.loader = engines['django'].engine.template_loaders[0]
+        self.loader.reset()
+
+    def test_get_template_names_lists_templates_of_apps(self):
+        names = get_template_names(['bookings', 'utils'])
+
+        self.assertIn('bookings/card.html', names)
+        self.assertIn('base.html', names)
+        self.assertNotIn('accounts/login_form.html', names)
+
+    def test_warm_templates_fills_cached_loader(self):
+        names = warm_templates(['bookings'])
+
+        with patch.object(self.loader.loaders[1], 'get_template') as get_template:
+            for name in names:
+                self.loader.get_template(name)
+
+        get_template.assert_not_called()
+
+    def test_command_reports_compiled_templates(self):
+        stdout = StringIO()
+
+        call_command('warm_templates', 'rooms', stdout=stdout)
+
+        self.assertIn(f'Compiled {len(get_template_names(["rooms"]))} templates', stdout.getvalue())
+
+    def test_command_fails_for_unknown_app(self):
+        with self.assertRaises(CommandError):
+            call_command('warm_templates', 'unknown', stdout=StringIO())
+
+    def test_warm_urls_populates_resolver(self):
+        self.assertGreater(warm_urls(), 0)
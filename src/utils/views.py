@@ -0,0 +1,16 @@
+from django.contrib.auth import mixins
+from django.views import generic
+
+from utils.performance import view_stats
+
+
+class PerformanceView(mixins.UserPassesTestMixin, generic.TemplateView):
+    template_name = 'performance.html'
+
+    def test_func(self):
+        return self.request.user.is_staff
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['stats'] = view_stats.summary()
+        return context
@@ -0,0 +1,34 @@
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.template import loader
+from django.urls import get_resolver
+
+
+def get_template_names(app_labels=None):
+    if app_labels is None:
+        app_labels = settings.WARM_TEMPLATES_APPS
+
+    names = []
+    for app_label in app_labels:
+        directory = Path(apps.get_app_config(app_label).path) / 'templates'
+        names += sorted(
+            path.relative_to(directory).as_posix()
+            for path in directory.rglob('*')
+            if path.is_file() and not path.name.startswith('.')
+        )
+    return names
+
+
+def warm_templates(app_labels=None):
+    names = get_template_names(app_labels)
+    for name in names:
+        loader.get_template(name)
+    return names
+
+
+def warm_urls():
+    resolver = get_resolver()
+    resolver.check()
+    return len(resolver.reverse_dict)